@@ -3,6 +3,9 @@ import pandas as pd
 import plotly.express as px
 from data.openbb_client import get_client
 from ui.components.metrics import render_kpi_card  # Falls du das ausgelagert hast, sonst nutzen wir st.metric
+from ui.components.sidebar import render_provider_status
+from utils.tracing import page_trace
+from config import DASHBOARD_CARDS
 
 # --- CONFIG ---
 st.set_page_config(
@@ -11,6 +14,7 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
+page_trace("Dashboard")
 
 # Custom CSS für Dashboard-Cards
 st.markdown("""
@@ -43,19 +47,16 @@ st.divider()
 st.subheader("🌍 Markt Stimmung")
 
 # Wir simulieren Indizes durch ETFs (da wir Realtime-Daten brauchen)
-indices = [
-    {"symbol": "SPY", "name": "S&P 500"},
-    {"symbol": "QQQ", "name": "Nasdaq 100"},
-    {"symbol": "DIA", "name": "Dow Jones"},
-    {"symbol": "BTC-USD", "name": "Bitcoin"},
-]
+# Liste liegt in config.py, damit der Cache-Warmer dieselben Symbole vorlädt
+indices = [{"symbol": symbol, "name": name} for symbol, name in DASHBOARD_CARDS.items()]
 
 cols = st.columns(len(indices))
 
-# Daten laden und anzeigen
+# Daten laden und anzeigen (alle Quotes parallel)
+index_quotes = client.get_quotes([idx["symbol"] for idx in indices], lite=True)
 for col, idx in zip(cols, indices):
     with col:
-        q = client.get_quote(idx["symbol"])
+        q = index_quotes.get(idx["symbol"])
         if q:
             st.metric(
                 label=idx["name"],
@@ -77,12 +78,11 @@ with col_trend:
     watchlist_tickers = ["NVDA", "AAPL", "MSFT", "TSLA", "AMD", "GOOGL", "AMZN"]
     
     watchlist_data = []
-    # Progress Bar für das Laden der Watchlist, damit es nicht "hängt"
-    progress_text = "Lade Kurse..."
-    my_bar = st.progress(0, text=progress_text)
-    
-    for i, t in enumerate(watchlist_tickers):
-        q = client.get_quote(t)
+    # Alle Kurse parallel laden – dauert so lange wie der langsamste Einzel-Quote
+    with st.spinner("Lade Kurse..."):
+        watchlist_quotes = client.get_quotes(watchlist_tickers, lite=True)
+
+    for t, q in watchlist_quotes.items():
         if q:
             watchlist_data.append({
                 "Symbol": t,
@@ -90,9 +90,6 @@ with col_trend:
                 "Änderung %": q.get("change_pct"), # Rohdaten für Farbe
                 "Volumen": q.get("volume")
             })
-        my_bar.progress((i + 1) / len(watchlist_tickers), text=progress_text)
-    
-    my_bar.empty() # Balken entfernen wenn fertig
 
     if watchlist_data:
         df_watch = pd.DataFrame(watchlist_data)
@@ -141,4 +138,7 @@ with col_nav:
 
 # --- FOOTER ---
 st.divider()
-st.caption("AI Analyst v2.0 - Powered by OpenBB & Streamlit")
\ No newline at end of file
+st.caption("AI Analyst v2.0 - Powered by OpenBB & Streamlit")
+
+# Ausgefallene / gedrosselte Provider (nach allen Abfragen dieses Laufs)
+render_provider_status()
@@ -41,6 +41,7 @@ DEFAULT_TIMEFRAME = "1d"
 DEFAULT_PERIOD = "1y"
 
 # Verfügbare Timeframes
+# (1wk/1mo werden aus Tageskerzen, 4h aus Stundenkerzen lokal gebildet – siehe data/bars.py)
 TIMEFRAMES = {
     "1m":  {"label": "1 Minute",   "interval": "1m",  "period": "7d"},
     "5m":  {"label": "5 Minuten",  "interval": "5m",  "period": "60d"},
@@ -54,6 +55,74 @@ TIMEFRAMES = {
 
 # Provider Priorität (erster verfügbarer wird genutzt)
 PROVIDER_PRIORITY = ["yfinance", "fmp", "alpha_vantage"]
+PROVIDER_PRIORITY_OVERRIDES = {     # Abweichende Reihenfolge pro Dataset
+    "financials": ["fmp", "yfinance"],
+}
+
+# Hedged Requests (data/providers.py): antwortet der Anbieter nicht innerhalb seines
+# Latenz-Perzentils, startet der nächste parallel – die erste Antwort gewinnt
+HEDGE_PERCENTILE    = 0.95
+HEDGE_MIN_DELAY     = 0.25      # Sekunden – nie früher hedgen
+HEDGE_DEFAULT_DELAY = 1.5       # Sekunden – solange zu wenige Messungen vorliegen
+HEDGE_MIN_SAMPLES   = 20
+ROUTER_MAX_WORKERS  = 8
+
+# Rate Limits pro Provider (Token Bucket, data/rate_limiter.py)
+RATE_LIMITS = {                 # rate = Requests/Sekunde, burst = max. Spitze
+    "yahoo_search": {"rate": 2.0, "burst": 5},
+    "yahoo_rss":    {"rate": 2.0, "burst": 5},
+    "yfinance":     {"rate": 4.0, "burst": 8},
+    "fmp":          {"rate": 2.0, "burst": 4},
+    "alpha_vantage": {"rate": 0.08, "burst": 5},   # Free-Plan: 5 Requests/Minute
+}
+RATE_LIMIT_HOSTS = {            # HTTP-Host -> Provider (yfinance wird im Client begrenzt)
+    "query2.finance.yahoo.com":  "yahoo_search",
+    "feeds.finance.yahoo.com":   "yahoo_rss",
+    "financialmodelingprep.com": "fmp",
+    "www.alphavantage.co":       "alpha_vantage",
+}
+RATE_LIMIT_MAX_WAIT = 15        # Sekunden – länger wartet kein Aufrufer auf einen Token
+RATE_LIMIT_BACKOFF  = 0.5       # Rate-Faktor pro 429
+RATE_LIMIT_RECOVERY = 0.05      # Anteil der Basis-Rate, den jede erfolgreiche Antwort zurückgibt
+RATE_LIMIT_MIN_RATE = 0.2       # Untergrenze in Requests/Sekunde
+
+# Circuit Breaker pro Provider (data/circuit_breaker.py, gleiche Namen wie RATE_LIMITS)
+CIRCUIT_FAILURE_THRESHOLD = 3   # Ausfälle in Folge, bis der Provider übersprungen wird
+CIRCUIT_COOLDOWN          = 60  # Sekunden bis zum nächsten Probe-Aufruf
+
+# Parallele Abfragen (z.B. get_quotes für Watchlists)
+FETCH_MAX_WORKERS = 8     # Max. gleichzeitige Provider-Requests pro Prozess
+FETCH_DEADLINE    = 10    # Sekunden pro Bulk-Aufruf, danach leere Ergebnisse
+REFRESH_MAX_WORKERS = 4   # Hintergrund-Refreshes (Stale-While-Revalidate)
+
+# Cache-Warm-up beim Prozessstart (data/cache_warmer.py)
+WARMUP_ENABLED = os.getenv("OPENBB_WARMUP", "1") != "0"
+WARMUP_MAX_WORKERS = 4          # eigener Pool – der Vordergrund-Pool bleibt frei
+WARMUP_HISTORY_PERIOD = "1y"    # kürzere Zeiträume schneidet der Client aus dem OHLCV-Store
+
+# Hintergrund-Refresh populärer Keys (data/refresh_scheduler.py)
+HOT_REFRESH_ENABLED = os.getenv("OPENBB_HOT_REFRESH", "1") != "0"
+HOT_REFRESH_NAMESPACES = ("get_quote", "get_price_snapshot", "get_price_history")
+HOT_REFRESH_TOP_N = 50          # so viele Keys werden höchstens frisch gehalten
+HOT_REFRESH_MIN_SCORE = 3.0     # darunter (gewichtete Zugriffe) läuft ein Key einfach ab
+HOT_REFRESH_INTERVAL = 5        # Sekunden zwischen zwei Runden
+HOT_REFRESH_LEAD = 0.2          # Refresh, sobald weniger als 20% der TTL übrig sind
+HOT_REFRESH_MAX_PER_TICK = 8    # Refreshes pro Runde – bleibt deutlich unter den Rate Limits
+POPULARITY_HALF_LIFE = 900      # Sekunden, nach denen ein Zugriff nur noch halb zählt
+POPULARITY_MAX_KEYS = 5000
+
+# HTTP-Session (data/http_session.py)
+HTTP_TIMEOUT = (3.05, 10)   # (Connect, Read) in Sekunden
+HTTP_RETRIES = 2            # Wiederholungen bei 5xx / Verbindungsfehlern
+HTTP_BACKOFF = 0.3          # Backoff-Faktor + max. Jitter in Sekunden
+HTTP_DEFAULT_POOL_SIZE = 4  # Keep-Alive-Verbindungen pro unbekanntem Host
+HTTP_POOL_SIZES = {         # Keep-Alive-Verbindungen pro Provider-Host
+    "query2.finance.yahoo.com":  10,
+    "feeds.finance.yahoo.com":   10,
+    "financialmodelingprep.com": 4,
+}
+HTTP_ASYNC_MAX_CONNECTIONS = 100  # Gleichzeitige Requests pro Event-Loop (AsyncOpenBBClient)
+ASYNC_RUN_TIMEOUT = 30            # Sekunden, die run_sync ein Streamlit-Skript höchstens blockiert
 
 # Cache-Dauer in Sekunden
 CACHE_TTL = {
@@ -64,6 +133,35 @@ CACHE_TTL = {
     "macro":         3600,   # 1 Std - Makrodaten
 }
 
+# Ablauf-Streuung im Client-Cache
+CACHE_TTL_JITTER = 0.1          # TTL wird zufällig um bis zu 10% verkürzt
+CACHE_FALLBACK_TTL = 60         # Max. TTL für Ersatz-Ergebnisse (Provider gesperrt/gedrosselt, Fallback lieferte)
+CACHE_EARLY_EXPIRY_BETA = 1.0   # XFetch-Faktor: > 1 = früher neu laden
+
+# In-Process-Cache des Clients (BoundedLRUCache, Budgets in MB)
+MEMORY_CACHE_MAX_MB = 256
+MEMORY_CACHE_NAMESPACE_MB = {       # Namespace = Name der gecachten Client-Methode
+    "get_price_history": 160,
+    "get_financials":    32,
+    "get_news":          16,
+}
+
+# Lokaler Symbol-Index für die Ticker-Suche (data/symbol_index.py)
+SYMBOL_INDEX_PATH = CACHE_DIR / "symbols.json"   # bisherige Suchergebnisse
+SYMBOL_SEARCH_MIN_HITS = 3      # Weniger lokale Treffer -> Yahoo-Suche im Hintergrund
+SYMBOL_SEARCH_WAIT = 1.0        # Sekunden, die ohne jeden lokalen Treffer auf Yahoo gewartet wird
+
+# Record/Replay der Provider-Antworten (data/replay.py): "record", "replay" oder leer = live
+REPLAY_MODE = os.getenv("OPENBB_REPLAY", "").lower()
+REPLAY_DIR = Path(os.getenv("OPENBB_REPLAY_DIR", str(CACHE_DIR / "replay")))
+REPLAY_LATENCY = float(os.environ["OPENBB_REPLAY_LATENCY"]) if os.getenv("OPENBB_REPLAY_LATENCY") else None  # None = aufgezeichnete Latenz
+REPLAY_LATENCY_SCALE = float(os.getenv("OPENBB_REPLAY_LATENCY_SCALE", "1.0"))
+
+# Tracing der Reruns (utils/tracing.py): Spans für Provider, Indikatoren, Charts
+TRACE_ENABLED = os.getenv("OPENBB_TRACE", "1") != "0"
+TRACE_KEEP = 20                 # letzte Traces für die Diagnose-Seite
+TRACE_MAX_SPANS = 5000          # pro Trace – große Fan-outs werden abgeschnitten
+
 # ─────────────────────────────────────────────
 # TECHNISCHE INDIKATOREN - DEFAULTS
 # ─────────────────────────────────────────────
@@ -160,6 +258,14 @@ MARKET_INDICES = {
     "^FTSE":  "FTSE 100",
 }
 
+# Karten oben auf dem Dashboard (app.py)
+DASHBOARD_CARDS = {
+    "SPY":     "S&P 500",
+    "QQQ":     "Nasdaq 100",
+    "DIA":     "Dow Jones",
+    "BTC-USD": "Bitcoin",
+}
+
 # Sektor-ETFs für Sektor-Übersicht
 SECTOR_ETFS = {
     "Technology":             "XLK",
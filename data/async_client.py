@@ -0,0 +1,188 @@
+"""
+data/async_client.py - asyncio-Variante des OpenBB Clients
+
+Coroutinen für get_quote, get_price_history, get_news, search_ticker und
+get_financials. Yahoo Suche und Yahoo RSS laufen über async_http_get ohne
+Thread pro Request; yfinance hat keine async-API, und Quote/Financials gehen
+wie im sync Client über den ProviderRouter – beides im gemeinsamen Fetch-Pool.
+
+Der Cache (async_cached) teilt Keys und Ebenen mit dem sync Client: was eine
+Seite synchron geladen hat, ist hier ein Treffer und umgekehrt.
+
+Streamlit-Skripte haben keinen laufenden Event-Loop – run_sync führt eine
+Coroutine auf einem langlebigen Hintergrund-Loop aus (eine AsyncSession und
+Single-Flight über alle Sessions hinweg) und wartet höchstens ASYNC_RUN_TIMEOUT
+Sekunden. Beim Prozessende wird die AsyncSession geschlossen und der Loop gestoppt.
+
+Verwendung:
+    from data.async_client import get_async_client, run_sync
+
+    ac = get_async_client()
+    quote, news = run_sync(ac.get_quote("AAPL"), ac.get_news("AAPL", limit=5))
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import threading
+from functools import partial
+from typing import Optional
+
+import pandas as pd
+from loguru import logger
+
+from config import SYMBOL_SEARCH_MIN_HITS, SYMBOL_SEARCH_WAIT, ASYNC_RUN_TIMEOUT
+from data.cache_manager import TTL, STALE_TTL, get_cache
+from data.http_session import async_http_get, close_async_session
+from data.symbol_index import get_symbol_index
+from data.openbb_client import (
+    OpenBBClient, get_client, async_cached, _fetch_pool, SEARCH_URL, NEWS_RSS_URL,
+    _feed_key, _conditional_headers, _feed_content,
+)
+
+# Referenzen auf Hintergrund-Suchen, sonst räumt der GC sie vor dem Ende ab
+_search_tasks: set = set()
+
+
+class AsyncOpenBBClient:
+    def __init__(self, client: Optional[OpenBBClient] = None):
+        self.client = client or get_client()
+
+    async def run(self, func, *args, **kwargs):
+        """Blockierenden Aufruf (yfinance, Services) im gemeinsamen Fetch-Pool ausführen."""
+        # Kontext mitgeben, damit Drosselungen im Worker im throttle_scope des Aufrufers landen
+        ctx = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(_fetch_pool, ctx.run, partial(func, *args, **kwargs))
+
+    async def search_ticker(self, query: str) -> list:
+        """Lokaler Symbol-Index; Yahoo-Suche wie im sync Client nur als Anreicherung."""
+        if not query: return []
+        index = get_symbol_index()
+        hits = index.search(query)
+        if len(hits) < SYMBOL_SEARCH_MIN_HITS:
+            task = self._enrich_symbols(query)
+            if not hits and task is not None:
+                await asyncio.wait([task], timeout=SYMBOL_SEARCH_WAIT)
+                hits = index.search(query)
+        return hits
+
+    def _enrich_symbols(self, query: str) -> Optional[asyncio.Task]:
+        """Yahoo-Suche als Hintergrund-Task; None, wenn die Query schon gecacht ist."""
+        query = query.strip().lower()
+        if self.search_remote.peek(self, query) is not None:
+            return None     # schon angefragt, Ergebnisse sind im Index
+        task = asyncio.ensure_future(self.search_remote(query))
+        _search_tasks.add(task)
+        task.add_done_callback(_search_tasks.discard)
+        return task
+
+    @async_cached(ttl_seconds=TTL["search"])
+    async def search_remote(self, query: str) -> list:
+        try:
+            resp = await async_http_get(SEARCH_URL, params={"q": query, "quotesCount": 10}, timeout=4)
+            results = OpenBBClient._parse_search(resp.json())
+        except Exception as e:
+            logger.error(f"Search Error: {e}")
+            return []
+        get_symbol_index().add(results)
+        return results
+
+    @async_cached(ttl_seconds=TTL["price_history"], stale_ttl=STALE_TTL["price_history"])
+    async def get_price_history(self, ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+        # Ungecachte sync-Methode – gecacht wird hier, unter demselben Key
+        return await self.run(self.client.get_price_history.__wrapped__, self.client, ticker, period, interval)
+
+    @async_cached(ttl_seconds=TTL["quote"], stale_ttl=STALE_TTL["quote"])
+    async def get_quote(self, ticker: str) -> dict:
+        return await self.run(self.client.get_quote.__wrapped__, self.client, ticker)
+
+    async def get_quotes(self, tickers: list) -> dict:
+        """Mehrere Quotes gleichzeitig: {ticker: quote}."""
+        tickers = list(dict.fromkeys(tickers))
+        quotes = await asyncio.gather(*(self.get_quote(t) for t in tickers))
+        return {t: q or {} for t, q in zip(tickers, quotes)}
+
+    @async_cached(ttl_seconds=TTL["news"])
+    async def get_news(self, ticker: str, limit: int = 10) -> list:
+        news_items = []
+        try:
+            url = NEWS_RSS_URL.format(ticker=ticker)
+            saved = get_cache().get(_feed_key(url))
+            resp = await async_http_get(url, timeout=5, headers=_conditional_headers(saved))
+            content = _feed_content(url, resp, saved)
+            if content:
+                news_items = OpenBBClient._parse_rss(content, limit)
+        except Exception as e:
+            logger.error(f"RSS News Error: {e}")
+
+        if not news_items:
+            news_items = await self.run(OpenBBClient._yf_news, ticker, limit)
+        return news_items
+
+    @async_cached(ttl_seconds=TTL["financials"])
+    async def get_financials(self, ticker: str) -> dict:
+        # Über den Router (Priorität + Hedging), wie im sync Client
+        return await self.run(self.client.get_financials.__wrapped__, self.client, ticker)
+
+
+# ─────────────────────────────────────────────
+# EVENT-LOOP FÜR SYNC-AUFRUFER (Streamlit)
+# ─────────────────────────────────────────────
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="openbb-async", daemon=True).start()
+    return _loop
+
+def run_sync(*coros, timeout: Optional[float] = ASYNC_RUN_TIMEOUT):
+    """
+    Führt Coroutinen auf dem Hintergrund-Loop aus und wartet auf das Ergebnis.
+    Eine Coroutine -> ihr Ergebnis, mehrere -> Liste der Ergebnisse (asyncio.gather).
+    Nach `timeout` Sekunden wird abgebrochen und TimeoutError geworfen.
+    """
+    async def gather():
+        return await asyncio.gather(*coros)
+
+    main = coros[0] if len(coros) == 1 else gather()
+    future = asyncio.run_coroutine_threadsafe(main, _get_loop())
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        logger.warning(f"run_sync: nach {timeout}s abgebrochen")
+        raise TimeoutError(f"Async-Aufruf nach {timeout}s abgebrochen")
+
+@atexit.register
+def _shutdown_loop():
+    """AsyncSession des Hintergrund-Loops schließen und den Loop stoppen."""
+    global _loop
+    with _loop_lock:
+        loop, _loop = _loop, None
+    if loop is None or not loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(close_async_session(), loop).result(5)
+    except Exception as e:
+        logger.warning(f"AsyncSession nicht sauber geschlossen: {e}")
+    loop.call_soon_threadsafe(loop.stop)
+
+
+# ─────────────────────────────────────────────
+# SINGLETON
+# ─────────────────────────────────────────────
+
+_async_client_instance: Optional[AsyncOpenBBClient] = None
+
+def get_async_client() -> AsyncOpenBBClient:
+    """Gibt globale AsyncOpenBBClient-Instanz zurück."""
+    global _async_client_instance
+    if _async_client_instance is None:
+        _async_client_instance = AsyncOpenBBClient()
+    return _async_client_instance
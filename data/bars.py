@@ -0,0 +1,161 @@
+"""
+data/bars.py - Hilfsfunktionen für OHLCV-Kerzendaten
+
+Reine pandas-Funktionen ohne Netzwerk:
+- normalize_ohlcv:  yfinance-Frame -> Spalten open/high/low/close/volume
+- trim_to_period:   Frame auf einen yfinance-Zeitraum ("5d", "6mo", "1y", "ytd", "max") kürzen
+- period_start:     Startzeitpunkt eines Zeitraums, gemessen ab einer Kerze
+- period_days:      ungefähre Länge eines Zeitraums in Kalendertagen (zum Vergleichen)
+- merge_tail:       neue Kerzen an gecachte anhängen, Überlappung deduplizieren
+- resample_ohlcv:   gröbere Kerzen (1wk, 1mo, 4h) aus feineren bauen
+
+Verwendung:
+    merged = merge_tail(cached_df, tail_df)
+    if merged is None:   # Split/Dividende hat die adjustierten Preise verschoben
+        ...              # -> komplett neu laden
+"""
+
+from typing import Optional
+
+import pandas as pd
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# Einheitlicher Indexname – yfinance liefert je nach Intervall "Date" oder "Datetime",
+# und pd.concat verwirft den Namen, sobald die Teile sich unterscheiden
+INDEX_NAME = "date"
+
+# Max. relative Abweichung eines bereits abgeschlossenen Close, bevor wir von
+# einer rückwirkenden Adjustierung (Split/Dividende) ausgehen
+ADJUSTMENT_TOLERANCE = 1e-4
+
+# Intervalle, die lokal aus einem feineren Basis-Intervall gebaut werden statt
+# eigener Downloads (yfinance kennt "4h" ohnehin nicht)
+DERIVED_INTERVALS = {
+    "1wk": "1d",
+    "1mo": "1d",
+    "4h":  "1h",
+}
+
+# pandas-Regeln: Wochen beginnen montags, Monate am Monatsersten (wie bei yfinance)
+_RESAMPLE_RULES = {
+    "1wk": "W-MON",
+    "1mo": "MS",
+}
+
+
+def is_intraday(interval: str) -> bool:
+    """True für Minuten-/Stunden-Intervalle ("1m", "15m", "1h"), False für "1d", "1wk", "1mo"."""
+    return interval.endswith(("m", "h")) and not interval.endswith("mo")
+
+
+def normalize_ohlcv(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Spaltennamen klein, nur OHLCV, leere Zeilen raus, Index heißt immer "date"."""
+    if df is None or df.empty:
+        return pd.DataFrame()
+    df = df.copy()
+    df.columns = [str(c).lower() for c in df.columns]
+    return df[OHLCV_COLUMNS].dropna().rename_axis(INDEX_NAME)
+
+
+def period_days(period: str, last: Optional[pd.Timestamp] = None) -> float:
+    """
+    Ungefähre Länge eines yfinance-Zeitraums in Kalendertagen, nur zum Vergleichen
+    ("1y" deckt "6mo" ab). "max" ist unendlich, Unbekanntes 0.
+    "ytd" zählt die Tage seit dem 1.1. im Jahr von `last` (Default: heute) –
+    im Februar deckt ytd also kein "6mo" ab.
+    """
+    if period == "max":
+        return float("inf")
+    if period == "ytd":
+        last = pd.Timestamp.now() if last is None else pd.Timestamp(last)
+        return (last - period_start("ytd", last)).days + 1
+    try:
+        if period.endswith("mo"):
+            return int(period[:-2]) * 31
+        if period.endswith("y"):
+            return int(period[:-1]) * 366
+        if period.endswith("d"):
+            return int(period[:-1]) * 7 / 5   # Handelstage -> Kalendertage
+    except ValueError:
+        pass
+    return 0
+
+
+def period_start(period: str, last: pd.Timestamp) -> Optional[pd.Timestamp]:
+    """
+    Erster Zeitpunkt von `period`, gemessen ab `last`, für Kalender-Zeiträume
+    ("ytd", "Nmo", "Ny"). None für "max" und "Nd" (Handelstage hängen vom Index ab).
+    """
+    if period == "ytd":
+        return pd.Timestamp(year=last.year, month=1, day=1, tz=last.tz)
+    if period.endswith("mo"):
+        return last - pd.DateOffset(months=int(period[:-2]))
+    if period.endswith("y"):
+        return last - pd.DateOffset(years=int(period[:-1]))
+    return None
+
+
+def trim_to_period(df: pd.DataFrame, period: str) -> pd.DataFrame:
+    """
+    Kürzt einen Frame auf den yfinance-Zeitraum, gemessen ab der letzten Kerze.
+    "Nd" zählt Handelstage (wie yfinance), "Nmo"/"Ny" Kalendermonate/-jahre.
+    """
+    if df.empty or period == "max":
+        return df
+
+    last = df.index[-1]
+    if period == "ytd" or period.endswith(("mo", "y")):
+        cutoff = period_start(period, last)
+    elif period.endswith("d"):
+        days = df.index.normalize().unique()
+        cutoff = days[-int(period[:-1])] if len(days) >= int(period[:-1]) else days[0]
+    else:
+        return df
+    return df[df.index >= cutoff]
+
+
+def merge_tail(cached: pd.DataFrame, tail: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """
+    Hängt neu geladene Kerzen an gecachte an. Überlappende Kerzen kommen aus `tail`
+    (die letzte gecachte Kerze war evtl. noch nicht abgeschlossen).
+
+    Gibt None zurück, wenn sich ein abgeschlossener Close in der Überlappung
+    geändert hat – dann wurden die Preise rückwirkend adjustiert und der Cache
+    muss komplett neu geladen werden.
+    """
+    if tail.empty:
+        return cached
+
+    overlap = cached.index.intersection(tail.index)
+    # Die jüngste Kerze darf sich ändern (laufender Handelstag), alle älteren nicht
+    closed = overlap[overlap < cached.index[-1]]
+    if len(closed):
+        old = cached.loc[closed, "close"]
+        new = tail.loc[closed, "close"]
+        drift = ((new - old).abs() / old.abs().where(old != 0, 1)).max()
+        if drift > ADJUSTMENT_TOLERANCE:
+            return None
+
+    merged = pd.concat([cached, tail])
+    return merged[~merged.index.duplicated(keep="last")].sort_index().rename_axis(INDEX_NAME)
+
+
+def resample_ohlcv(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """
+    Baut gröbere Kerzen aus feineren: open = erster, high = max, low = min,
+    close = letzter Wert, volume = Summe. Zeitstempel ist der Beginn der Kerze.
+    "4h" wird ab der ersten Kerze des Handelstages gezählt.
+    """
+    if df.empty:
+        return df
+    agg = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+    if interval in _RESAMPLE_RULES:
+        out = df.resample(_RESAMPLE_RULES[interval], label="left", closed="left").agg(agg)
+    elif interval.endswith("h"):
+        # Handelsbeginn als Anker, sonst fallen 4h-Kerzen auf Mitternacht
+        offset = df.index[0] - df.index[0].normalize()
+        out = df.resample(interval, origin="start_day", offset=offset).agg(agg)
+    else:
+        raise ValueError(f"Intervall {interval} kann nicht lokal gebildet werden")
+    return out.dropna(subset=["close"]).rename_axis(INDEX_NAME)
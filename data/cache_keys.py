@@ -0,0 +1,115 @@
+"""
+data/cache_keys.py - Kanonische Cache-Keys für den Client-Cache
+
+Ein Aufruf wird vor dem Key-Bau an die Signatur gebunden (Defaults eingesetzt,
+positional/keyword egal, ohne `self`) und die Argumente normalisiert:
+- Ticker (Parameter ticker/tickers/symbol): getrimmt, Großbuchstaben
+- Zeiträume (period): Kleinbuchstaben, Aliase wie "12mo" -> "1y"
+- Intervalle (interval): Aliase wie "60m" -> "1h", "1w" -> "1wk"
+- Suchbegriffe (query): getrimmt, Kleinbuchstaben
+
+Die Methode selbst bekommt die normalisierten Argumente – "aapl" und "AAPL"
+liefern also auch dasselbe Ergebnis, nicht nur denselben Key.
+
+Der Key beginnt mit dem Namespace (Name der gecachten Methode), damit Statistik
+und Invalidierung pro Dataset funktionieren:
+
+    get_price_history:3f2a...     get_quote:91bc...
+"""
+
+import hashlib
+import inspect
+import json
+import re
+
+TICKER_PARAMS = {"ticker", "tickers", "symbol"}
+
+# Nur exakt gleichwertige Angaben (keine "30d" -> "1mo", das sind andere Kerzen)
+PERIOD_ALIASES = {"1wk": "5d", "1w": "5d"}
+
+INTERVAL_ALIASES = {
+    "60m": "1h", "1day": "1d", "d": "1d",
+    "1w": "1wk", "w": "1wk", "1week": "1wk",
+    "1month": "1mo",
+}
+
+_MONTHS_RE = re.compile(r"^(\d+)mo$")
+
+
+def normalize_ticker(value):
+    if isinstance(value, str):
+        return value.strip().upper()
+    if isinstance(value, (list, tuple)):
+        # Reihenfolge bleibt (bestimmt die Reihenfolge im Ergebnis)
+        return [normalize_ticker(v) for v in value]
+    return value
+
+
+def normalize_period(value):
+    if not isinstance(value, str):
+        return value
+    p = value.strip().lower()
+    p = PERIOD_ALIASES.get(p, p)
+    m = _MONTHS_RE.match(p)
+    if m and int(m.group(1)) >= 12 and int(m.group(1)) % 12 == 0:
+        return f"{int(m.group(1)) // 12}y"
+    return p
+
+
+def normalize_interval(value):
+    if not isinstance(value, str):
+        return value
+    i = value.strip()
+    # Großes "M" ist bei manchen Quellen der Monat, kleines "m" immer die Minute
+    if i.endswith("M") and i[:-1].isdigit():
+        return f"{i[:-1]}mo"
+    i = i.lower()
+    return INTERVAL_ALIASES.get(i, i)
+
+
+def normalize_query(value):
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+NORMALIZERS = {
+    **{name: normalize_ticker for name in TICKER_PARAMS},
+    "period": normalize_period,
+    "interval": normalize_interval,
+    "query": normalize_query,
+}
+
+
+class KeyBuilder:
+    """Bindet Aufrufe einer Funktion und baut daraus den kanonischen Key."""
+
+    def __init__(self, func, namespace: str):
+        self.namespace = namespace
+        self.signature = inspect.signature(func)
+        params = list(self.signature.parameters)
+        self.skip_self = bool(params) and params[0] == "self"
+
+    def bind(self, args: tuple, kwargs: dict):
+        """-> (key, args, kwargs) mit normalisierten Argumenten für den eigentlichen Aufruf."""
+        bound = self.signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        for name, value in bound.arguments.items():
+            normalize = NORMALIZERS.get(name)
+            if normalize is not None:
+                bound.arguments[name] = normalize(value)
+
+        digest = hashlib.md5(json.dumps(self._parts(bound), sort_keys=True, default=str).encode()).hexdigest()
+        return f"{self.namespace}:{digest}", bound.args, bound.kwargs
+
+    def describe(self, args: tuple, kwargs: dict) -> str:
+        """Lesbare Form eines (bereits normalisierten) Aufrufs, z.B. get_quote('AAPL')."""
+        bound = self.signature.bind(*args, **kwargs)
+        return f"{self.namespace}({', '.join(repr(v) for v in self._parts(bound).values())})"
+
+    def _parts(self, bound) -> dict:
+        return {name: value for i, (name, value) in enumerate(bound.arguments.items())
+                if not (i == 0 and self.skip_self)}
+
+
+def key_namespace(key: str) -> str:
+    """Namespace-Teil eines kanonischen Keys."""
+    return key.split(":", 1)[0]
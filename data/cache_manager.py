@@ -17,9 +17,12 @@ Verwendung:
 """
 
 import json
+import sys
 import time
 import hashlib
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional, Callable
 from functools import wraps
@@ -80,6 +83,182 @@ class InMemoryCache:
         }
 
 
+# ─────────────────────────────────────────────
+# BOUNDED LRU (In-Process-Cache des Clients)
+# ─────────────────────────────────────────────
+
+def estimate_size(obj, _depth: int = 0) -> int:
+    """
+    Schätzt den Speicherbedarf eines Objekts in Bytes.
+    DataFrames/Series werden per deep memory_usage gemessen, Container rekursiv.
+    """
+    try:
+        if hasattr(obj, "memory_usage") and hasattr(obj, "index"):
+            usage = obj.memory_usage(deep=True)
+            return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        if _depth > 4:
+            return sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            return sys.getsizeof(obj) + sum(
+                estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in obj.items()
+            )
+        if isinstance(obj, (list, tuple, set)):
+            return sys.getsizeof(obj) + sum(estimate_size(v, _depth + 1) for v in obj)
+        return sys.getsizeof(obj)
+    except Exception:
+        return sys.getsizeof(obj)
+
+
+class BoundedLRUCache:
+    """
+    Thread-sicherer LRU-Cache mit Byte-Budget.
+
+    - Globales Budget (max_bytes) plus optionale Budgets pro Namespace
+    - Abgelaufene Einträge werden periodisch entfernt, nicht erst beim nächsten Zugriff
+    - Evictions werden pro Grund gezählt: "lru", "namespace", "expired", "oversize"
+    """
+
+    SWEEP_INTERVAL = 30  # Sekunden zwischen zwei Expired-Sweeps
+
+    def __init__(self, max_bytes: int, namespace_limits: Optional[dict] = None):
+        self.max_bytes = max_bytes
+        self.namespace_limits = namespace_limits or {}
+        self._data: OrderedDict = OrderedDict()   # key -> (value, namespace, size, expires)
+        self._bytes = 0
+        self._ns_bytes: dict = {}
+        self._ns_entries: dict = {}
+        self._evictions: dict = {}
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+        self._last_sweep = time.time()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._data.move_to_end(key)
+            return item[0]
+
+    def set(self, key: str, value: Any, namespace: str = "default",
+            expires: Optional[float] = None, size: Optional[int] = None) -> bool:
+        size = estimate_size(value) if size is None else size
+        with self._lock:
+            self._remove(key)
+            ns_limit = self.namespace_limits.get(namespace, self.max_bytes)
+            if size > min(self.max_bytes, ns_limit):
+                self._count("oversize")
+                return False
+
+            self._data[key] = (value, namespace, size, expires)
+            self._bytes += size
+            self._ns_bytes[namespace] = self._ns_bytes.get(namespace, 0) + size
+            self._ns_entries[namespace] = self._ns_entries.get(namespace, 0) + 1
+
+            self._maybe_sweep()
+            # Namespace-Budget: älteste Einträge desselben Namespace zuerst
+            if namespace in self.namespace_limits and self._ns_bytes[namespace] > ns_limit:
+                for k in [k for k, v in self._data.items() if v[1] == namespace]:
+                    if self._ns_bytes[namespace] <= ns_limit or k == key:
+                        break
+                    self._remove(k)
+                    self._count("namespace")
+            # Globales Budget: least recently used zuerst
+            while self._bytes > self.max_bytes and len(self._data) > 1:
+                oldest = next(iter(self._data))
+                if oldest == key:
+                    break
+                self._remove(oldest)
+                self._count("lru")
+            return True
+
+    def clear_namespace(self, namespace: str) -> int:
+        """Entfernt alle Einträge eines Namespace; gibt die Anzahl zurück."""
+        with self._lock:
+            keys = [k for k, v in self._data.items() if v[1] == namespace]
+            for k in keys:
+                self._remove(k)
+            return len(keys)
+
+    def pop(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            self._remove(key)
+            return item[0] if item else None
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._data)
+            self._data.clear()
+            self._bytes = 0
+            self._ns_bytes.clear()
+            self._ns_entries.clear()
+            return count
+
+    def sweep_expired(self) -> int:
+        """Entfernt alle abgelaufenen Einträge. Gibt Anzahl zurück."""
+        with self._lock:
+            now = time.time()
+            expired = [k for k, v in self._data.items() if v[3] is not None and v[3] < now]
+            for k in expired:
+                self._remove(k)
+                self._count("expired")
+            self._last_sweep = now
+            return len(expired)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "type":      "memory_lru",
+                "entries":   len(self._data),
+                "size_mb":   round(self._bytes / 1024 / 1024, 1),
+                "bytes":     self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits":      self._hits,
+                "misses":    self._misses,
+                "evictions": dict(self._evictions),
+                "namespaces": {
+                    ns: {"entries": self._ns_entries.get(ns, 0), "bytes": b}
+                    for ns, b in self._ns_bytes.items()
+                },
+            }
+
+    def largest(self, n: int = 10) -> list:
+        """Die n größten Einträge: [{"key", "namespace", "bytes", "expires"}, ...]."""
+        with self._lock:
+            items = sorted(self._data.items(), key=lambda kv: kv[1][2], reverse=True)[:n]
+            return [{"key": k, "namespace": ns, "bytes": size, "expires": exp}
+                    for k, (_, ns, size, exp) in items]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def _maybe_sweep(self):
+        if time.time() - self._last_sweep > self.SWEEP_INTERVAL:
+            self.sweep_expired()
+
+    def _remove(self, key: str):
+        item = self._data.pop(key, None)
+        if item is None:
+            return
+        _, ns, size, _ = item
+        self._bytes -= size
+        self._ns_bytes[ns] -= size
+        self._ns_entries[ns] -= 1
+        if self._ns_entries[ns] <= 0:
+            self._ns_bytes.pop(ns, None)
+            self._ns_entries.pop(ns, None)
+
+    def _count(self, reason: str):
+        self._evictions[reason] = self._evictions.get(reason, 0) + 1
+
+
 # ─────────────────────────────────────────────
 # DISK CACHE WRAPPER
 # ─────────────────────────────────────────────
@@ -99,6 +278,8 @@ class CacheManager:
 
         Path(cache_dir).mkdir(parents=True, exist_ok=True)
         self.cache_dir = cache_dir
+        self._counts: dict = {}       # namespace -> {"hits", "misses", "sets", "errors"}
+        self._counts_lock = threading.Lock()
 
         if DISKCACHE_AVAILABLE:
             self._cache = dc.Cache(cache_dir, size_limit=500 * 1024 * 1024)  # 500 MB
@@ -112,16 +293,27 @@ class CacheManager:
         clean = key.lower().replace(" ", "_")
         return "".join(c for c in clean if c.isalnum() or c in "_:-.")
 
+    def _count(self, key: str, field: str):
+        # Namespace aus dem Key: "client:get_quote:<hash>" -> get_quote, "feed:<url>" -> feed
+        parts = key.split(":", 2)
+        ns = parts[1] if parts[0] == "client" and len(parts) > 2 else (parts[0] if len(parts) > 1 else "default")
+        with self._counts_lock:
+            counts = self._counts.setdefault(ns, {"hits": 0, "misses": 0, "sets": 0, "errors": 0})
+            counts[field] += 1
+
     def get(self, key: str) -> Optional[Any]:
         """Wert aus Cache holen. None wenn nicht vorhanden oder abgelaufen."""
         try:
             normalized = self._normalize_key(key)
             if DISKCACHE_AVAILABLE:
-                return self._cache.get(normalized)
+                value = self._cache.get(normalized)
             else:
-                return self._cache.get(normalized)
+                value = self._cache.get(normalized)
+            self._count(key, "misses" if value is None else "hits")
+            return value
         except Exception as e:
             logger.debug(f"Cache get Fehler für '{key}': {e}")
+            self._count(key, "errors")
             return None
 
     def set(self, key: str, value: Any, ttl: int = 300) -> bool:
@@ -132,9 +324,11 @@ class CacheManager:
                 self._cache.set(normalized, value, expire=ttl)
             else:
                 self._cache.set(normalized, value, ttl=ttl)
+            self._count(key, "sets")
             return True
         except Exception as e:
             logger.debug(f"Cache set Fehler für '{key}': {e}")
+            self._count(key, "errors")
             return False
 
     def delete(self, key: str) -> bool:
@@ -177,20 +371,32 @@ class CacheManager:
         return deleted
 
     def stats(self) -> dict:
-        """Cache-Statistiken für UI-Anzeige."""
+        """Cache-Statistiken für UI-Anzeige (inkl. Treffer/Misses pro Namespace)."""
         try:
             if DISKCACHE_AVAILABLE:
                 size_bytes = self._cache.volume()
-                return {
+                base = {
                     "type":    "disk",
                     "entries": len(self._cache),
                     "size_mb": round(size_bytes / 1024 / 1024, 1),
+                    "size_limit_mb": round(self._cache.size_limit / 1024 / 1024),
                     "dir":     self.cache_dir,
                 }
             else:
-                return self._cache.stats()
+                base = self._cache.stats()
         except Exception:
-            return {"type": "unknown", "entries": 0, "size_mb": 0}
+            base = {"type": "unknown", "entries": 0, "size_mb": 0}
+        with self._counts_lock:
+            namespaces = {ns: dict(c) for ns, c in self._counts.items()}
+        hits = sum(c["hits"] for c in namespaces.values())
+        misses = sum(c["misses"] for c in namespaces.values())
+        return {
+            **base,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else None,
+            "namespaces": namespaces,
+        }
 
     def make_key(self, *args, **kwargs) -> str:
         """Erzeugt einen stabilen Cache-Key aus beliebigen Argumenten."""
@@ -245,10 +451,25 @@ def get_cache() -> CacheManager:
 # TTL-Konstanten (in Sekunden)
 TTL = {
     "quote":        60,     # 1 Min  – Kursdaten
+    "price_snapshot": 30,   # 30 Sek – Kurs ohne .info (Watchlists)
     "price_history": 300,   # 5 Min  – historische Kurse
+    "ticker_info":  300,    # 5 Min  – yfinance .info Snapshot
     "fundamentals": 3600,   # 1 Std  – Fundamentaldaten
+    "key_stats":    3600,   # 1 Std  – Key Statistics
+    "financials":   43200,  # 12 Std – Bilanz / GuV / Cashflow
+    "analyst":      43200,  # 12 Std – Analysten-Ziele
     "news":         900,    # 15 Min – News
+    "feed":         86400,  # 1 Tag  – RSS-Body + ETag/Last-Modified (Conditional GET)
+    "search":       3600,   # 1 Std  – Ticker-Suche
     "screener":     600,    # 10 Min – Screener-Ergebnisse
     "macro":        3600,   # 1 Std  – Makrodaten
     "company_info": 86400,  # 1 Tag  – Unternehmensinfos
 }
+
+# Stale-While-Revalidate-Fenster (in Sekunden): so lange nach Ablauf wird der alte
+# Wert noch sofort ausgeliefert, während im Hintergrund neu geladen wird
+STALE_TTL = {
+    "quote":          600,   # 10 Min
+    "price_snapshot": 300,   # 5 Min
+    "price_history":  3600,  # 1 Std
+}
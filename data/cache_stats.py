@@ -0,0 +1,97 @@
+"""
+data/cache_stats.py - Zähler für den Client-Cache (Treffer, Misses, Fetch-Latenz)
+
+Pro Namespace (= gecachte Client-Methode, z.B. "get_quote"):
+    l1_hits    frischer Treffer im Memory-Cache
+    l2_hits    frischer Treffer im Disk-Cache (danach nach L1 befördert)
+    stale      abgelaufener Wert ausgeliefert, Refresh im Hintergrund
+    misses     kein brauchbarer Eintrag -> Aufrufer wartet auf einen Fetch
+    fetches    tatsächlich ausgeführte Provider-Aufrufe (inkl. Hintergrund-Refresh)
+    not_cached Ergebnisse, die wegen Drosselung/Ausfall nicht gecacht wurden
+und die Latenz der letzten Fetches (p50/p95).
+
+Zusätzlich merkt sich das Modul zu jedem Key eine lesbare Beschreibung des
+Aufrufs, damit die Diagnose-Seite die größten Einträge benennen kann.
+
+Verwendung:
+    from data.cache_stats import cache_stats
+    cache_stats()   # [{"namespace": "get_quote", "hit_ratio": 0.93, "p95_ms": 840, ...}, ...]
+"""
+
+import threading
+from collections import OrderedDict, deque
+
+LATENCY_SAMPLES = 500       # Fetch-Latenzen pro Namespace
+MAX_KEY_LABELS = 5000       # Beschreibungen (Key -> Aufruf) für die größten Einträge
+
+COUNTERS = ("l1_hits", "l2_hits", "stale", "misses", "fetches", "not_cached")
+
+_lock = threading.Lock()
+_counts: dict = {}          # namespace -> {zähler: int}
+_latency: dict = {}         # namespace -> deque der Fetch-Dauern (Sekunden)
+_labels: OrderedDict = OrderedDict()
+
+
+def _bump(namespace: str, field: str):
+    counts = _counts.get(namespace)
+    if counts is None:
+        counts = _counts[namespace] = dict.fromkeys(COUNTERS, 0)
+    counts[field] += 1
+
+
+def record_lookup(namespace: str, outcome: str):
+    """outcome: "l1_hits", "l2_hits", "stale" oder "misses"."""
+    with _lock:
+        _bump(namespace, outcome)
+
+
+def record_fetch(namespace: str, seconds: float, stored: bool = True):
+    with _lock:
+        _bump(namespace, "fetches")
+        if not stored:
+            _bump(namespace, "not_cached")
+        _latency.setdefault(namespace, deque(maxlen=LATENCY_SAMPLES)).append(seconds)
+
+
+def label_key(key: str, label: str):
+    """Lesbare Beschreibung eines Keys merken, z.B. get_price_history('AAPL', '1y', '1d')."""
+    with _lock:
+        _labels[key] = label
+        _labels.move_to_end(key)
+        while len(_labels) > MAX_KEY_LABELS:
+            _labels.popitem(last=False)
+
+
+def key_label(key: str) -> str:
+    with _lock:
+        return _labels.get(key, key)
+
+
+def _percentile(samples: list, q: float):
+    return round(samples[int(q * (len(samples) - 1))] * 1000) if samples else None
+
+
+def cache_stats() -> list:
+    """Pro Namespace: Zähler, Trefferquote und p50/p95 der Fetch-Latenz (ms)."""
+    with _lock:
+        rows = []
+        for ns, counts in sorted(_counts.items()):
+            lookups = counts["l1_hits"] + counts["l2_hits"] + counts["stale"] + counts["misses"]
+            hits = lookups - counts["misses"]
+            lat = sorted(_latency.get(ns, ()))
+            rows.append({
+                "namespace": ns,
+                **counts,
+                "hit_ratio": round(hits / lookups, 3) if lookups else None,
+                "p50_ms": _percentile(lat, 0.5),
+                "p95_ms": _percentile(lat, 0.95),
+            })
+        return rows
+
+
+def reset_cache_stats():
+    """Alle Zähler verwerfen (z.B. in Tests)."""
+    with _lock:
+        _counts.clear()
+        _latency.clear()
+        _labels.clear()
@@ -0,0 +1,137 @@
+"""
+data/cache_warmer.py - Cache-Warm-up beim Prozessstart
+
+Nach einem Deploy zahlt sonst der erste Besucher den vollen Fetch für alles,
+was das Dashboard und die Makro-Seite sofort brauchen. Der Warmer lädt einmal
+pro Prozess im Hintergrund:
+
+1. Snapshots (get_price_snapshot) für Indizes, Watchlist, Sektor-ETFs, Devisen,
+   Rohstoffe und die Dashboard-Karten
+2. volle Quotes (get_quote) für Indizes und Watchlist
+3. Kurshistorien (WARMUP_HISTORY_PERIOD, 1d) als ein Batch-Download
+
+Alles läuft durch den normalen Client-Cache (Single-Flight, Rate Limits,
+Circuit Breaker). Fragt eine Seite einen Key an, der gerade vorgewärmt wird,
+wartet sie auf genau diesen Fetch statt einen zweiten zu starten.
+
+Verwendung:
+    from data.cache_warmer import start_warmup, get_warmer
+    start_warmup(client)        # idempotent – get_client() ruft das einmal auf
+    get_warmer().status()       # Fortschritt für die Diagnose-Seite
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
+
+from loguru import logger
+
+from config import (
+    WARMUP_ENABLED, WARMUP_MAX_WORKERS, WARMUP_HISTORY_PERIOD,
+    MARKET_INDICES, DEFAULT_WATCHLIST, SECTOR_ETFS, FOREX_PAIRS, COMMODITIES, DASHBOARD_CARDS,
+)
+from utils.tracing import trace, propagate
+
+IDLE, RUNNING, DONE, FAILED = "idle", "running", "done", "failed"
+
+
+def warmup_symbols() -> list:
+    """Alle vorzuladenden Symbole, ohne Duplikate, Dashboard zuerst."""
+    symbols = [*DASHBOARD_CARDS, *DEFAULT_WATCHLIST, *MARKET_INDICES, *SECTOR_ETFS.values(),
+               *FOREX_PAIRS, *COMMODITIES]
+    return list(dict.fromkeys(symbols))
+
+
+class CacheWarmer:
+    def __init__(self, max_workers: int = WARMUP_MAX_WORKERS):
+        self.max_workers = max_workers
+        self.state = IDLE
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.stages: list = []      # [{"stage", "total", "done", "failed", "seconds"}]
+        self._lock = threading.Lock()
+
+    def plan(self, client) -> list:
+        """(Name, Funktion pro Symbol oder None für Batch, Symbole) je Stufe."""
+        symbols = warmup_symbols()
+        return [
+            ("Snapshots", client.get_price_snapshot, symbols),
+            ("Quotes", client.get_quote, list(dict.fromkeys([*DEFAULT_WATCHLIST, *MARKET_INDICES]))),
+            ("Historien", None, symbols),
+        ]
+
+    def start(self, client, force: bool = False) -> bool:
+        """Startet den Warm-up im Hintergrund; False, wenn er schon lief oder läuft."""
+        with self._lock:
+            if self.state == RUNNING or (self.state != IDLE and not force):
+                return False
+            plan = self.plan(client)
+            self.state = RUNNING
+            self.started_at, self.finished_at = time.time(), None
+            self.stages = [{"stage": name, "total": len(symbols), "done": 0, "failed": 0, "seconds": None}
+                           for name, _, symbols in plan]
+        threading.Thread(target=self.run, args=(client, plan), name="cache-warmup", daemon=True).start()
+        return True
+
+    def run(self, client, plan: list):
+        try:
+            with trace("Cache Warm-up"):
+                for stage, (name, func, symbols) in zip(self.stages, plan):
+                    start = time.time()
+                    if func is None:
+                        self._warm_histories(client, stage, symbols)
+                    else:
+                        self._warm_each(func, stage, symbols)
+                    with self._lock:
+                        stage["seconds"] = round(time.time() - start, 1)
+            state = DONE
+        except Exception as e:
+            logger.error(f"Cache Warm-up abgebrochen: {e}")
+            state = FAILED
+        with self._lock:
+            self.state = state
+            self.finished_at = time.time()
+        logger.info(f"Cache Warm-up {state} nach {self.finished_at - self.started_at:.1f}s")
+
+    def _warm_each(self, func, stage: dict, symbols: list):
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="openbb-warmup") as pool:
+            task = propagate(func)
+            futures = [pool.submit(task, s) for s in symbols]
+            for f in as_completed(futures):
+                ok = f.exception() is None and bool(f.result())
+                with self._lock:
+                    stage["done" if ok else "failed"] += 1
+
+    def _warm_histories(self, client, stage: dict, symbols: list):
+        panel = client.get_price_histories(symbols, WARMUP_HISTORY_PERIOD, "1d")
+        loaded = set(panel.columns.get_level_values(0)) if not panel.empty else set()
+        with self._lock:
+            stage["done"] = len(loaded)
+            stage["failed"] = len(symbols) - len(loaded)
+
+    def status(self) -> dict:
+        with self._lock:
+            end = self.finished_at or time.time()
+            return {
+                "state": self.state,
+                "started_at": self.started_at,
+                "seconds": round(end - self.started_at, 1) if self.started_at else None,
+                "stages": [dict(s) for s in self.stages],
+            }
+
+
+# Singleton
+_warmer_instance = None
+
+def get_warmer() -> CacheWarmer:
+    global _warmer_instance
+    if _warmer_instance is None:
+        _warmer_instance = CacheWarmer()
+    return _warmer_instance
+
+def start_warmup(client, force: bool = False) -> bool:
+    """Einmal pro Prozess (force=True: erneut, z.B. per Button auf der Diagnose-Seite)."""
+    if not WARMUP_ENABLED and not force:
+        return False
+    return get_warmer().start(client, force=force)
@@ -0,0 +1,192 @@
+"""
+data/circuit_breaker.py - Circuit Breaker pro Provider-Endpunkt
+
+Zustände:
+    closed     normaler Betrieb, Fehler werden gezählt
+    open       nach CIRCUIT_FAILURE_THRESHOLD Fehlern in Folge: Aufrufe scheitern
+               sofort mit CircuitOpen, ohne Timeout abzuwarten
+    half_open  nach CIRCUIT_COOLDOWN Sekunden darf genau ein Probe-Aufruf durch;
+               Erfolg -> closed, Fehler -> wieder open
+
+Als Fehler zählen Ausfälle (Verbindungsfehler, Timeouts, 5xx) – keine leeren
+Ergebnisse oder unbekannten Ticker. Ein Ausfall kostet so einen Timeout pro
+Cool-down statt einen pro Request. Abgewiesene und ausgefallene Aufrufe werden
+wie Drosselungen im throttle_scope gemeldet, der Client cacht sie nicht.
+
+Verwendung:
+    from data.circuit_breaker import guarded, breaker_stats
+
+    with guarded("yfinance"):        # Breaker + Rate Limit
+        info = yf.Ticker("AAPL").info
+
+    breaker_stats()   # [{"name": "yahoo_rss", "state": "open", "retry_in": 42, ...}, ...]
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from config import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_COOLDOWN, RATE_LIMIT_HOSTS
+from data.rate_limiter import rate_limited, note_degraded, ProviderThrottled
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpen(Exception):
+    """Endpunkt ist gesperrt (Circuit open) – Aufruf wurde nicht gesendet."""
+
+    def __init__(self, name: str):
+        super().__init__(f"{name}: Circuit offen – Provider wird übersprungen")
+        self.name = name
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 cooldown: float = CIRCUIT_COOLDOWN):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_running = False
+        self.last_error: Optional[str] = None
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Darf ein Aufruf raus? Im half_open-Zustand nur ein einziger Probe-Aufruf."""
+        with self._lock:
+            if self.state == OPEN and time.time() - self.opened_at >= self.cooldown:
+                self.state = HALF_OPEN
+                self.probe_running = False
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self.probe_running:
+                self.probe_running = True
+                return True
+            self.rejected += 1
+            return False
+
+    def check(self):
+        """Wie allow(), wirft aber CircuitOpen."""
+        if not self.allow():
+            note_degraded()
+            raise CircuitOpen(self.name)
+
+    def rejecting(self) -> bool:
+        """Offen und Cool-down noch nicht abgelaufen."""
+        with self._lock:
+            return self.state == OPEN and time.time() - self.opened_at < self.cooldown
+
+    def release_probe(self):
+        with self._lock:
+            self.probe_running = False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info(f"Circuit {self.name}: wieder geschlossen")
+            self.state = CLOSED
+            self.failures = 0
+            self.probe_running = False
+
+    def record_failure(self, error: Optional[BaseException] = None):
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error)[:200] if error else None
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    logger.warning(f"Circuit {self.name}: geöffnet nach {self.failures} Fehlern ({self.last_error})")
+                self.state = OPEN
+                self.opened_at = time.time()
+                self.probe_running = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            retry_in = max(0, round(self.opened_at + self.cooldown - time.time())) if self.state == OPEN else 0
+            return {
+                "name":       self.name,
+                "state":      self.state,
+                "failures":   self.failures,
+                "rejected":   self.rejected,
+                "retry_in":   retry_in,
+                "last_error": self.last_error,
+            }
+
+
+def is_outage_error(exc: BaseException) -> bool:
+    """Verbindungsfehler / Timeouts (requests, curl_cffi, Sockets) – keine Datenfehler."""
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    name = type(exc).__name__
+    return "Timeout" in name or "ConnectionError" in name or "ConnectTimeout" in name
+
+
+# ─────────────────────────────────────────────
+# REGISTRY
+# ─────────────────────────────────────────────
+
+_breakers: dict = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(name: str) -> CircuitBreaker:
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(name, CircuitBreaker(name))
+    return breaker
+
+def breaker_for_url(url: str) -> Optional[CircuitBreaker]:
+    """Breaker passend zum Host einer URL (gleiche Namen wie die Rate Limits)."""
+    name = RATE_LIMIT_HOSTS.get(urlparse(url).hostname or "")
+    return get_breaker(name) if name else None
+
+def is_open(name: str) -> bool:
+    """True, wenn der Endpunkt gerade gesperrt ist (ohne einen Probe-Aufruf zu verbrauchen)."""
+    breaker = _breakers.get(name)
+    return breaker is not None and breaker.rejecting()
+
+@contextmanager
+def tracked(breaker: CircuitBreaker):
+    """
+    Verbucht Exceptions im Block am Breaker: Ausfälle als Fehler, andere Fehler
+    als Erfolg (der Provider hat geantwortet). Den Erfolg bei normalem Ende
+    verbucht der Aufrufer selbst (z.B. abhängig vom HTTP-Status).
+    """
+    try:
+        yield breaker
+    except ProviderThrottled:
+        # Drosselung ist kein Ausfall; ein laufender Probe-Aufruf gibt seinen Slot frei
+        breaker.release_probe()
+        raise
+    except Exception as e:
+        if is_outage_error(e):
+            breaker.record_failure(e)
+            note_degraded()
+        else:
+            breaker.record_success()
+        raise
+
+@contextmanager
+def guarded(name: str):
+    """Breaker prüfen, Rate Limit anwenden und Ausfälle im Block zählen."""
+    breaker = get_breaker(name)
+    breaker.check()
+    with tracked(breaker):
+        with rate_limited(name):
+            yield breaker
+    breaker.record_success()
+
+def breaker_stats() -> list:
+    """Zustand aller bisher genutzten Breaker (für UI-Anzeige)."""
+    return [b.stats() for b in list(_breakers.values())]
+
+def reset_breakers():
+    """Alle Breaker verwerfen (z.B. in Tests)."""
+    with _breakers_lock:
+        _breakers.clear()
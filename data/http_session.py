@@ -0,0 +1,235 @@
+"""
+data/http_session.py - Gemeinsame HTTP-Session mit Connection-Pooling
+
+Alle Provider-Requests (Yahoo Suche, Yahoo RSS, FMP, Gemini) laufen über eine
+prozessweite requests.Session:
+- Keep-Alive statt neuem TCP/TLS-Handshake pro Aufruf
+- eigene Pool-Größe pro Host (HTTP_POOL_SIZES in config.py)
+- Default-Timeout für jeden Request
+- Retries mit exponentiellem Backoff + Jitter bei 5xx / Verbindungsfehlern
+- Rate Limit pro Provider-Host (data/rate_limiter.py); 429 senkt die Rate,
+  wartet Retry-After ab und versucht es erneut
+- Circuit Breaker pro Provider-Host (data/circuit_breaker.py): ausgefallene
+  Endpunkte scheitern sofort statt jedes Mal den Timeout abzuwarten
+- Record/Replay (data/replay.py): bei aktivem Archiv wird nur das eigentliche
+  Senden ersetzt, Rate Limit und Breaker greifen weiterhin
+
+yfinance verwaltet intern bereits eine eigene, geteilte curl_cffi-Session
+(und lehnt requests.Session ab) – dort wird nichts umgebogen.
+
+Für asyncio gibt es async_http_get: pro Event-Loop eine curl_cffi AsyncSession
+(kommt mit yfinance mit), damit hunderte Requests ohne je einen Thread laufen.
+Ohne curl_cffi wird auf http_get im Thread-Pool zurückgefallen. Vor dem Ende
+eines Loops close_async_session() awaiten (der Hintergrund-Loop des
+AsyncOpenBBClient macht das beim Prozessende selbst).
+
+Verwendung:
+    from data.http_session import http_get
+    resp = http_get("https://query2.finance.yahoo.com/v1/finance/search", params={"q": "nvda"})
+    resp = await async_http_get(url, params={"q": "nvda"})
+"""
+
+import asyncio
+import contextvars
+import threading
+import weakref
+from functools import partial
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import (
+    HTTP_TIMEOUT, HTTP_RETRIES, HTTP_BACKOFF, HTTP_POOL_SIZES, HTTP_DEFAULT_POOL_SIZE,
+    HTTP_ASYNC_MAX_CONNECTIONS,
+)
+
+from data.rate_limiter import limiter_for_url, give_up
+from data.circuit_breaker import breaker_for_url, tracked
+from data.replay import get_archive
+
+try:
+    from curl_cffi.requests import AsyncSession
+    ASYNC_HTTP_AVAILABLE = True
+except ImportError:
+    ASYNC_HTTP_AVAILABLE = False
+
+# Standard Header um wie ein Browser auszusehen (verhindert 403 Errors)
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Async-Sessions sind an ihren Event-Loop gebunden -> eine pro Loop
+_async_sessions = weakref.WeakKeyDictionary()
+
+
+def _retry_policy() -> Retry:
+    """Retry-Policy: nur idempotente Methoden, Backoff mit Jitter, Retry-After respektieren."""
+    kwargs = dict(
+        total=HTTP_RETRIES,
+        connect=HTTP_RETRIES,
+        read=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_jitter=HTTP_BACKOFF, **kwargs)
+    except TypeError:
+        # urllib3 < 2.0 kennt keinen Jitter
+        return Retry(**kwargs)
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    retry = _retry_policy()
+
+    # Fallback-Adapter für alle übrigen Hosts
+    default = HTTPAdapter(pool_connections=HTTP_DEFAULT_POOL_SIZE,
+                          pool_maxsize=HTTP_DEFAULT_POOL_SIZE, max_retries=retry)
+    session.mount("https://", default)
+    session.mount("http://", default)
+
+    # Eigener Pool pro bekanntem Host (längster Prefix gewinnt in requests)
+    for host, size in HTTP_POOL_SIZES.items():
+        session.mount(f"https://{host}", HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=retry))
+    return session
+
+
+def get_session() -> requests.Session:
+    """Gibt die prozessweite Session zurück (thread-safe, lazy erzeugt)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def _retry_after(resp) -> Optional[float]:
+    try:
+        return float(resp.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+def http_get(url: str, timeout=None, **kwargs) -> requests.Response:
+    """
+    GET über die gemeinsame Session, mit Default-Timeout, Circuit Breaker und
+    Provider-Rate-Limit. Bleibt es nach allen Versuchen bei 429, wird
+    ProviderThrottled geworfen; ist der Endpunkt gesperrt, sofort CircuitOpen.
+    """
+    send = lambda: get_session().get(url, timeout=timeout or HTTP_TIMEOUT, **kwargs)
+    archive = get_archive()
+    if archive is not None:
+        send = partial(archive.http, url, kwargs.get("params"), send)
+    breaker = breaker_for_url(url)
+    if breaker is None:
+        return send()
+    breaker.check()
+    with tracked(breaker):
+        resp = _send_limited(limiter_for_url(url), send)
+    _record_status(breaker, resp)
+    return resp
+
+
+def _send_limited(bucket, send):
+    if bucket is None:
+        return send()
+    for _ in range(HTTP_RETRIES + 1):
+        bucket.acquire()
+        resp = send()
+        if resp.status_code != 429:
+            bucket.reward()
+            return resp
+        bucket.penalize(_retry_after(resp))
+    raise give_up(bucket)
+
+
+def _record_status(breaker, resp):
+    # 5xx nach allen Retries = Ausfall, alles andere hat der Provider beantwortet
+    if resp.status_code >= 500:
+        breaker.record_failure(Exception(f"HTTP {resp.status_code}"))
+    else:
+        breaker.record_success()
+
+
+def http_post(url: str, timeout=None, **kwargs) -> requests.Response:
+    """POST über die gemeinsame Session (wird von der Retry-Policy nicht wiederholt)."""
+    return get_session().post(url, timeout=timeout or HTTP_TIMEOUT, **kwargs)
+
+
+def reset_session():
+    """Schließt die Session (z.B. nach Fork oder in Tests)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+# ─────────────────────────────────────────────
+# ASYNC
+# ─────────────────────────────────────────────
+
+def get_async_session():
+    """AsyncSession des laufenden Event-Loops (None ohne curl_cffi)."""
+    if not ASYNC_HTTP_AVAILABLE:
+        return None
+    loop = asyncio.get_running_loop()
+    session = _async_sessions.get(loop)
+    if session is None:
+        session = _async_sessions[loop] = AsyncSession(
+            headers=DEFAULT_HEADERS, max_clients=HTTP_ASYNC_MAX_CONNECTIONS,
+        )
+    return session
+
+
+async def close_async_session():
+    """Schließt die AsyncSession des laufenden Event-Loops (falls es eine gibt)."""
+    if not ASYNC_HTTP_AVAILABLE:
+        return
+    session = _async_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+async def async_http_get(url: str, timeout=None, **kwargs):
+    """GET ohne Thread pro Request; Antwort hat status_code/content/json() wie requests."""
+    session = get_async_session()
+    if session is None:
+        ctx = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            None, ctx.run, partial(http_get, url, timeout=timeout, **kwargs))
+
+    send = lambda: session.get(url, timeout=timeout or HTTP_TIMEOUT, **kwargs)
+    archive = get_archive()
+    if archive is not None:
+        send = partial(archive.http_async, url, kwargs.get("params"), send)
+    breaker = breaker_for_url(url)
+    if breaker is None:
+        return await send()
+    breaker.check()
+    with tracked(breaker):
+        resp = await _send_limited_async(limiter_for_url(url), send)
+    _record_status(breaker, resp)
+    return resp
+
+
+async def _send_limited_async(bucket, send):
+    if bucket is None:
+        return await send()
+    for _ in range(HTTP_RETRIES + 1):
+        await bucket.acquire_async()
+        resp = await send()
+        if resp.status_code != 429:
+            bucket.reward()
+            return resp
+        bucket.penalize(_retry_after(resp))
+    raise give_up(bucket)
@@ -0,0 +1,202 @@
+"""
+data/ohlcv_store.py - Lokaler, spaltenorientierter Kerzen-Speicher
+
+Hält OHLCV-Kerzen als Parquet-Dateien, partitioniert nach Intervall und Ticker:
+
+    .cache/ohlcv/<interval>/<TICKER>.parquet     Kerzen (Index "date")
+    .cache/ohlcv/<interval>/<TICKER>.meta.json   Abdeckung: start, end, period, rows, updated
+
+Im Gegensatz zu gepickelten DataFrames im diskcache lassen sich Parquet-Dateien
+schnell laden und per Zeitfilter nur teilweise lesen. Bereits gesehene Ticker
+sind damit auch offline sofort verfügbar.
+
+Ohne pyarrow wird auf Pickle-Dateien zurückgefallen (gleiche Schnittstelle,
+aber ohne Teil-Lesen).
+
+Verwendung:
+    from data.ohlcv_store import get_ohlcv_store
+    store = get_ohlcv_store()
+    store.write("AAPL", "1d", df, period="5y")
+    df = store.read("AAPL", "1d", start="2024-01-01")
+    store.coverage("AAPL", "1d")   # {"start": ..., "end": ..., "period": "5y", ...}
+    store.expire()                  # "Cache leeren": alles gilt als veraltet, bleibt aber lesbar
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote
+
+import pandas as pd
+from loguru import logger
+
+from config import CACHE_DIR
+from data.bars import INDEX_NAME
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+    logger.warning("pyarrow nicht verfügbar – OHLCV-Store nutzt Pickle als Fallback")
+
+
+class OhlcvStore:
+    """Kerzen-Speicher auf der Festplatte, eine Datei pro (interval, ticker)."""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root) if root else CACHE_DIR / "ohlcv"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.suffix = ".parquet" if PARQUET_AVAILABLE else ".pkl"
+        self._lock = threading.Lock()
+
+    def _path(self, ticker: str, interval: str) -> Path:
+        # Ticker wie "^GSPC" oder "EURUSD=X" dateisystem-sicher kodieren
+        return self.root / interval / (quote(ticker.upper(), safe="") + self.suffix)
+
+    def _meta_path(self, ticker: str, interval: str) -> Path:
+        return self._path(ticker, interval).with_suffix(".meta.json")
+
+    def read(self, ticker: str, interval: str, start=None, end=None) -> pd.DataFrame:
+        """Kerzen lesen, optional nur den Bereich [start, end]. Leer wenn nicht vorhanden."""
+        path = self._path(ticker, interval)
+        if not path.exists():
+            return pd.DataFrame()
+        try:
+            if PARQUET_AVAILABLE:
+                filters = []
+                if start is not None:
+                    filters.append(("date", ">=", self._align(path, start)))
+                if end is not None:
+                    filters.append(("date", "<=", self._align(path, end)))
+                df = pd.read_parquet(path, filters=filters or None)
+            else:
+                df = pd.read_pickle(path)
+                if start is not None:
+                    df = df[df.index >= self._align_index(df, start)]
+                if end is not None:
+                    df = df[df.index <= self._align_index(df, end)]
+            return df
+        except Exception as e:
+            logger.warning(f"OHLCV-Store: {path.name} nicht lesbar ({e})")
+            return pd.DataFrame()
+
+    def write(self, ticker: str, interval: str, df: pd.DataFrame, period: str) -> bool:
+        """Ersetzt die Kerzen eines Tickers atomar und aktualisiert die Abdeckung."""
+        if df is None or df.empty:
+            return False
+        path = self._path(ticker, interval)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        meta = {
+            "start":   df.index[0].isoformat(),
+            "end":     df.index[-1].isoformat(),
+            "period":  period,
+            "rows":    len(df),
+            "updated": time.time(),
+        }
+        try:
+            with self._lock:
+                df = df.rename_axis(INDEX_NAME)
+                if PARQUET_AVAILABLE:
+                    df.to_parquet(tmp)
+                else:
+                    df.to_pickle(tmp)
+                os.replace(tmp, path)
+                self._meta_path(ticker, interval).write_text(json.dumps(meta))
+            return True
+        except Exception as e:
+            logger.warning(f"OHLCV-Store: {path.name} nicht schreibbar ({e})")
+            return False
+
+    def coverage(self, ticker: str, interval: str) -> Optional[dict]:
+        """Metadaten zur Abdeckung oder None, wenn der Ticker noch nie gespeichert wurde."""
+        meta_path = self._meta_path(ticker, interval)
+        if not meta_path.exists() or not self._path(ticker, interval).exists():
+            return None
+        try:
+            return json.loads(meta_path.read_text())
+        except Exception:
+            return None
+
+    def delete(self, ticker: str, interval: str):
+        with self._lock:
+            self._path(ticker, interval).unlink(missing_ok=True)
+            self._meta_path(ticker, interval).unlink(missing_ok=True)
+
+    def expire(self) -> int:
+        """
+        Markiert alle Kerzen als veraltet (updated = 0): der nächste Zugriff lädt
+        nach, offline bleiben sie lesbar. Gibt Anzahl betroffener Ticker zurück.
+        """
+        count = 0
+        with self._lock:
+            for meta_path in self.root.glob("*/*.meta.json"):
+                try:
+                    meta = json.loads(meta_path.read_text())
+                    meta["updated"] = 0
+                    meta_path.write_text(json.dumps(meta))
+                    count += 1
+                except Exception as e:
+                    logger.warning(f"OHLCV-Store: {meta_path.name} nicht aktualisierbar ({e})")
+        return count
+
+    def clear(self) -> int:
+        """Löscht alle gespeicherten Kerzen. Gibt Anzahl gelöschter Dateien zurück."""
+        count = 0
+        with self._lock:
+            for f in self.root.glob(f"*/*{self.suffix}"):
+                f.unlink(missing_ok=True)
+                f.with_suffix(".meta.json").unlink(missing_ok=True)
+                count += 1
+        return count
+
+    def stats(self) -> dict:
+        """Store-Statistiken für UI-Anzeige."""
+        files = list(self.root.glob(f"*/*{self.suffix}"))
+        size = sum(f.stat().st_size for f in files)
+        return {
+            "type":    "parquet" if PARQUET_AVAILABLE else "pickle",
+            "entries": len(files),
+            "size_mb": round(size / 1024 / 1024, 1),
+            "dir":     str(self.root),
+        }
+
+    # Zeitgrenzen an die Zeitzone des gespeicherten Index anpassen
+    # (Tageskerzen sind tz-naiv, Intraday-Kerzen haben eine Börsen-Zeitzone)
+    def _align(self, path: Path, ts) -> pd.Timestamp:
+        ts = pd.Timestamp(ts)
+        import pyarrow.parquet as pq
+        tz = getattr(pq.read_schema(path).field("date").type, "tz", None)
+        if tz and ts.tz is None:
+            return ts.tz_localize(tz)
+        if not tz and ts.tz is not None:
+            return ts.tz_localize(None)
+        return ts
+
+    @staticmethod
+    def _align_index(df: pd.DataFrame, ts) -> pd.Timestamp:
+        ts = pd.Timestamp(ts)
+        tz = getattr(df.index, "tz", None)
+        if tz and ts.tz is None:
+            return ts.tz_localize(tz)
+        if not tz and ts.tz is not None:
+            return ts.tz_localize(None)
+        return ts
+
+
+# ─────────────────────────────────────────────
+# SINGLETON
+# ─────────────────────────────────────────────
+
+_store_instance: Optional[OhlcvStore] = None
+
+def get_ohlcv_store() -> OhlcvStore:
+    """Gibt globale OhlcvStore-Instanz zurück."""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = OhlcvStore()
+    return _store_instance
@@ -1,112 +1,813 @@
+import asyncio
+import contextvars
 import time
 import hashlib
-import json
-import requests
+import io
+import math
+import random
+import re
+import threading
 import pandas as pd
 import streamlit as st
 import yfinance as yf
 import xml.etree.ElementTree as ET
+from collections import namedtuple
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from concurrent.futures import ThreadPoolExecutor, wait
 from functools import wraps
 from loguru import logger
 
-# Cache Speicher
-_cache_store: dict = {}
+from config import (
+    get_secret, FETCH_MAX_WORKERS, FETCH_DEADLINE, REFRESH_MAX_WORKERS,
+    MEMORY_CACHE_MAX_MB, MEMORY_CACHE_NAMESPACE_MB, CACHE_TTL_JITTER, CACHE_EARLY_EXPIRY_BETA,
+    CACHE_FALLBACK_TTL,
+    SYMBOL_SEARCH_MIN_HITS, SYMBOL_SEARCH_WAIT, HOT_REFRESH_NAMESPACES,
+)
+from data.bars import (
+    normalize_ohlcv, trim_to_period, merge_tail, is_intraday, period_days, period_start,
+    resample_ohlcv, DERIVED_INTERVALS, INDEX_NAME,
+)
+from data.cache_manager import BoundedLRUCache, get_cache, TTL, STALE_TTL
+from data.cache_keys import KeyBuilder
+from data.cache_stats import record_lookup, record_fetch, label_key
+from data.http_session import http_get
+from data.rate_limiter import throttle_scope, note_degraded, note_fallback
+from data.circuit_breaker import guarded
+from data.providers import ProviderRouter, YFinanceProvider, FMPProvider, AlphaVantageProvider
+from data.ohlcv_store import get_ohlcv_store
+from data.replay import activate_from_config
+from data.symbol_index import get_symbol_index
+from data.cache_warmer import start_warmup
+from data.refresh_scheduler import record_access, start_refresh_scheduler
+from utils.tracing import span
 
-def cached(ttl_seconds: int = 300):
+# Cache Speicher, zweistufig:
+#   L1 = _cache_store: LRU mit Byte-Budget im Prozess, Namespace = Methodenname
+#        (Zugriffe unter _cache_lock – Worker-Threads schreiben mit)
+#   L2 = CacheManager (diskcache): überlebt Streamlit-Neustarts und Redeploys
+_cache_store = BoundedLRUCache(
+    max_bytes=MEMORY_CACHE_MAX_MB * 1024 * 1024,
+    namespace_limits={ns: mb * 1024 * 1024 for ns, mb in MEMORY_CACHE_NAMESPACE_MB.items()},
+)
+_cache_lock = threading.Lock()
+
+# Laufende Fetches pro Key (Single-Flight): gleichzeitige Aufrufer warten auf einen Fetch
+_inflight: dict = {}
+
+# Hintergrund-Refreshes (Stale-While-Revalidate) laufen getrennt vom Vordergrund-Pool
+_refresh_pool = ThreadPoolExecutor(max_workers=REFRESH_MAX_WORKERS, thread_name_prefix="openbb-refresh")
+
+# True während eines Hintergrund-Refreshs: lokale Abkürzungen (OHLCV-Store innerhalb
+# der TTL) sind dann tabu, sonst wird der ablaufende Wert nur neu verpackt
+_refreshing: contextvars.ContextVar = contextvars.ContextVar("cache_refresh", default=False)
+
+# Ein Cache-Eintrag: Wert, Ablaufzeit, Dauer des Fetches (für Early Expiry) und wie
+# lange der Wert abgelaufen noch ausgeliefert werden darf
+_Entry = namedtuple("_Entry", "value expires delta stale_until")
+
+class _Flight:
+    """Ein laufender Fetch, auf dessen Ergebnis weitere Aufrufer warten."""
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+def _disk_key(key: str) -> str:
+    # Keys beginnen mit ihrem Namespace (data/cache_keys.py) -> client:<namespace>:<hash>
+    return f"client:{key}"
+
+def invalidate(namespace: str) -> int:
+    """
+    Verwirft alle Einträge eines Datasets (z.B. "get_quote") in beiden Ebenen,
+    dazu die lokalen Kopien dahinter – sonst käme derselbe Stand sofort zurück.
+    """
+    with _cache_lock:
+        removed = _cache_store.clear_namespace(namespace)
+    return removed + get_cache().clear_prefix(f"client:{namespace}:") + _expire_sources(namespace)
+
+def _expire_sources(namespace: str) -> int:
+    """OHLCV-Store (Historien) bzw. gespeicherte RSS-Feeds (News) als veraltet markieren."""
+    if namespace == "get_price_history":
+        return get_ohlcv_store().expire()
+    if namespace in ("get_news", "get_news_many"):
+        return get_cache().clear_prefix("feed:")
+    return 0
+
+def memory_cache_snapshot() -> dict:
+    """Kennzahlen des Memory-Caches (L1): Größe, Budget, Evictions, Namespaces."""
+    with _cache_lock:
+        return _cache_store.stats()
+
+def largest_entries(n: int = 15) -> list:
+    """Die n größten L1-Einträge: [{"key", "namespace", "bytes", "expires"}, ...]."""
+    with _cache_lock:
+        return _cache_store.largest(n)
+
+def cache_expiry(key: str, namespace: str = "default"):
+    """Ablaufzeit (Unix) des gecachten Eintrags aus L1 oder L2, None ohne Eintrag."""
+    entry = _lookup(key, namespace)
+    return entry.expires if entry else None
+
+def _invalidate_key(key: str):
+    with _cache_lock:
+        _cache_store.pop(key)
+    get_cache().delete(_disk_key(key))
+
+def _lookup(key: str, namespace: str = "default"):
+    """
+    Eintrag aus L1 (Memory), bei Miss aus L2 (Disk) – L2-Treffer werden nach L1 befördert.
+    Liefert auch abgelaufene Einträge, solange sie im Stale-Fenster liegen.
+    """
+    return _lookup_layer(key, namespace)[0]
+
+def _lookup_layer(key: str, namespace: str = "default"):
+    """Wie _lookup, zusätzlich die Ebene des Treffers ("l1", "l2" oder None)."""
+    now = time.time()
+    with _cache_lock:
+        entry = _cache_store.get(key)
+    if isinstance(entry, _Entry) and now < entry.stale_until:
+        return entry, "l1"
+
+    entry = get_cache().get(_disk_key(key))
+    if isinstance(entry, _Entry) and now < entry.stale_until:
+        with _cache_lock:
+            _cache_store.set(key, entry, namespace=namespace, expires=entry.stale_until)
+        return entry, "l2"
+    return None, None
+
+def _cache_get(key: str, namespace: str = "default"):
+    """Nur frische Werte (None bei Miss oder abgelaufen)."""
+    entry = _lookup(key, namespace)
+    if entry and time.time() < entry.expires:
+        return entry.value
+    return None
+
+def _cache_put(key: str, value, ttl_seconds: int, namespace: str = "default",
+               delta: float = 0.0, stale_ttl: int = 0):
+    """Schreibt in beide Ebenen: L1 (Memory) und L2 (Disk, überlebt Neustarts)."""
+    # TTL-Jitter: gemeinsam geladene Keys laufen nicht in derselben Sekunde ab
+    ttl = ttl_seconds * (1 - random.random() * CACHE_TTL_JITTER)
+    now = time.time()
+    entry = _Entry(value, now + ttl, delta, now + ttl + stale_ttl)
+    with _cache_lock:
+        _cache_store.set(key, entry, namespace=namespace, expires=entry.stale_until)
+    get_cache().set(_disk_key(key), entry, ttl=int(ttl + stale_ttl) + 1)
+
+def _expires_early(entry: _Entry, now: float) -> bool:
+    """
+    Probabilistische Early Expiration (XFetch): je näher der Ablauf und je teurer
+    der Fetch (delta), desto wahrscheinlicher wird schon vorher neu geladen.
+    """
+    return now - entry.delta * CACHE_EARLY_EXPIRY_BETA * math.log(1.0 - random.random()) >= entry.expires
+
+def _fetch(key: str, namespace: str, func, args, kwargs, ttl_seconds: int, stale_ttl: int,
+           seen: float = None):
+    """
+    Lädt einen Key mit Single-Flight und schreibt das Ergebnis in den Cache.
+    `seen` ist die Ablaufzeit des Eintrags, den der Aufrufer verworfen hat (None bei Miss).
+    """
+    with _cache_lock:
+        flight = _inflight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _inflight[key] = _Flight()
+
+    # Jemand lädt diesen Key bereits -> auf dessen Ergebnis warten, aber nicht ewig:
+    # hängt der Leader, lieber den letzten (ggf. abgelaufenen) Wert ausliefern
+    if not leader:
+        if flight.done.wait(FETCH_DEADLINE):
+            return flight.result
+        logger.warning(f"{namespace}: laufender Fetch nach {FETCH_DEADLINE}s ohne Ergebnis – liefere Stale-Wert")
+        entry = _lookup(key, namespace)
+        return entry.value if entry else None
+
+    try:
+        start = time.time()
+        # Zwischen Cache-Miss des Aufrufers und Registrierung kann ein anderer Leader
+        # fertig geworden sein -> dessen frischen Eintrag übernehmen statt erneut zu laden.
+        # Den vom Aufrufer verworfenen Eintrag (Early Expiry) und Hintergrund-Refreshes
+        # nicht abkürzen, die laden bewusst vor Ablauf.
+        entry = None if _refreshing.get() else _lookup(key, namespace)
+        if entry is not None and start < entry.expires and entry.expires != seen:
+            flight.result = entry.value
+            return flight.result
+        with throttle_scope() as scope, span(f"fetch.{namespace}"):
+            res = func(*args, **kwargs)
+        flight.result = _store_result(key, namespace, res, scope, ttl_seconds, time.time() - start, stale_ttl)
+    except Exception as e:
+        logger.error(f"Error in {func.__name__}: {e}")
+        record_fetch(namespace, time.time() - start, stored=False)
+    finally:
+        with _cache_lock:
+            _inflight.pop(key, None)
+        flight.done.set()
+    return flight.result
+
+def _store_result(key: str, namespace: str, res, scope, ttl_seconds: int, delta: float, stale_ttl: int):
+    """
+    Cacht ein Fetch-Ergebnis. Wurde dabei ein Provider gedrosselt (auch wenn der Fehler
+    unterwegs geschluckt wurde), ist das Ergebnis unvollständig: nicht cachen und
+    lieber den letzten (ggf. abgelaufenen) Wert ausliefern.
+    Hat statt eines ausgefallenen Providers ein Fallback geliefert, ist das Ergebnis
+    vollständig und wird gecacht, aber höchstens CACHE_FALLBACK_TTL Sekunden –
+    sonst ginge während eines Ausfalls jeder Render erneut an den Fallback.
+    """
+    record_fetch(namespace, delta, stored=not scope.hits and res is not None)
+    if scope.hits:
+        logger.warning(f"{namespace}: Provider gedrosselt – Ergebnis wird nicht gecacht")
+        entry = _lookup(key, namespace)
+        return entry.value if entry else res
+    if scope.fallbacks:
+        ttl_seconds = min(ttl_seconds, CACHE_FALLBACK_TTL)
+    if res is not None:
+        _cache_put(key, res, ttl_seconds, namespace, delta=delta, stale_ttl=stale_ttl)
+    return res
+
+def _refresh(key: str, *fetch_args):
+    """Fetch als Hintergrund-Refresh: muss wirklich beim Provider nachladen."""
+    token = _refreshing.set(True)
+    try:
+        return _fetch(key, *fetch_args)
+    finally:
+        _refreshing.reset(token)
+
+def _refresh_in_background(key: str, *fetch_args):
+    """Plant genau einen Hintergrund-Refresh pro Key (läuft schon einer, passiert nichts)."""
+    with _cache_lock:
+        if key in _inflight:
+            return
+    _refresh_pool.submit(_refresh, key, *fetch_args)
+
+def cached(ttl_seconds: int = 300, stale_ttl: int = 0):
+    """
+    Zweistufiger Cache für Client-Methoden.
+
+    stale_ttl > 0 aktiviert Stale-While-Revalidate: abgelaufene Werte werden bis zu
+    stale_ttl Sekunden sofort ausgeliefert und im Hintergrund einmal neu geladen.
+    """
     def decorator(func):
+        namespace = func.__name__
+        # Kanonischer Key: ohne `self`, Defaults gebunden, Ticker/Period/Interval normalisiert
+        keys = KeyBuilder(func, namespace)
+        # Zugriffe auf Quotes/Historien zählen für den Hot-Key-Refresh
+        track = namespace in HOT_REFRESH_NAMESPACES
+
+        def key_for(args, kwargs):
+            return keys.bind(args, kwargs)[0]
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            key_parts = [func.__name__, str(args), str(kwargs)]
-            key = hashlib.md5(json.dumps(key_parts, sort_keys=True, default=str).encode()).hexdigest()
-            
-            if key in _cache_store:
-                val, exp = _cache_store[key]
-                if time.time() < exp:
-                    return val
-            
-            try:
-                res = func(*args, **kwargs)
-                if res is not None:
-                    _cache_store[key] = (res, time.time() + ttl_seconds)
-                return res
-            except Exception as e:
-                logger.error(f"Error in {func.__name__}: {e}")
-                return None
+            with span(f"client.{namespace}") as s:
+                key, args, kwargs = keys.bind(args, kwargs)
+                fetch_args = (namespace, func, args, kwargs, ttl_seconds, stale_ttl)
+                if s.active:
+                    s.set(call=keys.describe(args, kwargs))
+                if track:
+                    record_access(key, namespace, ttl_seconds, fetch_args)
+
+                entry, layer = _lookup_layer(key, namespace)
+                if entry:
+                    now = time.time()
+                    if now < entry.expires and not _expires_early(entry, now):
+                        record_lookup(namespace, f"{layer}_hits")
+                        s.set(cache=layer)
+                        return entry.value
+                    # Stale-While-Revalidate: sofort ausliefern, einmal im Hintergrund neu laden
+                    if stale_ttl and now < entry.stale_until:
+                        record_lookup(namespace, "stale")
+                        s.set(cache="stale")
+                        _refresh_in_background(key, *fetch_args)
+                        return entry.value
+
+                record_lookup(namespace, "misses")
+                s.set(cache="miss")
+                label_key(key, keys.describe(args, kwargs))
+                return _fetch(key, *fetch_args, seen=entry.expires if entry else None)
+
+        def peek(*args, **kwargs):
+            """Liefert den gecachten Wert ohne Fetch (None bei Miss/abgelaufen)."""
+            return _cache_get(key_for(args, kwargs), namespace)
+
+        def prime(value, *args, **kwargs):
+            """Legt einen extern geladenen Wert unter dem Key dieses Aufrufs ab."""
+            _cache_put(key_for(args, kwargs), value, ttl_seconds, namespace, stale_ttl=stale_ttl)
+
+        def invalidate_call(*args, **kwargs):
+            """Verwirft den Eintrag genau dieses Aufrufs."""
+            _invalidate_key(key_for(args, kwargs))
+
+        wrapper.peek = peek
+        wrapper.prime = prime
+        wrapper.invalidate = invalidate_call
+        wrapper.namespace = namespace
+        return wrapper
+    return decorator
+
+# Laufende async Fetches pro (Event-Loop, Key) – nur aus dem jeweiligen Loop-Thread benutzt
+_async_inflight: dict = {}
+# Referenzen auf Hintergrund-Tasks, sonst räumt der GC sie vor dem Ende ab
+_async_tasks: set = set()
+
+async def _fetch_async(key: str, namespace: str, func, args, kwargs, ttl_seconds: int, stale_ttl: int):
+    """Async-Gegenstück zu _fetch: Single-Flight über eine Future pro Key und Loop."""
+    loop = asyncio.get_running_loop()
+    flight = _async_inflight.get((loop, key))
+    if flight is not None:
+        return await asyncio.shield(flight)
+
+    flight = _async_inflight[(loop, key)] = loop.create_future()
+    res = None
+    try:
+        start = time.time()
+        with throttle_scope() as scope, span(f"fetch.{namespace}"):
+            res = await func(*args, **kwargs)
+        res = _store_result(key, namespace, res, scope, ttl_seconds, time.time() - start, stale_ttl)
+    except Exception as e:
+        logger.error(f"Error in {func.__name__}: {e}")
+        record_fetch(namespace, time.time() - start, stored=False)
+    finally:
+        _async_inflight.pop((loop, key), None)
+        flight.set_result(res)
+    return res
+
+def async_cached(ttl_seconds: int = 300, stale_ttl: int = 0):
+    """
+    Wie `cached`, aber für Coroutinen. Nutzt dieselben Keys und Cache-Ebenen –
+    ein von der sync-Methode gleichen Namens geladener Wert ist auch hier ein Treffer
+    und umgekehrt. Wartende Aufrufer blockieren keinen Thread.
+    """
+    def decorator(func):
+        namespace = func.__name__
+        keys = KeyBuilder(func, namespace)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(f"client.{namespace}") as s:
+                key, args, kwargs = keys.bind(args, kwargs)
+                fetch_args = (namespace, func, args, kwargs, ttl_seconds, stale_ttl)
+                if s.active:
+                    s.set(call=keys.describe(args, kwargs))
+
+                entry, layer = _lookup_layer(key, namespace)
+                if entry:
+                    now = time.time()
+                    if now < entry.expires and not _expires_early(entry, now):
+                        record_lookup(namespace, f"{layer}_hits")
+                        s.set(cache=layer)
+                        return entry.value
+                    if stale_ttl and now < entry.stale_until:
+                        record_lookup(namespace, "stale")
+                        s.set(cache="stale")
+                        if (asyncio.get_running_loop(), key) not in _async_inflight:
+                            task = asyncio.create_task(_fetch_async(key, *fetch_args))
+                            _async_tasks.add(task)
+                            task.add_done_callback(_async_tasks.discard)
+                        return entry.value
+
+                record_lookup(namespace, "misses")
+                s.set(cache="miss")
+                label_key(key, keys.describe(args, kwargs))
+                return await _fetch_async(key, *fetch_args)
+
+        def peek(*args, **kwargs):
+            """Liefert den gecachten Wert ohne Fetch (None bei Miss/abgelaufen)."""
+            return _cache_get(keys.bind(args, kwargs)[0], namespace)
+
+        wrapper.peek = peek
+        wrapper.namespace = namespace
         return wrapper
     return decorator
 
+# Key Statistics: Abschnitt -> [(Label, yfinance-Feld, Format)]
+# Format: None = Rohwert durchreichen, "num" = 2 Nachkommastellen, "pct" = Prozent
+KEY_STATS_FIELDS = {
+    "Valuation": [
+        ("Market Cap", "marketCap", None),
+        ("Enterprise Value", "enterpriseValue", None),
+        ("Trailing P/E", "trailingPE", "num"),
+        ("Forward P/E", "forwardPE", "num"),
+        ("PEG Ratio", "pegRatio", "num"),
+        ("Price/Sales", "priceToSalesTrailing12Months", "num"),
+        ("Price/Book", "priceToBook", "num"),
+    ],
+    "Profitability": [
+        ("Profit Margin", "profitMargins", "pct"),
+        ("Operating Margin", "operatingMargins", "pct"),
+        ("Return on Assets", "returnOnAssets", "pct"),
+        ("Return on Equity", "returnOnEquity", "pct"),
+        ("Revenue (ttm)", "totalRevenue", None),
+        ("Gross Profit", "grossProfits", None),
+    ],
+    "Balance Sheet": [
+        ("Total Cash", "totalCash", None),
+        ("Total Debt", "totalDebt", None),
+        ("Current Ratio", "currentRatio", "num"),
+        ("Quick Ratio", "quickRatio", "num"),
+        ("Book Value", "bookValue", "num"),
+    ],
+    "Trading Info": [
+        ("Beta", "beta", "num"),
+        ("Short Ratio", "shortRatio", "num"),
+        ("Shares Out", "sharesOutstanding", None),
+        ("Float", "floatShares", None),
+        ("Insiders", "heldPercentInsiders", "pct"),
+        ("Institutions", "heldPercentInstitutions", "pct"),
+    ],
+}
+
+# Provider-Endpunkte
+SEARCH_URL = "https://query2.finance.yahoo.com/v1/finance/search"
+NEWS_RSS_URL = "https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US"
+
+# ─────────────────────────────────────────────
+# CONDITIONAL GET (RSS)
+# ─────────────────────────────────────────────
+# Pro Feed liegen ETag, Last-Modified und der letzte Body im Disk-Cache. Bei 304
+# wird der gespeicherte Body neu geparst (Limit kann sich unterscheiden).
+
+def _feed_key(url: str) -> str:
+    return f"feed:{url}"
+
+def _conditional_headers(saved: dict) -> dict:
+    headers = {}
+    if saved and saved.get("etag"):
+        headers["If-None-Match"] = saved["etag"]
+    if saved and saved.get("last_modified"):
+        headers["If-Modified-Since"] = saved["last_modified"]
+    return headers
+
+def _feed_content(url: str, resp, saved: dict):
+    """Body einer (bedingten) Feed-Antwort; None bei Fehlern."""
+    if resp.status_code == 304 and saved:
+        return saved["content"]
+    if resp.status_code != 200:
+        return None
+    headers = getattr(resp, "headers", None) or {}
+    if headers.get("ETag") or headers.get("Last-Modified"):
+        get_cache().set(_feed_key(url), {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "content": resp.content,
+        }, ttl=TTL["feed"])
+    return resp.content
+
+# ─────────────────────────────────────────────
+# NEWS-AGGREGATION
+# ─────────────────────────────────────────────
+
+# Query-Parameter, die nur Herkunft/Kampagne markieren (utm_* zusätzlich per Präfix)
+_TRACKING_PARAMS = {
+    ".tsrc", "guccounter", "guce_referrer", "guce_referrer_sig", "ncid", "soc_src", "soc_trk",
+    "yptr", "cmpid", "fbclid", "gclid", "mc_cid", "mc_eid",
+}
+
+def _news_url_key(url) -> str:
+    """URL ohne Schema, Fragment und Tracking-Parameter; übrige Query-Parameter sortiert."""
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith("utm_"))
+    key = f"{parts.netloc.lower().removeprefix('www.')}{parts.path.rstrip('/')}"
+    return f"{key}?{urlencode(query)}" if query else key
+
+def _news_title_key(title) -> str:
+    """Hash des normalisierten Titels (Groß-/Kleinschreibung, Satzzeichen egal)."""
+    words = re.findall(r"\w+", (title or "").lower())
+    return hashlib.md5(" ".join(words).encode()).hexdigest() if words else ""
+
+def _published_ts(published) -> float:
+    """Veröffentlichung als Unix-Zeit (RSS-Datum, ISO-String oder Zahl); 0 wenn unbekannt."""
+    if isinstance(published, (int, float)):
+        return float(published)
+    if not published:
+        return 0.0
+    try:
+        return parsedate_to_datetime(published).timestamp()
+    except (TypeError, ValueError):
+        ts = pd.to_datetime(published, utc=True, errors="coerce")
+        return 0.0 if pd.isna(ts) else ts.timestamp()
+
+# Gemeinsamer Worker-Pool für parallele Abfragen (begrenzt Requests prozessweit)
+_fetch_pool = ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS, thread_name_prefix="openbb-fetch")
+
 class OpenBBClient:
     def __init__(self):
-        self.fmp_key = st.secrets.get("FMP_API_KEY", "")
-        # Standard Header um wie ein Browser auszusehen (verhindert 403 Errors)
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        self.fmp_key = get_secret("FMP_API_KEY")
+        # Quote und Financials laufen über den Router (PROVIDER_PRIORITY, Hedging)
+        self.router = ProviderRouter([
+            YFinanceProvider(self),
+            FMPProvider(self.fmp_key),
+            AlphaVantageProvider(get_secret("ALPHA_VANTAGE_KEY")),
+        ])
 
     def clear_cache(self):
-        global _cache_store
-        _cache_store.clear()
+        """Leert beide Cache-Ebenen, die gespeicherten Feeds und markiert den OHLCV-Store als veraltet."""
+        with _cache_lock:
+            _cache_store.clear()
+        get_cache().clear_prefix("client:")
+        get_cache().clear_prefix("feed:")
+        get_ohlcv_store().expire()
         st.cache_data.clear()
 
-    @cached(ttl_seconds=3600)
     def search_ticker(self, query: str) -> list:
+        """
+        Sucht im lokalen Symbol-Index (Präfix + Tippfehler, ohne Request).
+
+        Die Yahoo-Suche reichert den Index nur im Hintergrund an, wenn lokal weniger
+        als SYMBOL_SEARCH_MIN_HITS Treffer da sind; gibt es gar keinen, wird bis zu
+        SYMBOL_SEARCH_WAIT Sekunden auf sie gewartet.
+        """
         if not query: return []
-        results = []
+        index = get_symbol_index()
+        hits = index.search(query)
+        if len(hits) < SYMBOL_SEARCH_MIN_HITS:
+            future = self._enrich_symbols(query)
+            if not hits and future is not None:
+                wait([future], timeout=SYMBOL_SEARCH_WAIT)
+                hits = index.search(query)
+        return hits
+
+    def _enrich_symbols(self, query: str):
+        """Yahoo-Suche im Hintergrund; Ergebnisse landen im Symbol-Index."""
+        query = query.strip().lower()
+        if self.search_remote.peek(self, query) is not None:
+            return None     # schon angefragt, Ergebnisse sind im Index
+        ctx = contextvars.copy_context()
+        return _refresh_pool.submit(ctx.run, self.search_remote, query)
+
+    @cached(ttl_seconds=TTL["search"])
+    def search_remote(self, query: str) -> list:
         try:
-            url = f"https://query2.finance.yahoo.com/v1/finance/search?q={query}&quotesCount=10"
-            data = requests.get(url, headers=self.headers, timeout=4).json()
-            for item in data.get('quotes', []):
-                if item.get('quoteType') in ['EQUITY', 'ETF']:
-                    results.append({
-                        "ticker": item['symbol'], 
-                        "name": item.get('shortname') or item.get('longname'), 
-                        "exchange": item.get('exchDisp','N/A')
-                    })
-        except: pass
+            data = http_get(SEARCH_URL, params={"q": query, "quotesCount": 10}, timeout=4).json()
+            results = self._parse_search(data)
+        except Exception as e:
+            logger.error(f"Search Error: {e}")
+            return []
+        get_symbol_index().add(results)
+        return results
+
+    @staticmethod
+    def _parse_search(data: dict) -> list:
+        results = []
+        for item in data.get('quotes', []):
+            if item.get('quoteType') in ['EQUITY', 'ETF']:
+                results.append({
+                    "ticker": item['symbol'], 
+                    "name": item.get('shortname') or item.get('longname'), 
+                    "exchange": item.get('exchDisp','N/A')
+                })
         return results
 
-    @cached(ttl_seconds=300)
+    @cached(ttl_seconds=TTL["price_history"], stale_ttl=STALE_TTL["price_history"])
     def get_price_history(self, ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
         try:
-            df = yf.download(ticker, period=period, interval=interval, progress=False, auto_adjust=True, multi_level_index=False)
-            if df.empty: return pd.DataFrame()
-            df.columns = [c.lower() for c in df.columns]
-            return df[["open", "high", "low", "close", "volume"]].dropna()
-        except:
+            base = DERIVED_INTERVALS.get(interval)
+            if base:
+                # Wochen-/Monats-/4h-Kerzen aus den gespeicherten feineren Kerzen bauen
+                return resample_ohlcv(self._load_bars(ticker, period, base), interval)
+            return self._load_bars(ticker, period, interval)
+        except Exception as e:
+            logger.error(f"History Error {ticker}: {e}")
             return pd.DataFrame()
 
-    @cached(ttl_seconds=60)
+    def _load_bars(self, ticker: str, period: str, interval: str) -> pd.DataFrame:
+        """
+        Kerzen aus dem lokalen OHLCV-Store, nachgeladen wird nur was fehlt:
+        - Store deckt den Zeitraum ab: nur ab der vorletzten Kerze nachladen (Tail)
+        - Store ist kürzer: nur den fehlenden Anfang laden (Head), dann Tail
+        - nichts gespeichert: komplett laden
+        Hat ein Split/Dividende die adjustierten Preise verschoben, wird komplett neu
+        geladen. Ohne Netz werden die gespeicherten Kerzen ausgeliefert.
+        Hintergrund-Refreshs (SWR, Hot-Key-Scheduler) laden den Tail immer nach.
+        """
+        fresh = None if _refreshing.get() else self._bars_from_store(ticker, period, interval)
+        if fresh is not None:
+            return fresh
+
+        store = get_ohlcv_store()
+        meta = store.coverage(ticker, interval)
+        bars = store.read(ticker, interval) if meta else pd.DataFrame()
+        if len(bars) < 2:
+            df = self._download_bars(ticker, interval, period=period)
+            if not df.empty:
+                store.write(ticker, interval, df, period)
+            return df
+
+        stored_period = meta["period"]
+        last = bars.index[-1]
+        if period_days(period, last) > period_days(stored_period, last):
+            head_start = period_start(period, bars.index[-1])
+            if head_start is None:
+                # "max" / Handelstage: Anfang unbekannt -> komplett laden
+                df = self._download_bars(ticker, interval, period=period)
+                if not df.empty:
+                    store.write(ticker, interval, df, period)
+                    return df
+                return trim_to_period(bars, period)
+            try:
+                head = self._download_bars(ticker, interval, start=self._bar_date(head_start, interval),
+                                           end=self._bar_date(bars.index[0], interval))
+            except Exception as e:
+                logger.warning(f"Head-Update {ticker} fehlgeschlagen, nutze Store: {e}")
+                return trim_to_period(bars, period)
+            bars = pd.concat([head[head.index < bars.index[0]], bars]).rename_axis(INDEX_NAME)
+            stored_period = period
+
+        try:
+            tail = self._download_bars(ticker, interval, start=self._bar_date(bars.index[-2], interval))
+        except Exception as e:
+            # Offline / Provider-Fehler: lieber die letzten bekannten Kerzen als nichts
+            logger.warning(f"Tail-Update {ticker} fehlgeschlagen, nutze Store: {e}")
+            return trim_to_period(bars, period)
+
+        merged = merge_tail(bars, tail)
+        if merged is None:
+            logger.info(f"{ticker}: adjustierte Preise geändert – lade {stored_period} komplett neu")
+            merged = self._download_bars(ticker, interval, period=stored_period)
+            if merged.empty:
+                return trim_to_period(bars, period)
+        store.write(ticker, interval, trim_to_period(merged, stored_period), stored_period)
+        return trim_to_period(merged, period)
+
+    def _bars_from_store(self, ticker: str, period: str, interval: str):
+        """
+        Kürzeren Zeitraum direkt aus dem Store schneiden, wenn dieser den Zeitraum
+        abdeckt und innerhalb der History-TTL aktualisiert wurde (kein Netzwerk).
+        None, wenn nachgeladen werden muss.
+        """
+        store = get_ohlcv_store()
+        meta = store.coverage(ticker, interval)
+        if meta is None or time.time() - meta["updated"] > TTL["price_history"]:
+            return None
+        last = pd.Timestamp(meta["end"])
+        if period_days(period, last) > period_days(meta["period"], last):
+            return None
+        start = period_start(period, last)
+        df = trim_to_period(store.read(ticker, interval, start=start), period)
+        return df if not df.empty else None
+
+    @staticmethod
+    def _bar_date(ts: pd.Timestamp, interval: str):
+        # Tageskerzen per Datum anfragen, Intraday-Kerzen mit Uhrzeit
+        return ts if is_intraday(interval) else ts.strftime("%Y-%m-%d")
+
+    def _download_bars(self, ticker: str, interval: str, period: str = None, start=None, end=None) -> pd.DataFrame:
+        kwargs = {"period": period} if period else {"start": start, "end": end}
+        with guarded("yfinance"):
+            df = yf.download(ticker, interval=interval, progress=False, auto_adjust=True,
+                             multi_level_index=False, **kwargs)
+        return normalize_ohlcv(df)
+
+    def _store_bars(self, ticker: str, period: str, interval: str, df: pd.DataFrame):
+        """Frisch geladene Kerzen in den Store übernehmen, ohne eine breitere Abdeckung zu verlieren."""
+        store = get_ohlcv_store()
+        meta = store.coverage(ticker, interval)
+        last = pd.Timestamp(meta["end"]) if meta else None
+        if meta and period_days(meta["period"], last) > period_days(period, last):
+            merged = merge_tail(store.read(ticker, interval), df)
+            if merged is not None:
+                store.write(ticker, interval, merged, meta["period"])
+                return
+        store.write(ticker, interval, df, period)
+
+    def get_price_histories(self, tickers: list, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+        """
+        Lädt mehrere Ticker mit einem einzigen yf.download-Aufruf.
+
+        Rückgabe ist ein Panel mit MultiIndex-Spalten (ticker, feld) auf gemeinsamem
+        Index, z.B. panel["AAPL"]["close"]. Jeder Ticker landet zusätzlich unter dem
+        Cache-Key von get_price_history(ticker, period, interval); bereits gecachte
+        Ticker werden nicht erneut geladen. Abgeleitete Intervalle (1wk, 1mo, 4h)
+        werden wie bei get_price_history aus dem Basis-Intervall gebaut – geladen
+        und gespeichert werden nur die Basis-Kerzen.
+        """
+        base = DERIVED_INTERVALS.get(interval, interval)
+
+        def derive(df):
+            return resample_ohlcv(df, interval) if base != interval else df
+
+        frames = {}
+        missing = []
+        for t in dict.fromkeys(tickers):
+            hit = self.get_price_history.peek(self, t, period, interval)
+            if hit is None or hit.empty:
+                hit = self._bars_from_store(t, period, base)
+                if hit is not None:
+                    hit = derive(hit)
+                    self.get_price_history.prime(hit, self, t, period, interval)
+            if hit is not None and not hit.empty:
+                frames[t] = hit
+            else:
+                missing.append(t)
+
+        if missing:
+            try:
+                with guarded("yfinance"):
+                    raw = yf.download(missing, period=period, interval=base, group_by="ticker",
+                                      progress=False, auto_adjust=True, threads=True)
+                if raw is not None and not raw.empty:
+                    if not isinstance(raw.columns, pd.MultiIndex):
+                        raw = pd.concat({missing[0]: raw}, axis=1)
+                    for t in missing:
+                        if t not in raw.columns.get_level_values(0):
+                            continue
+                        df = normalize_ohlcv(raw[t])
+                        if df.empty:
+                            continue
+                        self._store_bars(t, period, base, df)
+                        df = derive(df)
+                        self.get_price_history.prime(df, self, t, period, interval)
+                        frames[t] = df
+            except Exception as e:
+                logger.error(f"Batch History Error: {e}")
+
+            # Nicht geladene Ticker (offline, Provider-Fehler) aus dem Store bedienen
+            store = get_ohlcv_store()
+            for t in missing:
+                meta = store.coverage(t, base)
+                last = pd.Timestamp(meta["end"]) if meta else None
+                if t not in frames and meta and period_days(meta["period"], last) >= period_days(period, last):
+                    frames[t] = derive(trim_to_period(store.read(t, base), period))
+
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=1)
+
+    @cached(ttl_seconds=TTL["ticker_info"])
+    def get_ticker_info(self, ticker: str) -> dict:
+        """
+        Profil-Snapshot: das rohe yfinance `.info`-Dict, einmal pro TTL geladen.
+
+        get_quote, get_analyst_info, get_key_stats und die Sektor-Allokation im
+        PortfolioService leiten ihre Felder hieraus ab, statt jeweils selbst `.info`
+        abzufragen. Fehler werden nicht gecacht (Rückgabe None).
+        """
+        with guarded("yfinance"):
+            info = yf.Ticker(ticker).info
+        return dict(info) if info else None
+
+    @cached(ttl_seconds=TTL["quote"], stale_ttl=STALE_TTL["quote"])
     def get_quote(self, ticker: str) -> dict:
+        quote = self.router.call("quote", ticker)
+        return {"ticker": ticker, **quote} if quote else {}
+
+    @cached(ttl_seconds=TTL["price_snapshot"], stale_ttl=STALE_TTL["price_snapshot"])
+    def get_price_snapshot(self, ticker: str) -> dict:
+        """
+        Leichtgewichtiger Quote nur aus `fast_info` (Preis, Änderung, Volumen).
+
+        Überspringt den teuren `.info`-Request – gedacht für Watchlists und Ticker-Leisten.
+        """
         try:
-            t = yf.Ticker(ticker)
-            fi = t.fast_info
-            i = t.info
-            price = fi.last_price if fi.last_price else i.get("currentPrice", 0)
-            prev = fi.previous_close if fi.previous_close else i.get("regularMarketPreviousClose", price)
+            with guarded("yfinance"):
+                fi = yf.Ticker(ticker).fast_info
+                price = fi.last_price or 0
+                prev = fi.previous_close or price
+                volume, currency = fi.last_volume, fi.currency
             change = price - prev
-            pct = (change / prev) if prev else 0
-            
             return {
                 "price": price,
                 "change": change,
-                "change_pct": pct,
-                "volume": i.get("volume"),
-                "market_cap": i.get("marketCap"),
-                "pe_ratio": i.get("trailingPE"),
-                "beta": i.get("beta"),
-                "week_52_high": i.get("fiftyTwoWeekHigh"),
-                "week_52_low": i.get("fiftyTwoWeekLow"),
-                "name": i.get("shortName"),
-                "exchange": i.get("exchange"),
-                "sector": i.get("sector"),
-                "industry": i.get("industry"),
-                "description": i.get("longBusinessSummary"),
-                "website": i.get("website"),
-                "currency": i.get("currency", "USD"),
+                "change_pct": (change / prev) if prev else 0,
+                "volume": volume,
+                "currency": currency or "USD",
             }
         except: return {}
 
-    @cached(ttl_seconds=3600)
+    def get_quotes(self, tickers: list, deadline: float = FETCH_DEADLINE, lite: bool = False) -> dict:
+        """
+        Holt Quotes für mehrere Ticker parallel über den gemeinsamen Worker-Pool.
+
+        Gibt ein Dict {ticker: quote} in Eingabe-Reihenfolge zurück. Ticker, die bis
+        zur Deadline nicht geantwortet haben, bekommen ein leeres Dict.
+        Mit lite=True wird get_price_snapshot statt get_quote genutzt.
+        """
+        func = self.get_price_snapshot if lite else self.get_quote
+        return self._fan_out(func, tickers, deadline, default_factory=dict)
+
+    def _fan_out(self, func, tickers: list, deadline: float, default_factory, **kwargs):
+        """
+        Ruft func(ticker) parallel auf. Jeder Worker läuft in einer Kopie des
+        Aufrufer-Kontexts (Trace-Spans und throttle_scope gehen mit); abgebrochene
+        Ticker machen das Ergebnis unvollständig und werden im Scope gemeldet.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        futures = {t: _fetch_pool.submit(contextvars.copy_context().run, func, t, **kwargs) for t in tickers}
+        done, not_done = wait(futures.values(), timeout=deadline)
+        for f in not_done:
+            f.cancel()
+        if not_done:
+            logger.warning(f"{func.__name__}: {len(not_done)}/{len(tickers)} Ticker nach {deadline}s abgebrochen")
+            note_degraded()
+
+        results = {}
+        for t, f in futures.items():
+            res = f.result() if f in done and f.exception() is None else None
+            results[t] = res if res is not None else default_factory()
+        return results
+
+    @cached(ttl_seconds=TTL["news"])
     def get_news(self, ticker: str, limit: int = 10) -> list:
         """
         Holt News via RSS (US-Englisch) mit Fallback auf yfinance API
@@ -114,82 +815,111 @@ class OpenBBClient:
         news_items = []
         
         # 1. Versuch: Yahoo RSS (Erzwingt Englisch via URL-Parameter)
-        try:
-            # WICHTIG: User-Agent Header mitsenden, sonst blockt Yahoo!
-            url = f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US"
-            resp = requests.get(url, headers=self.headers, timeout=5)
-            
-            if resp.status_code == 200:
-                root = ET.fromstring(resp.content)
-                for item in root.findall('./channel/item')[:limit]:
-                    news_items.append({
-                        "title": item.find('title').text,
-                        "url": item.find('link').text,
-                        "source": "Yahoo Finance", 
-                        "published": item.find('pubDate').text, 
-                        "image": None
-                    })
-        except Exception as e:
-            logger.error(f"RSS News Error: {e}")
+        # Eigener Scope: ein gesperrter/gedrosselter Feed entwertet den Fallback nicht
+        with throttle_scope(detached=True) as rss_scope:
+            try:
+                # WICHTIG: User-Agent Header mitsenden, sonst blockt Yahoo! (setzt die Session)
+                # Conditional GET: unveränderter Feed kommt als 304 ohne Body zurück
+                url = NEWS_RSS_URL.format(ticker=ticker)
+                saved = get_cache().get(_feed_key(url))
+                resp = http_get(url, timeout=5, headers=_conditional_headers(saved))
+                content = _feed_content(url, resp, saved)
+                if content:
+                    news_items = self._parse_rss(content, limit)
+            except Exception as e:
+                logger.error(f"RSS News Error: {e}")
 
         # 2. Versuch: yfinance Fallback (Falls RSS leer oder Fehler)
         if not news_items:
-            try:
-                t = yf.Ticker(ticker)
-                # yfinance news ist robuster, aber manchmal lokalisiert
-                for item in t.news[:limit]:
-                    news_items.append({
-                        "title": item.get("title"),
-                        "url": item.get("link"),
-                        "source": item.get("publisher"),
-                        "published": str(pd.to_datetime(item.get("providerPublishTime"), unit='s')),
-                        "image": None
-                    })
-            except Exception as e:
-                logger.error(f"YF News Fallback Error: {e}")
+            news_items = self._yf_news(ticker, limit)
+            if rss_scope.hits:
+                # RSS ausgefallen: Fallback-News kurz cachen, ohne Ergebnis gar nicht
+                if news_items:
+                    note_fallback()
+                else:
+                    note_degraded()
             
         return news_items
 
-    @cached(ttl_seconds=3600*12)
-    def get_financials(self, ticker: str) -> dict:
-        # FMP Bevorzugt
-        if self.fmp_key:
-            try:
-                out = {}
-                res = requests.get(f"https://financialmodelingprep.com/api/v3/income-statement/{ticker}?limit=5&apikey={self.fmp_key}").json()
-                if isinstance(res, list):
-                    df = pd.DataFrame(res).set_index("calendarYear")
-                    out["income"] = df[["revenue","netIncome","operatingIncome","eps"]].T
-                
-                res = requests.get(f"https://financialmodelingprep.com/api/v3/balance-sheet-statement/{ticker}?limit=5&apikey={self.fmp_key}").json()
-                if isinstance(res, list):
-                    df = pd.DataFrame(res).set_index("calendarYear")
-                    out["balance"] = df[["totalAssets","totalLiabilities","totalStockholdersEquity","cashAndCashEquivalents"]].T
-
-                if out: return out
-            except: pass
-
-        # Yahoo Fallback
+    @cached(ttl_seconds=TTL["news"])
+    def get_news_many(self, tickers: list, limit: int = 3) -> list:
+        """
+        Aggregierter News-Stream für mehrere Ticker (z.B. die Watchlist).
+
+        Die Feeds (je `limit` Items) laden parallel; das Ergebnis ist neueste zuerst
+        und ohne Dubletten – gleiche URL oder gleicher Titel zählen als dieselbe
+        Meldung. Jedes Item trägt in "tickers" alle Ticker, unter denen es erschien
+        (wie NewsItem.tickers in core/models.py). Lief ein Feed in die Deadline oder
+        wurde gedrosselt, wird die unvollständige Liste nicht gecacht.
+        """
+        feeds = self._fan_out(self.get_news, tickers, FETCH_DEADLINE, list, limit=limit)
+        merged, by_url, by_title = [], {}, {}
+        for ticker, items in feeds.items():
+            for item in items:
+                url_key, title_key = _news_url_key(item.get("url")), _news_title_key(item.get("title"))
+                entry = (by_url.get(url_key) if url_key else None) or (by_title.get(title_key) if title_key else None)
+                if entry is None:
+                    entry = {**item, "tickers": []}
+                    merged.append(entry)
+                if ticker not in entry["tickers"]:
+                    entry["tickers"].append(ticker)
+                if url_key:
+                    by_url.setdefault(url_key, entry)
+                if title_key:
+                    by_title.setdefault(title_key, entry)
+        merged.sort(key=lambda item: _published_ts(item.get("published")), reverse=True)
+        return merged
+
+    @staticmethod
+    def _parse_rss(content: bytes, limit: int) -> list:
+        """Liest den Feed inkrementell und hört nach `limit` Items auf."""
+        items = []
+        if limit <= 0:
+            return items
+        for _, elem in ET.iterparse(io.BytesIO(content), events=("end",)):
+            if elem.tag != "item":
+                continue
+            items.append({
+                "title": elem.findtext('title'),
+                "url": elem.findtext('link'),
+                "source": "Yahoo Finance",
+                "published": elem.findtext('pubDate'),
+                "image": None
+            })
+            if len(items) >= limit:
+                break
+            elem.clear()
+        return items
+
+    @staticmethod
+    def _yf_news(ticker: str, limit: int) -> list:
+        news_items = []
         try:
-            t = yf.Ticker(ticker)
-            def clean(df):
-                if df is None or df.empty: return pd.DataFrame()
-                df.columns = [str(c)[:4] for c in df.columns] 
-                return df
+            with guarded("yfinance"):
+                items = yf.Ticker(ticker).news[:limit]
+            # yfinance news ist robuster, aber manchmal lokalisiert
+            for item in items:
+                news_items.append({
+                    "title": item.get("title"),
+                    "url": item.get("link"),
+                    "source": item.get("publisher"),
+                    "published": str(pd.to_datetime(item.get("providerPublishTime"), unit='s')),
+                    "image": None
+                })
+        except Exception as e:
+            logger.error(f"YF News Fallback Error: {e}")
+        return news_items
 
-            return {
-                "income": clean(t.income_stmt),
-                "balance": clean(t.balance_sheet),
-                "cashflow": clean(t.cashflow)
-            }
-        except:
-            return {"income": pd.DataFrame(), "balance": pd.DataFrame(), "cashflow": pd.DataFrame()}
+    @cached(ttl_seconds=TTL["financials"])
+    def get_financials(self, ticker: str) -> dict:
+        return (self.router.call("financials", ticker)
+                or {"income": pd.DataFrame(), "balance": pd.DataFrame(), "cashflow": pd.DataFrame()})
 
-    @cached(ttl_seconds=3600*12)
+    @cached(ttl_seconds=TTL["analyst"])
     def get_analyst_info(self, ticker: str) -> dict:
         try:
-            t = yf.Ticker(ticker)
-            i = t.info
+            i = self.get_ticker_info(ticker)
+            if not i: return {}
             current = i.get("currentPrice", 1)
             target = i.get("targetMeanPrice")
             return {
@@ -202,50 +932,32 @@ class OpenBBClient:
             }
         except: return {}
 
-    @cached(ttl_seconds=3600)
+    def get_key_stats_raw(self, ticker: str) -> dict:
+        """Key Statistics als Rohzahlen (gleiche Struktur wie get_key_stats, ohne Formatierung)."""
+        i = self.get_ticker_info(ticker)
+        if not i:
+            return {}
+        return {
+            section: {label: i.get(field) for label, field, _ in fields}
+            for section, fields in KEY_STATS_FIELDS.items()
+        }
+
+    @cached(ttl_seconds=TTL["key_stats"])
     def get_key_stats(self, ticker: str) -> dict:
         try:
-            t = yf.Ticker(ticker)
-            i = t.info
+            raw = self.get_key_stats_raw(ticker)
             
-            def fmt(val, is_pct=False):
+            def fmt(val, kind):
+                if kind is None: return val
                 if val is None: return "-"
-                if is_pct: return f"{val:.2%}" if val < 5 else f"{val * 100:.2f}%"
+                if kind == "pct": return f"{val:.2%}" if val < 5 else f"{val * 100:.2f}%"
                 return f"{val:.2f}"
 
+            kinds = {section: {label: kind for label, _, kind in fields}
+                     for section, fields in KEY_STATS_FIELDS.items()}
             return {
-                "Valuation": {
-                    "Market Cap": i.get("marketCap"),
-                    "Enterprise Value": i.get("enterpriseValue"),
-                    "Trailing P/E": fmt(i.get("trailingPE")),
-                    "Forward P/E": fmt(i.get("forwardPE")),
-                    "PEG Ratio": fmt(i.get("pegRatio")),
-                    "Price/Sales": fmt(i.get("priceToSalesTrailing12Months")),
-                    "Price/Book": fmt(i.get("priceToBook")),
-                },
-                "Profitability": {
-                    "Profit Margin": fmt(i.get("profitMargins"), True),
-                    "Operating Margin": fmt(i.get("operatingMargins"), True),
-                    "Return on Assets": fmt(i.get("returnOnAssets"), True),
-                    "Return on Equity": fmt(i.get("returnOnEquity"), True),
-                    "Revenue (ttm)": i.get("totalRevenue"),
-                    "Gross Profit": i.get("grossProfits"),
-                },
-                "Balance Sheet": {
-                    "Total Cash": i.get("totalCash"),
-                    "Total Debt": i.get("totalDebt"),
-                    "Current Ratio": fmt(i.get("currentRatio")),
-                    "Quick Ratio": fmt(i.get("quickRatio")),
-                    "Book Value": fmt(i.get("bookValue")),
-                },
-                "Trading Info": {
-                    "Beta": fmt(i.get("beta")),
-                    "Short Ratio": fmt(i.get("shortRatio")),
-                    "Shares Out": i.get("sharesOutstanding"),
-                    "Float": i.get("floatShares"),
-                    "Insiders": fmt(i.get("heldPercentInsiders"), True),
-                    "Institutions": fmt(i.get("heldPercentInstitutions"), True),
-                }
+                section: {label: fmt(val, kinds[section][label]) for label, val in values.items()}
+                for section, values in raw.items()
             }
         except Exception as e:
             logger.error(f"Stats Error: {e}")
@@ -255,5 +967,8 @@ _client = None
 def get_client():
     global _client
     if not _client:
+        activate_from_config()
         _client = OpenBBClient()
+        start_warmup(_client)       # einmal pro Prozess, läuft im Hintergrund
+        start_refresh_scheduler(_lookup, _refresh_in_background)
     return _client
\ No newline at end of file
@@ -0,0 +1,343 @@
+"""
+data/providers.py - Datenanbieter und Router mit Hedged Requests
+
+Jeder Anbieter (yfinance, FMP, Alpha Vantage) implementiert die Datasets, die er
+liefern kann ("quote", "financials"). Der ProviderRouter fragt sie in der
+Reihenfolge von PROVIDER_PRIORITY (bzw. PROVIDER_PRIORITY_OVERRIDES) ab:
+
+- Fehler oder leeres Ergebnis -> sofort der nächste Anbieter
+- Antwortet der aktuelle Anbieter nicht innerhalb seines Latenz-Perzentils
+  (HEDGE_PERCENTILE der letzten Antworten), startet parallel der nächste –
+  das erste brauchbare Ergebnis gewinnt (Hedged Request)
+
+Anbieter ohne API-Key oder mit offenem Circuit Breaker werden übersprungen.
+Quotes haben bei jedem Anbieter dieselben Felder (QUOTE_FIELDS); was ein Anbieter
+nicht liefert, ist None – auch die Währung, statt USD anzunehmen.
+Jeder Versuch läuft in einem eigenen throttle_scope: ein gedrosselter Anbieter
+macht das Ergebnis eines anderen nicht wertlos. Beim Aufrufer gemeldet wird:
+- degradiert (nicht cachen): der Gewinner war selbst gedrosselt, oder es bleibt
+  kein Ergebnis, obwohl ein Anbieter gedrosselt oder (gesperrt) übersprungen wurde
+- Fallback (kurz cachen): ein Ersatz-Anbieter lieferte, weil ein bevorzugter
+  gedrosselt oder gesperrt war
+
+Verwendung:
+    router = ProviderRouter([YFinanceProvider(client), FMPProvider(key)])
+    quote = router.call("quote", "AAPL")
+    router.stats()   # Latenzen, Siege, Fehler und Hedges pro Anbieter
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Optional
+
+import pandas as pd
+import yfinance as yf
+from loguru import logger
+
+from config import (
+    PROVIDER_PRIORITY, PROVIDER_PRIORITY_OVERRIDES, HEDGE_PERCENTILE,
+    HEDGE_MIN_DELAY, HEDGE_DEFAULT_DELAY, HEDGE_MIN_SAMPLES, ROUTER_MAX_WORKERS,
+)
+from data.http_session import http_get
+from data.circuit_breaker import guarded, is_open
+from data.rate_limiter import note_degraded, note_fallback, throttle_scope
+
+# Eigener Pool: Router-Aufrufe kommen oft schon aus dem Fetch-Pool des Clients
+_hedge_pool = ThreadPoolExecutor(max_workers=ROUTER_MAX_WORKERS, thread_name_prefix="openbb-hedge")
+
+
+def is_empty(result) -> bool:
+    """Leere Antworten zählen wie Fehler (nächster Anbieter ist dran)."""
+    if result is None:
+        return True
+    if isinstance(result, pd.DataFrame):
+        return result.empty
+    if isinstance(result, dict):
+        return not result or all(isinstance(v, pd.DataFrame) and v.empty for v in result.values())
+    if isinstance(result, (list, tuple)):
+        return not result
+    return False
+
+
+# Einheitliches Quote-Schema, egal welcher Anbieter den Hedge gewinnt
+QUOTE_FIELDS = (
+    "price", "change", "change_pct", "volume", "market_cap", "pe_ratio", "beta",
+    "week_52_high", "week_52_low", "name", "exchange", "sector", "industry",
+    "description", "website", "currency",
+)
+
+
+def make_quote(**fields) -> dict:
+    """Quote mit allen QUOTE_FIELDS; fehlende Felder sind None."""
+    unknown = set(fields) - set(QUOTE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unbekannte Quote-Felder: {sorted(unknown)}")
+    return {f: fields.get(f) for f in QUOTE_FIELDS}
+
+
+# ─────────────────────────────────────────────
+# ANBIETER
+# ─────────────────────────────────────────────
+
+class Provider:
+    """Basisklasse: `datasets` nennt die Methoden, die der Anbieter implementiert."""
+    name = ""
+    datasets: tuple = ()
+
+    def available(self) -> bool:
+        return True
+
+    def fetch(self, dataset: str, *args):
+        return getattr(self, dataset)(*args)
+
+
+class YFinanceProvider(Provider):
+    name = "yfinance"
+    datasets = ("quote", "financials")
+
+    def __init__(self, client):
+        # Client für den gecachten .info-Snapshot (get_ticker_info)
+        self.client = client
+
+    def quote(self, ticker: str) -> dict:
+        with guarded("yfinance"):
+            fi = yf.Ticker(ticker).fast_info
+            last_price, previous_close = fi.last_price, fi.previous_close
+        i = self.client.get_ticker_info(ticker) or {}
+        price = last_price if last_price else i.get("currentPrice", 0)
+        prev = previous_close if previous_close else i.get("regularMarketPreviousClose", price)
+        change = price - prev
+        pct = (change / prev) if prev else 0
+
+        return make_quote(
+            price=price,
+            change=change,
+            change_pct=pct,
+            volume=i.get("volume"),
+            market_cap=i.get("marketCap"),
+            pe_ratio=i.get("trailingPE"),
+            beta=i.get("beta"),
+            week_52_high=i.get("fiftyTwoWeekHigh"),
+            week_52_low=i.get("fiftyTwoWeekLow"),
+            name=i.get("shortName"),
+            exchange=i.get("exchange"),
+            sector=i.get("sector"),
+            industry=i.get("industry"),
+            description=i.get("longBusinessSummary"),
+            website=i.get("website"),
+            currency=i.get("currency"),
+        )
+
+    def financials(self, ticker: str) -> dict:
+        t = yf.Ticker(ticker)
+        def clean(df):
+            if df is None or df.empty: return pd.DataFrame()
+            df.columns = [str(c)[:4] for c in df.columns]
+            return df
+
+        with guarded("yfinance"):
+            return {
+                "income": clean(t.income_stmt),
+                "balance": clean(t.balance_sheet),
+                "cashflow": clean(t.cashflow)
+            }
+
+
+class FMPProvider(Provider):
+    name = "fmp"
+    datasets = ("quote", "financials")
+    BASE_URL = "https://financialmodelingprep.com/api/v3"
+
+    def __init__(self, api_key: Optional[str]):
+        self.api_key = api_key
+
+    def available(self) -> bool:
+        return bool(self.api_key)
+
+    def _get(self, path: str, **params):
+        return http_get(f"{self.BASE_URL}/{path}", params={**params, "apikey": self.api_key}).json()
+
+    def quote(self, ticker: str) -> dict:
+        data = self._get(f"quote/{ticker}")
+        if not isinstance(data, list) or not data:
+            return {}
+        q = data[0]
+        # /quote nennt keine Währung (Profil-Felder wie Sektor ebenfalls nicht) -> None
+        return make_quote(
+            price=q.get("price"),
+            change=q.get("change"),
+            change_pct=(q.get("changesPercentage") or 0) / 100,
+            volume=q.get("volume"),
+            market_cap=q.get("marketCap"),
+            pe_ratio=q.get("pe"),
+            week_52_high=q.get("yearHigh"),
+            week_52_low=q.get("yearLow"),
+            name=q.get("name"),
+            exchange=q.get("exchange"),
+            currency=q.get("currency"),
+        )
+
+    def financials(self, ticker: str) -> dict:
+        return self.parse_financials(
+            self._get(f"income-statement/{ticker}", limit=5),
+            self._get(f"balance-sheet-statement/{ticker}", limit=5),
+        )
+
+    @staticmethod
+    def parse_financials(income, balance) -> dict:
+        out = {}
+        if isinstance(income, list) and income:
+            df = pd.DataFrame(income).set_index("calendarYear")
+            out["income"] = df[["revenue","netIncome","operatingIncome","eps"]].T
+        if isinstance(balance, list) and balance:
+            df = pd.DataFrame(balance).set_index("calendarYear")
+            out["balance"] = df[["totalAssets","totalLiabilities","totalStockholdersEquity","cashAndCashEquivalents"]].T
+        return out
+
+
+class AlphaVantageProvider(Provider):
+    name = "alpha_vantage"
+    datasets = ("quote",)
+    BASE_URL = "https://www.alphavantage.co/query"
+
+    def __init__(self, api_key: Optional[str]):
+        self.api_key = api_key
+
+    def available(self) -> bool:
+        return bool(self.api_key)
+
+    def quote(self, ticker: str) -> dict:
+        data = http_get(self.BASE_URL, params={"function": "GLOBAL_QUOTE", "symbol": ticker,
+                                               "apikey": self.api_key}).json()
+        q = data.get("Global Quote") or {}
+        if not q.get("05. price"):
+            return {}
+        # GLOBAL_QUOTE liefert nur Kursfelder, keine Währung
+        return make_quote(
+            price=float(q["05. price"]),
+            change=float(q.get("09. change") or 0),
+            change_pct=float((q.get("10. change percent") or "0").rstrip("%")) / 100,
+            volume=int(q.get("06. volume") or 0),
+        )
+
+
+# ─────────────────────────────────────────────
+# ROUTER
+# ─────────────────────────────────────────────
+
+class ProviderRouter:
+    def __init__(self, providers: list):
+        self.providers = {p.name: p for p in providers}
+        self._lock = threading.Lock()
+        self._latency: dict = {}    # (anbieter, dataset) -> letzte erfolgreiche Latenzen
+        self._counts: dict = {}     # anbieter -> {"calls", "wins", "errors", "hedges"}
+
+    def candidates(self, dataset: str, include_open: bool = False) -> list:
+        """
+        Verfügbare Anbieter für ein Dataset in Prioritäts-Reihenfolge; Anbieter mit
+        offenem Circuit Breaker nur mit include_open=True.
+        """
+        order = PROVIDER_PRIORITY_OVERRIDES.get(dataset, PROVIDER_PRIORITY)
+        return [self.providers[n] for n in order
+                if n in self.providers and dataset in self.providers[n].datasets
+                and self.providers[n].available() and (include_open or not is_open(n))]
+
+    def hedge_delay(self, provider: Provider, dataset: str) -> float:
+        """Wartezeit, bevor der nächste Anbieter parallel gestartet wird."""
+        with self._lock:
+            samples = sorted(self._latency.get((provider.name, dataset), ()))
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_DELAY
+        return max(HEDGE_MIN_DELAY, samples[int(HEDGE_PERCENTILE * (len(samples) - 1))])
+
+    def _count(self, provider: Provider, field: str):
+        with self._lock:
+            counts = self._counts.setdefault(provider.name, {"calls": 0, "wins": 0, "errors": 0, "hedges": 0})
+            counts[field] += 1
+
+    def _run(self, provider: Provider, dataset: str, args: tuple):
+        """(Ergebnis oder None, gedrosselt?) eines Anbieters, im eigenen throttle_scope."""
+        self._count(provider, "calls")
+        start = time.time()
+        with throttle_scope(detached=True) as scope:
+            try:
+                res = provider.fetch(dataset, *args)
+            except Exception as e:
+                logger.warning(f"{provider.name}.{dataset}{args} fehlgeschlagen: {e}")
+                res = None
+        if is_empty(res):
+            self._count(provider, "errors")
+            return None, bool(scope.hits)
+        with self._lock:
+            self._latency.setdefault((provider.name, dataset), deque(maxlen=200)).append(time.time() - start)
+        return res, bool(scope.hits)
+
+    def call(self, dataset: str, *args):
+        """Erstes brauchbares Ergebnis der Anbieter (None, wenn alle scheitern)."""
+        available = self.candidates(dataset, include_open=True)
+        queue = [p for p in available if not is_open(p.name)]
+        res, degraded, others_degraded = self._first_result(queue, dataset, args)
+        skipped = len(queue) < len(available)
+        if degraded or (res is None and (skipped or others_degraded)):
+            # Gedrosselter Gewinner, oder ein ausgefallener Anbieter hätte evtl. geliefert -> nicht cachen
+            note_degraded()
+        elif res is not None and (skipped or others_degraded):
+            note_fallback()
+        return res
+
+    def _first_result(self, queue: list, dataset: str, args: tuple):
+        """(Ergebnis, Gewinner gedrosselt?, andere Versuche gedrosselt?)."""
+        if not queue:
+            return None, False, False
+        if len(queue) == 1:
+            res, degraded = self._run(queue[0], dataset, args)
+            if res is not None:
+                self._count(queue[0], "wins")
+                return res, degraded, False
+            return None, False, degraded
+
+        pending = {}
+        any_degraded = False
+        def launch():
+            provider = queue.pop(0)
+            # Kontext mitgeben (Trace des Aufrufers); Drosselungen zählt _run im eigenen Scope
+            ctx = contextvars.copy_context()
+            pending[_hedge_pool.submit(ctx.run, self._run, provider, dataset, args)] = provider
+            return provider
+
+        current = launch()
+        while pending:
+            timeout = self.hedge_delay(current, dataset) if queue else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                # Zu langsam -> nächsten Anbieter parallel starten
+                self._count(current, "hedges")
+                current = launch()
+                continue
+            for f in done:
+                provider = pending.pop(f)
+                res, degraded = f.result()
+                if res is not None:
+                    self._count(provider, "wins")
+                    return res, degraded, any_degraded
+                any_degraded = any_degraded or degraded
+            if queue and not pending:
+                current = launch()
+        return None, False, any_degraded
+
+    def stats(self) -> list:
+        """Pro Anbieter: Zähler und p50/p95-Latenz über alle Datasets."""
+        with self._lock:
+            rows = []
+            for name, counts in self._counts.items():
+                lat = sorted(l for (n, _), d in self._latency.items() if n == name for l in d)
+                rows.append({
+                    "provider": name,
+                    **counts,
+                    "p50_ms": round(lat[len(lat) // 2] * 1000) if lat else None,
+                    "p95_ms": round(lat[int(0.95 * (len(lat) - 1))] * 1000) if lat else None,
+                })
+            return rows
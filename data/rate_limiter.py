@@ -0,0 +1,268 @@
+"""
+data/rate_limiter.py - Token-Bucket Rate Limiter pro Provider
+
+Jeder Provider (Yahoo Suche, Yahoo RSS, yfinance, FMP) bekommt einen eigenen
+Bucket aus RATE_LIMITS in config.py. Statt bei Lastspitzen 429er zu kassieren,
+warten Aufrufer auf ihren Token (Warteschlange in Reihenfolge der Reservierung).
+
+Adaptiver Backoff: Meldet der Provider 429 / Rate-Limit, wird die Rate
+multiplikativ gesenkt und der Bucket bis Retry-After pausiert; jede
+erfolgreiche Antwort hebt die Rate wieder ein Stück Richtung Basis-Rate.
+
+Gibt ein Aufrufer auf (Wartezeit > RATE_LIMIT_MAX_WAIT oder 429 nach allen
+Versuchen), wird ProviderThrottled geworfen und in jedem offenen
+throttle_scope() gezählt – der Client-Cache speichert solche Ergebnisse nicht.
+
+Verwendung:
+    from data.rate_limiter import rate_limited, limiter_stats
+
+    with rate_limited("yfinance"):
+        info = yf.Ticker("AAPL").info
+
+    limiter_stats()   # [{"name": "yfinance", "rate": 5.0, "waiting": 0, ...}, ...]
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from config import (
+    RATE_LIMITS, RATE_LIMIT_HOSTS, RATE_LIMIT_MAX_WAIT,
+    RATE_LIMIT_BACKOFF, RATE_LIMIT_RECOVERY, RATE_LIMIT_MIN_RATE,
+)
+
+try:
+    from yfinance.exceptions import YFRateLimitError
+except ImportError:
+    YFRateLimitError = None
+
+
+class ProviderThrottled(Exception):
+    """Provider drosselt und der Aufruf wurde aufgegeben."""
+
+    def __init__(self, provider: str):
+        super().__init__(f"{provider}: Rate Limit erreicht")
+        self.provider = provider
+
+
+# ─────────────────────────────────────────────
+# THROTTLE-SCOPES
+# ─────────────────────────────────────────────
+
+class _ThrottleScope:
+    def __init__(self, parent: Optional["_ThrottleScope"]):
+        self.parent = parent
+        self.hits = 0
+        self.fallbacks = 0
+
+_scope: ContextVar = ContextVar("throttle_scope", default=None)
+
+@contextmanager
+def throttle_scope(detached: bool = False):
+    """
+    Zählt aufgegebene (gedrosselte, gesperrte, ausgefallene) Provider-Aufrufe
+    innerhalb des Blocks, auch wenn verschachtelter Code den Fehler per
+    try/except geschluckt hat. detached=True meldet nichts an umschließende
+    Scopes weiter – der Aufrufer entscheidet selbst (z.B. der Provider-Router).
+    """
+    scope = _ThrottleScope(None if detached else _scope.get())
+    token = _scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _scope.reset(token)
+
+def note_degraded():
+    """
+    Meldet allen offenen Scopes ein unvollständiges Ergebnis (Drosselung,
+    gesperrter oder ausgefallener Provider).
+    """
+    scope = _scope.get()
+    while scope is not None:
+        scope.hits += 1
+        scope = scope.parent
+
+def note_fallback():
+    """
+    Meldet allen offenen Scopes ein vollständiges Ersatz-Ergebnis: der bevorzugte
+    Provider fiel aus, ein Fallback hat geliefert. Wird gecacht, aber nur kurz.
+    """
+    scope = _scope.get()
+    while scope is not None:
+        scope.fallbacks += 1
+        scope = scope.parent
+
+def give_up(bucket: "TokenBucket") -> ProviderThrottled:
+    """Zählt den Abbruch in allen offenen Scopes und liefert die Exception zum Werfen."""
+    note_degraded()
+    with bucket._lock:
+        bucket.given_up += 1
+    return ProviderThrottled(bucket.name)
+
+
+# ─────────────────────────────────────────────
+# TOKEN BUCKET
+# ─────────────────────────────────────────────
+
+class TokenBucket:
+    """Thread-sicherer Token Bucket mit adaptiver Rate."""
+
+    def __init__(self, name: str, rate: float, burst: int, max_wait: float = RATE_LIMIT_MAX_WAIT):
+        self.name = name
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.max_wait = max_wait
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+        # Metriken
+        self.waiting = 0
+        self.max_waiting = 0
+        self.acquired = 0
+        self.throttled = 0
+        self.given_up = 0
+        self.wait_time = 0.0
+
+    def _reserve(self) -> float:
+        """
+        Reserviert einen Token und gibt die nötige Wartezeit zurück. Der Bestand
+        darf negativ werden – das ist die Warteschlange der bereits Reservierten.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            wait = max(-(self.tokens - 1) / self.rate, self.blocked_until - now, 0.0)
+            if wait > self.max_wait:
+                return wait
+            self.tokens -= 1
+            self.acquired += 1
+            self.wait_time += wait
+            if wait > 0:
+                self.waiting += 1
+                self.max_waiting = max(self.max_waiting, self.waiting)
+            return wait
+
+    def _done_waiting(self):
+        with self._lock:
+            self.waiting -= 1
+
+    def acquire(self):
+        """Blockiert bis ein Token frei ist; ProviderThrottled bei zu langer Wartezeit."""
+        wait = self._reserve()
+        if wait > self.max_wait:
+            raise give_up(self)
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                self._done_waiting()
+
+    async def acquire_async(self):
+        """Wie acquire, wartet aber ohne den Thread zu blockieren."""
+        wait = self._reserve()
+        if wait > self.max_wait:
+            raise give_up(self)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._done_waiting()
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """429 / Rate-Limit gesehen: Rate senken, Burst leeren, bis Retry-After pausieren."""
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(RATE_LIMIT_MIN_RATE, self.rate * RATE_LIMIT_BACKOFF)
+            self.tokens = min(self.tokens, 0.0)
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self.blocked_until = max(self.blocked_until, time.monotonic() + pause)
+        logger.warning(f"Rate Limit {self.name}: Rate auf {self.rate:.2f}/s gesenkt, Pause {pause:.1f}s")
+
+    def reward(self):
+        """Erfolgreiche Antwort: Rate additiv zurück Richtung Basis-Rate."""
+        if self.rate < self.base_rate:
+            with self._lock:
+                self.rate = min(self.base_rate, self.rate + self.base_rate * RATE_LIMIT_RECOVERY)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "name":        self.name,
+                "rate":        round(self.rate, 2),
+                "base_rate":   self.base_rate,
+                "tokens":      round(max(self.tokens, 0.0), 1),
+                "waiting":     self.waiting,
+                "max_waiting": self.max_waiting,
+                "acquired":    self.acquired,
+                "throttled":   self.throttled,
+                "given_up":    self.given_up,
+                "avg_wait_ms": round(self.wait_time / self.acquired * 1000, 1) if self.acquired else 0.0,
+            }
+
+
+# ─────────────────────────────────────────────
+# REGISTRY
+# ─────────────────────────────────────────────
+
+_limiters: dict = {}
+_limiters_lock = threading.Lock()
+
+def get_limiter(provider: str) -> Optional[TokenBucket]:
+    """Bucket eines Providers aus RATE_LIMITS (None = unbegrenzt)."""
+    bucket = _limiters.get(provider)
+    if bucket is None and provider in RATE_LIMITS:
+        with _limiters_lock:
+            bucket = _limiters.get(provider)
+            if bucket is None:
+                cfg = RATE_LIMITS[provider]
+                bucket = _limiters[provider] = TokenBucket(provider, cfg["rate"], cfg["burst"])
+    return bucket
+
+def limiter_for_url(url: str) -> Optional[TokenBucket]:
+    """Bucket passend zum Host einer URL (RATE_LIMIT_HOSTS)."""
+    provider = RATE_LIMIT_HOSTS.get(urlparse(url).hostname or "")
+    return get_limiter(provider) if provider else None
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Erkennt Drosselungen, die als Exception ankommen (yfinance)."""
+    if YFRateLimitError is not None and isinstance(exc, YFRateLimitError):
+        return True
+    msg = str(exc)
+    return "Too Many Requests" in msg or "Rate limited" in msg
+
+@contextmanager
+def rate_limited(provider: str):
+    """Token holen, Drosselung im Block erkennen und in ProviderThrottled übersetzen."""
+    bucket = get_limiter(provider)
+    if bucket is None:
+        yield None
+        return
+    bucket.acquire()
+    try:
+        yield bucket
+    except ProviderThrottled:
+        raise
+    except Exception as e:
+        if is_rate_limit_error(e):
+            bucket.penalize()
+            raise give_up(bucket) from e
+        raise
+    bucket.reward()
+
+def limiter_stats() -> list:
+    """Metriken aller bisher genutzten Buckets (für UI-Anzeige)."""
+    return [b.stats() for b in list(_limiters.values())]
+
+def reset_limiters():
+    """Alle Buckets verwerfen (z.B. in Tests)."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,188 @@
+"""
+data/refresh_scheduler.py - Hintergrund-Refresh der meistgenutzten Cache-Keys
+
+Popularität: jeder Zugriff auf einen Quote-/Historien-Key (Treffer oder Miss,
+aus allen Sessions des Prozesses) erhöht seinen Score um 1; der Score zerfällt
+mit POPULARITY_HALF_LIFE. Was viele gerade ansehen, ist oben – was niemand
+mehr aufruft, sinkt von selbst unter HOT_REFRESH_MIN_SCORE.
+
+Scheduler: alle HOT_REFRESH_INTERVAL Sekunden werden die HOT_REFRESH_TOP_N
+heißesten Keys geprüft. Läuft ein Eintrag in weniger als HOT_REFRESH_LEAD der
+TTL ab (oder fehlt er), wird er über den normalen Hintergrund-Refresh des
+Clients neu geladen (Single-Flight, nicht cachen bei Drosselung). Pro Runde
+höchstens HOT_REFRESH_MAX_PER_TICK Refreshes; wartet irgendein Aufrufer auf
+einen Rate-Limit-Token oder ist ein Provider im Backoff, fällt die Runde aus.
+
+Refreshes zählen nicht als Zugriff – ein Key bleibt nur heiß, solange ihn
+jemand ansieht.
+
+Verwendung:
+    from data.refresh_scheduler import record_access, start_refresh_scheduler
+    record_access(key, "get_quote", ttl, fetch_args)          # im cached-Wrapper
+    start_refresh_scheduler(lookup=_lookup, refresh=_refresh_in_background)
+"""
+
+import threading
+import time
+from typing import Optional
+
+from loguru import logger
+
+from config import (
+    HOT_REFRESH_ENABLED, HOT_REFRESH_TOP_N, HOT_REFRESH_MIN_SCORE, HOT_REFRESH_INTERVAL,
+    HOT_REFRESH_LEAD, HOT_REFRESH_MAX_PER_TICK, POPULARITY_HALF_LIFE, POPULARITY_MAX_KEYS,
+)
+from data.rate_limiter import limiter_stats
+
+
+# ─────────────────────────────────────────────
+# POPULARITÄT
+# ─────────────────────────────────────────────
+
+class PopularityTracker:
+    """Zerfallender Zugriffszähler pro Key, dazu alles, was für einen Refresh nötig ist."""
+
+    def __init__(self, half_life: float = POPULARITY_HALF_LIFE, max_keys: int = POPULARITY_MAX_KEYS):
+        self.half_life = half_life
+        self.max_keys = max_keys
+        self._keys: dict = {}       # key -> [score, letzter Zugriff, namespace, ttl, fetch_args]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _decayed(self, item: list, now: float) -> float:
+        return item[0] * 0.5 ** ((now - item[1]) / self.half_life)
+
+    def record(self, key: str, namespace: str, ttl: float, fetch_args: tuple, now: Optional[float] = None):
+        now = now or time.time()
+        with self._lock:
+            item = self._keys.get(key)
+            score = self._decayed(item, now) + 1 if item else 1.0
+            self._keys[key] = [score, now, namespace, ttl, fetch_args]
+            if len(self._keys) > self.max_keys:
+                self._prune(now)
+
+    def _prune(self, now: float):
+        # Untere Hälfte verwerfen statt bei jedem Zugriff einen einzelnen Key
+        ranked = sorted(self._keys, key=lambda k: self._decayed(self._keys[k], now))
+        for key in ranked[:len(ranked) // 2]:
+            del self._keys[key]
+
+    def hottest(self, n: int, min_score: float = 0.0, now: Optional[float] = None) -> list:
+        """[(key, score, namespace, ttl, fetch_args)] absteigend nach aktuellem Score."""
+        now = now or time.time()
+        with self._lock:
+            scored = [(key, self._decayed(item, now), *item[2:]) for key, item in self._keys.items()]
+        scored = [row for row in scored if row[1] >= min_score]
+        scored.sort(key=lambda row: row[1], reverse=True)
+        return scored[:n]
+
+    def clear(self):
+        with self._lock:
+            self._keys.clear()
+
+
+# ─────────────────────────────────────────────
+# SCHEDULER
+# ─────────────────────────────────────────────
+
+def _limits_busy() -> bool:
+    """Wartet jemand auf einen Token oder ist ein Provider im Backoff?"""
+    return any(b["waiting"] > 0 or b["rate"] < b["base_rate"] for b in limiter_stats())
+
+
+class RefreshScheduler:
+    def __init__(self, lookup, refresh, tracker: Optional[PopularityTracker] = None,
+                 interval: float = HOT_REFRESH_INTERVAL, top_n: int = HOT_REFRESH_TOP_N,
+                 min_score: float = HOT_REFRESH_MIN_SCORE, lead: float = HOT_REFRESH_LEAD,
+                 max_per_tick: int = HOT_REFRESH_MAX_PER_TICK):
+        self.lookup = lookup            # (key, namespace) -> Eintrag mit .expires oder None
+        self.refresh = refresh          # (key, *fetch_args) -> plant einen Hintergrund-Refresh
+        self.tracker = tracker if tracker is not None else get_tracker()
+        self.interval = interval
+        self.top_n = top_n
+        self.min_score = min_score
+        self.lead = lead
+        self.max_per_tick = max_per_tick
+        self.ticks = 0
+        self.refreshed = 0
+        self.skipped_ticks = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def due(self, now: Optional[float] = None) -> list:
+        """Heiße Keys, die fehlen oder bald ablaufen: [(key, namespace, fetch_args)]."""
+        now = now or time.time()
+        # Mindestens zwei Runden Vorlauf, sonst rutscht ein kurzer TTL zwischen zwei Runden durch
+        min_lead = 2 * self.interval
+        due = []
+        for key, _, namespace, ttl, fetch_args in self.tracker.hottest(self.top_n, self.min_score, now):
+            entry = self.lookup(key, namespace)
+            if entry is None or entry.expires - now <= max(min_lead, ttl * self.lead):
+                due.append((key, namespace, fetch_args))
+        return due
+
+    def tick(self, now: Optional[float] = None) -> int:
+        """Eine Runde; Rückgabe: Anzahl geplanter Refreshes."""
+        self.ticks += 1
+        if _limits_busy():
+            self.skipped_ticks += 1
+            return 0
+        due = self.due(now)[:self.max_per_tick]
+        for key, _, fetch_args in due:
+            self.refresh(key, *fetch_args)
+        self.refreshed += len(due)
+        return len(due)
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.tick()
+            except Exception as e:
+                logger.error(f"Hot-Key-Refresh fehlgeschlagen: {e}")
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="hot-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def stats(self) -> dict:
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "ticks": self.ticks,
+            "refreshed": self.refreshed,
+            "skipped_ticks": self.skipped_ticks,
+            "tracked_keys": len(self.tracker),
+        }
+
+
+# Singletons
+_tracker_instance = None
+_scheduler_instance = None
+
+def get_tracker() -> PopularityTracker:
+    global _tracker_instance
+    if _tracker_instance is None:
+        _tracker_instance = PopularityTracker()
+    return _tracker_instance
+
+def get_scheduler() -> Optional[RefreshScheduler]:
+    return _scheduler_instance
+
+def record_access(key: str, namespace: str, ttl: float, fetch_args: tuple):
+    get_tracker().record(key, namespace, ttl, fetch_args)
+
+def start_refresh_scheduler(lookup, refresh) -> Optional[RefreshScheduler]:
+    """Einmal pro Prozess (aus get_client()); None, wenn abgeschaltet."""
+    global _scheduler_instance
+    if not HOT_REFRESH_ENABLED:
+        return None
+    if _scheduler_instance is None:
+        _scheduler_instance = RefreshScheduler(lookup, refresh)
+        _scheduler_instance.start()
+    return _scheduler_instance
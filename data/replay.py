@@ -0,0 +1,375 @@
+"""
+data/replay.py - Aufzeichnen und Abspielen von Provider-Antworten
+
+Für reproduzierbare Benchmarks und Tests ohne Netzwerk. Aufgezeichnet wird an
+den Provider-Grenzen:
+- HTTP (http_get / async_http_get): Yahoo Suche JSON, Yahoo RSS XML, FMP und
+  Alpha Vantage JSON – Schlüssel ist URL + Query-Parameter. 304-Antworten auf
+  Conditional GETs werden nicht aufgezeichnet (kein Body; die 200er bleibt)
+- yf.download: pro (Ticker, Intervall) der breiteste bisher gesehene Frame;
+  beim Abspielen wird auf period bzw. start/end zugeschnitten
+- yf.Ticker: Attribute wie info, fast_info, news, income_stmt
+
+Modi:
+    record  echte Requests, jede Antwort (mit gemessener Latenz) landet im Archiv
+    replay  kein Netzwerk; Antworten aus dem Archiv, nach der aufgezeichneten
+            (oder einer fest eingestellten) Latenz. Fehlt ein Eintrag -> ReplayMiss
+
+Rate Limits und Circuit Breaker bleiben aktiv – gemessen wird das Verhalten des
+Clients, nur die Provider sind ersetzt.
+
+Verwendung:
+    OPENBB_REPLAY=record streamlit run app.py     # Archiv unter .cache/replay füllen
+    OPENBB_REPLAY=replay OPENBB_REPLAY_LATENCY=0.2 python bench.py
+
+    archive = ReplayArchive(tmp_path, mode="replay", latency=0)
+    archive.put_bars("AAPL", "1d", df)              # Einträge direkt anlegen (Tests)
+    activate(archive)
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import random
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
+
+import pandas as pd
+import yfinance as yf
+from loguru import logger
+
+from data.bars import trim_to_period
+
+# fast_info ist ein lazy Objekt -> beim Aufzeichnen diese Felder materialisieren
+FAST_INFO_FIELDS = (
+    "last_price", "previous_close", "last_volume", "currency", "market_cap",
+    "open", "day_high", "day_low", "year_high", "year_low", "exchange", "timezone", "shares",
+)
+
+
+class ReplayMiss(LookupError):
+    """Für diesen Request gibt es keine Aufzeichnung."""
+
+
+class ReplayResponse:
+    """Aufgezeichnete HTTP-Antwort mit der Oberfläche von requests.Response."""
+
+    def __init__(self, status_code: int, content: bytes, headers: Optional[dict] = None, url: str = ""):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class ReplayArchive:
+    """
+    Archiv als Verzeichnis mit einer Pickle-Datei pro Eintrag
+    (<root>/<art>/<hash>.pkl mit Schlüssel, Wert und Latenz).
+
+    latency=None spielt die aufgezeichnete Latenz (mal latency_scale) ab, eine
+    Zahl setzt eine feste Latenz; jitter addiert zufällig 0..jitter Sekunden.
+    """
+
+    def __init__(self, root, mode: str = "replay", latency: Optional[float] = None,
+                 latency_scale: float = 1.0, jitter: float = 0.0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unbekannter Replay-Modus: {mode}")
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.mode = mode
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self.jitter = jitter
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    # ─────────────────────────────────────────────
+    # ARCHIV
+    # ─────────────────────────────────────────────
+
+    def _path(self, kind: str, key) -> Path:
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return self.root / kind / f"{digest}.pkl"
+
+    def get(self, kind: str, key):
+        """(Wert, Latenz) zum Schlüssel; wirft ReplayMiss."""
+        path = self._path(kind, key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            raise ReplayMiss(f"{kind}: {key}") from None
+        with self._lock:
+            self.hits += 1
+        return entry["value"], entry["latency"]
+
+    def put(self, kind: str, key, value, latency: float = 0.0):
+        path = self._path(kind, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump({"key": key, "value": value, "latency": latency}, f)
+        os.replace(tmp, path)
+        with self._lock:
+            self.recorded += 1
+
+    def put_http(self, url: str, content, status_code: int = 200, params: Optional[dict] = None,
+                 headers: Optional[dict] = None, latency: float = 0.0):
+        if isinstance(content, str):
+            content = content.encode()
+        elif not isinstance(content, bytes):
+            content = json.dumps(content).encode()
+        self.put("http", _http_key(url, params), (status_code, content, dict(headers or {})), latency)
+
+    def put_bars(self, ticker: str, interval: str, df: pd.DataFrame, latency: float = 0.0):
+        """Rohen yf.download-Frame (Spalten Open/High/Low/Close/Volume) eines Tickers ablegen."""
+        self.put("bars", (ticker, interval), df, latency)
+
+    def put_ticker(self, symbol: str, latency: float = 0.0, **attrs):
+        """yf.Ticker-Attribute ablegen, z.B. put_ticker("AAPL", info={...}, fast_info={...})."""
+        for name, value in attrs.items():
+            if name == "fast_info" and isinstance(value, dict):
+                value = _fast_info(value)
+            self.put("ticker", (symbol, name), value, latency)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"mode": self.mode, "root": str(self.root), "hits": self.hits,
+                    "misses": self.misses, "recorded": self.recorded}
+
+    # ─────────────────────────────────────────────
+    # LATENZ
+    # ─────────────────────────────────────────────
+
+    def delay_for(self, recorded: float) -> float:
+        base = self.latency if self.latency is not None else recorded * self.latency_scale
+        return max(0.0, base + (random.uniform(0, self.jitter) if self.jitter else 0.0))
+
+    def _serve(self, kind: str, key):
+        value, latency = self.get(kind, key)
+        time.sleep(self.delay_for(latency))
+        return value
+
+    def _record(self, kind: str, key, fetch, convert=lambda v: v, keep=lambda v: True):
+        start = time.time()
+        value = fetch()
+        if keep(value):
+            self.put(kind, key, convert(value), time.time() - start)
+        return value
+
+    # ─────────────────────────────────────────────
+    # HTTP
+    # ─────────────────────────────────────────────
+
+    def http(self, url: str, params: Optional[dict], send):
+        """Ersatz für send() in http_get."""
+        key = _http_key(url, params)
+        if self.mode == "replay":
+            status, content, headers = self._serve("http", key)
+            return ReplayResponse(status, content, headers, url)
+        return self._record("http", key, send, _freeze_response, keep=_archivable)
+
+    async def http_async(self, url: str, params: Optional[dict], send):
+        """Ersatz für send() in async_http_get (wartet per asyncio.sleep)."""
+        key = _http_key(url, params)
+        if self.mode == "replay":
+            (status, content, headers), latency = self.get("http", key)
+            await asyncio.sleep(self.delay_for(latency))
+            return ReplayResponse(status, content, headers, url)
+        start = time.time()
+        resp = await send()
+        if _archivable(resp):
+            self.put("http", key, _freeze_response(resp), time.time() - start)
+        return resp
+
+    # ─────────────────────────────────────────────
+    # YFINANCE
+    # ─────────────────────────────────────────────
+
+    def download(self, real, tickers, **kwargs):
+        """Ersatz für yf.download (Einzel-Ticker und Batches mit group_by="ticker")."""
+        symbols = [tickers] if isinstance(tickers, str) else list(tickers)
+        interval = kwargs.get("interval", "1d")
+        if self.mode == "record":
+            start = time.time()
+            raw = real(tickers, **kwargs)
+            self._record_download(raw, symbols, interval, time.time() - start)
+            return raw
+
+        frames, latency = {}, 0.0
+        for symbol in symbols:
+            try:
+                df, recorded = self.get("bars", (symbol, interval))
+            except ReplayMiss:
+                continue
+            latency = max(latency, recorded)
+            frames[symbol] = _slice(df, kwargs.get("period"), kwargs.get("start"), kwargs.get("end"))
+        time.sleep(self.delay_for(latency))
+        if not frames:
+            return pd.DataFrame()
+        if isinstance(tickers, str) and not kwargs.get("multi_level_index", True):
+            return frames[tickers]
+        return pd.concat(frames, axis=1)
+
+    def _record_download(self, raw: pd.DataFrame, symbols: list, interval: str, latency: float):
+        if raw is None or raw.empty:
+            return
+        for symbol in symbols:
+            if isinstance(raw.columns, pd.MultiIndex):
+                if symbol in raw.columns.get_level_values(0):
+                    df = raw[symbol]
+                elif symbol in raw.columns.get_level_values(-1):
+                    df = raw.xs(symbol, axis=1, level=-1)
+                else:
+                    continue
+            elif len(symbols) == 1:
+                df = raw
+            else:
+                continue
+            df = df.dropna(how="all")
+            # Breitesten Frame behalten, neue Kerzen überschreiben alte
+            try:
+                old, _ = self.get("bars", (symbol, interval))
+                df = df.combine_first(old)
+            except ReplayMiss:
+                pass
+            self.put("bars", (symbol, interval), df, latency)
+
+    def ticker(self, real_cls, symbol: str):
+        """Ersatz für yf.Ticker(symbol)."""
+        return _ReplayTicker(self, real_cls, symbol)
+
+
+class _ReplayTicker:
+    """Leitet Attributzugriffe auf das Archiv (bzw. beim Aufzeichnen an den echten Ticker) um."""
+
+    def __init__(self, archive: ReplayArchive, real_cls, symbol: str):
+        self._archive = archive
+        self._real_cls = real_cls
+        self._real = None
+        self.ticker = symbol
+
+    def _real_ticker(self):
+        if self._real is None:
+            self._real = self._real_cls(self.ticker)
+        return self._real
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        archive = self._archive
+        # Methoden (history, get_shares_full, ...) unter (symbol, name, args, kwargs) ablegen
+        if inspect.isfunction(getattr(self._real_cls, name, None)):
+            def call(*a, **kw):
+                key = (self.ticker, name, a, _sorted(kw))
+                if archive.mode == "replay":
+                    return archive._serve("ticker", key)
+                return archive._record("ticker", key, lambda: getattr(self._real_ticker(), name)(*a, **kw))
+            return call
+
+        if archive.mode == "replay":
+            return archive._serve("ticker", (self.ticker, name))
+        attr = getattr(self._real_ticker(), name)
+        convert = _fast_info if name == "fast_info" else (lambda v: v)
+        return archive._record("ticker", (self.ticker, name), lambda: attr, convert)
+
+
+# ─────────────────────────────────────────────
+# HILFSFUNKTIONEN
+# ─────────────────────────────────────────────
+
+def _sorted(params: Optional[dict]) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+
+def _http_key(url: str, params: Optional[dict]) -> tuple:
+    # API-Keys gehören nicht ins Archiv (und nicht in den Schlüssel)
+    return url, tuple((k, v) for k, v in _sorted(params) if k.lower() != "apikey")
+
+def _freeze_response(resp) -> tuple:
+    return resp.status_code, resp.content, dict(resp.headers or {})
+
+def _archivable(resp) -> bool:
+    """304 würde die aufgezeichnete 200er mit leerem Body überschreiben (gleicher Key)."""
+    return resp.status_code != 304
+
+def _fast_info(fi) -> SimpleNamespace:
+    values = {}
+    for field in FAST_INFO_FIELDS:
+        try:
+            values[field] = fi[field] if isinstance(fi, dict) else getattr(fi, field)
+        except Exception:
+            values[field] = None
+    return SimpleNamespace(**values)
+
+def _slice(df: pd.DataFrame, period: Optional[str], start, end) -> pd.DataFrame:
+    """Aufgezeichnete Kerzen wie yf.download auf period bzw. [start, end) zuschneiden."""
+    if period:
+        return trim_to_period(df, period)
+    idx = df.index
+    mask = pd.Series(True, index=idx)
+    for bound, op in ((start, "ge"), (end, "lt")):
+        if bound is None:
+            continue
+        ts = pd.Timestamp(bound)
+        if idx.tz is not None and ts.tz is None:
+            ts = ts.tz_localize(idx.tz)
+        elif idx.tz is None and ts.tz is not None:
+            ts = ts.tz_convert(None)
+        mask &= getattr(pd.Series(idx, index=idx), op)(ts)
+    return df[mask.values]
+
+
+# ─────────────────────────────────────────────
+# AKTIVIERUNG
+# ─────────────────────────────────────────────
+
+_active: Optional[ReplayArchive] = None
+_originals: dict = {}
+
+def activate(archive: ReplayArchive):
+    """Archiv für HTTP und yfinance einhängen (ersetzt yf.download / yf.Ticker)."""
+    global _active
+    deactivate()
+    _originals.update(download=yf.download, Ticker=yf.Ticker)
+    yf.download = lambda tickers, **kw: archive.download(_originals["download"], tickers, **kw)
+    yf.Ticker = lambda symbol, *a, **kw: archive.ticker(_originals["Ticker"], symbol)
+    _active = archive
+    logger.info(f"Provider-{archive.mode}: {archive.root}")
+
+def deactivate():
+    global _active
+    if _originals:
+        yf.download, yf.Ticker = _originals.pop("download"), _originals.pop("Ticker")
+    _active = None
+
+def get_archive() -> Optional[ReplayArchive]:
+    """Aktives Archiv oder None (Live-Betrieb)."""
+    return _active
+
+def activate_from_config():
+    """Aktiviert das Archiv gemäß REPLAY_MODE (config.py), falls gesetzt."""
+    from config import REPLAY_MODE, REPLAY_DIR, REPLAY_LATENCY, REPLAY_LATENCY_SCALE
+    if REPLAY_MODE and _active is None:
+        activate(ReplayArchive(REPLAY_DIR, REPLAY_MODE, latency=REPLAY_LATENCY,
+                               latency_scale=REPLAY_LATENCY_SCALE))
@@ -0,0 +1,219 @@
+"""
+data/symbol_index.py - Lokaler Symbol-Index für Search-as-you-type
+
+Sortiertes Array aus (Token, Art, Ticker) über Ticker und Firmennamen; Präfix-
+Abfragen laufen per Binärsuche, Tippfehler über eine begrenzte Edit-Distanz
+auf Tokens mit gleichem Anfangsbuchstaben.
+
+Befüllt aus:
+- den Screener-Universen (services/screener_service.py) und DEFAULT_WATCHLIST
+- Indizes, Sektor-ETFs, Devisen und Rohstoffen aus config.py (mit Namen)
+- allen bisherigen Ergebnissen der Yahoo-Suche (persistiert in SYMBOL_INDEX_PATH)
+
+Die Yahoo-Suche selbst läuft nur noch zur Anreicherung, wenn lokal zu wenige
+Treffer da sind (siehe OpenBBClient.search_ticker).
+
+Verwendung:
+    from data.symbol_index import get_symbol_index
+    index = get_symbol_index()
+    index.search("nvid")       # [{"ticker": "NVDA", "name": "NVIDIA Corporation", "exchange": "NASDAQ"}]
+    index.add(results)         # Ergebnisse der Remote-Suche übernehmen
+"""
+
+import bisect
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+from loguru import logger
+
+from config import (
+    SYMBOL_INDEX_PATH, DEFAULT_WATCHLIST, MARKET_INDICES, SECTOR_ETFS, FOREX_PAIRS, COMMODITIES,
+)
+
+# Art des Tokens (kleiner = besserer Treffer)
+TICKER, NAME, WORD = 0, 1, 2
+
+_WORD_RE = re.compile(r"[a-z0-9äöüß&]+")
+
+
+def _distance(a: str, b: str, max_d: int) -> int:
+    """Levenshtein-Distanz mit Abbruch, sobald max_d überschritten ist."""
+    if abs(len(a) - len(b)) > max_d:
+        return max_d + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        if min(cur) > max_d:
+            return max_d + 1
+        prev = cur
+    return prev[-1]
+
+
+def _tokens(symbol: dict) -> list:
+    ticker = symbol["ticker"].lower()
+    tokens = [(ticker, TICKER)]
+    # Ticker ohne Präfix/Suffix: "^gdaxi" -> "gdaxi", "sap.de" -> "sap", "eurusd=x" -> "eurusd"
+    base = re.split(r"[.=]", ticker.lstrip("^"))[0]
+    if base and base != ticker:
+        tokens.append((base, TICKER))
+    name = (symbol.get("name") or "").lower().strip()
+    if name:
+        tokens.append((name, NAME))
+        tokens += [(w, WORD) for w in _WORD_RE.findall(name)[1:] if len(w) > 1]
+    return tokens
+
+
+class SymbolIndex:
+    def __init__(self, path: Optional[Path] = SYMBOL_INDEX_PATH):
+        self.path = Path(path) if path else None
+        self._symbols: dict = {}        # ticker -> {"ticker", "name", "exchange"}
+        self._keys: list = []           # sortiert: (token, art, ticker)
+        self._learned: set = set()      # Ticker aus der Remote-Suche (werden persistiert)
+        self._lock = threading.RLock()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker.upper() in self._symbols
+
+    # ─────────────────────────────────────────────
+    # BEFÜLLEN
+    # ─────────────────────────────────────────────
+
+    def add(self, symbols: Iterable[dict], learned: bool = True) -> int:
+        """
+        Symbole übernehmen; bekannte Ticker bekommen fehlende Namen/Börsen ergänzt.
+        learned=True markiert sie als Suchergebnis (werden gespeichert).
+        Rückgabe: Anzahl neuer oder geänderter Einträge.
+        """
+        changed = 0
+        with self._lock:
+            for s in symbols:
+                ticker = (s.get("ticker") or "").upper()
+                if not ticker:
+                    continue
+                old = self._symbols.get(ticker)
+                new = {
+                    "ticker": ticker,
+                    "name": s.get("name") or (old or {}).get("name"),
+                    "exchange": s.get("exchange") or (old or {}).get("exchange") or "N/A",
+                }
+                if learned:
+                    self._learned.add(ticker)
+                if new == old:
+                    continue
+                if old:
+                    self._keys = [k for k in self._keys if k[2] != ticker]
+                for token, kind in _tokens(new):
+                    bisect.insort(self._keys, (token, kind, ticker))
+                self._symbols[ticker] = new
+                changed += 1
+        if changed and learned:
+            self.save()
+        return changed
+
+    def seed_defaults(self):
+        """Screener-Universen, Watchlist und die Listen aus config.py (nicht persistiert)."""
+        seeds = [{"ticker": t, "name": name} for t, name in MARKET_INDICES.items()]
+        seeds += [{"ticker": t, "name": f"{sector} Sector ETF"} for sector, t in SECTOR_ETFS.items()]
+        seeds += [{"ticker": t, "name": name} for t, name in COMMODITIES.items()]
+        seeds += [{"ticker": t, "name": f"{t[:3]}/{t[3:6]}"} for t in FOREX_PAIRS]
+        seeds += [{"ticker": t} for t in DEFAULT_WATCHLIST]
+        try:
+            # Lazy: der Screener-Service importiert selbst den Client
+            from services.screener_service import UNIVERSES
+            seeds += [{"ticker": t} for universe in UNIVERSES.values() for t in universe]
+        except ImportError as e:
+            logger.warning(f"Screener-Universen nicht verfügbar: {e}")
+        self.add(seeds, learned=False)
+
+    # ─────────────────────────────────────────────
+    # SUCHE
+    # ─────────────────────────────────────────────
+
+    def _prefix_range(self, prefix: str):
+        lo = bisect.bisect_left(self._keys, (prefix,))
+        for i in range(lo, len(self._keys)):
+            key = self._keys[i]
+            if not key[0].startswith(prefix):
+                break
+            yield key
+
+    def search(self, query: str, limit: int = 10, fuzzy: bool = True) -> list:
+        """Präfix-Treffer (Ticker vor Name vor Namenswort), danach Tippfehler-Treffer."""
+        q = (query or "").strip().lower()
+        if not q:
+            return []
+        with self._lock:
+            ranks = {}
+            for token, kind, ticker in self._prefix_range(q):
+                rank = (kind, token != q, len(ticker), 0)
+                if rank < ranks.get(ticker, (9,)):
+                    ranks[ticker] = rank
+
+            if fuzzy and len(ranks) < limit and len(q) >= 4:
+                max_d = 1 if len(q) < 6 else 2
+                for token, kind, ticker in self._prefix_range(q[0]):
+                    if ticker in ranks:
+                        continue
+                    d = _distance(q, token[:len(q)], max_d)
+                    if d <= max_d:
+                        rank = (3 + kind, True, len(ticker), d)
+                        if rank < ranks.get(ticker, (9,)):
+                            ranks[ticker] = rank
+
+            best = sorted(ranks, key=lambda t: (ranks[t], t))[:limit]
+            return [dict(self._symbols[t]) for t in best]
+
+    # ─────────────────────────────────────────────
+    # PERSISTENZ
+    # ─────────────────────────────────────────────
+
+    def _load(self):
+        if not self.path or not self.path.exists():
+            return
+        try:
+            self.add(json.loads(self.path.read_text(encoding="utf-8")), learned=False)
+            self._learned.update(self._symbols)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Symbol-Index nicht lesbar ({self.path}): {e}")
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = [self._symbols[t] for t in sorted(self._learned) if t in self._symbols]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Symbol-Index nicht gespeichert: {e}")
+
+
+# ─────────────────────────────────────────────
+# SINGLETON
+# ─────────────────────────────────────────────
+
+_index_instance: Optional[SymbolIndex] = None
+_index_lock = threading.Lock()
+
+def get_symbol_index() -> SymbolIndex:
+    """Gibt globale SymbolIndex-Instanz zurück (beim ersten Aufruf befüllt)."""
+    global _index_instance
+    if _index_instance is None:
+        with _index_lock:
+            if _index_instance is None:
+                index = SymbolIndex()
+                index.seed_defaults()
+                _index_instance = index
+    return _index_instance
@@ -4,6 +4,8 @@ indicators/technical.py - Technische Indikatoren via Pandas/Numpy
 import pandas as pd
 import numpy as np
 
+from utils.tracing import traced
+
 class TechnicalIndicators:
     def __init__(self, df: pd.DataFrame):
         # Wir arbeiten auf einer Kopie, um Warnungen zu vermeiden
@@ -14,18 +16,21 @@ class TechnicalIndicators:
         """Gibt das modifizierte DataFrame zurück."""
         return self._df
 
+    @traced("indicators.sma")
     def add_sma(self, periods: list = [20, 50, 200]):
         """Simple Moving Average (SMA)"""
         for p in periods:
             self._df[f'sma_{p}'] = self._df['close'].rolling(window=p).mean()
         return self
 
+    @traced("indicators.ema")
     def add_ema(self, periods: list = [9, 21]):
         """Exponential Moving Average (EMA)"""
         for p in periods:
             self._df[f'ema_{p}'] = self._df['close'].ewm(span=p, adjust=False).mean()
         return self
 
+    @traced("indicators.rsi")
     def add_rsi(self, period: int = 14):
         """Relative Strength Index (RSI)"""
         delta = self._df['close'].diff()
@@ -35,6 +40,7 @@ class TechnicalIndicators:
         self._df['rsi'] = 100 - (100 / (1 + rs))
         return self
 
+    @traced("indicators.macd")
     def add_macd(self, fast: int = 12, slow: int = 26, signal: int = 9):
         """Moving Average Convergence Divergence (MACD)"""
         ema_fast = self._df['close'].ewm(span=fast, adjust=False).mean()
@@ -44,6 +50,7 @@ class TechnicalIndicators:
         self._df['macd_hist'] = self._df['macd'] - self._df['macd_signal']
         return self
 
+    @traced("indicators.bollinger_bands")
     def add_bollinger_bands(self, period: int = 20, std: int = 2):
         """Bollinger Bands"""
         sma = self._df['close'].rolling(window=period).mean()
@@ -53,6 +60,7 @@ class TechnicalIndicators:
         self._df['bb_lower'] = sma - (std_dev * std)
         return self
 
+    @traced("indicators.atr")
     def add_atr(self, period: int = 14):
         """Average True Range (ATR)"""
         high_low = self._df['high'] - self._df['low']
@@ -62,17 +70,20 @@ class TechnicalIndicators:
         self._df['atr'] = tr.rolling(window=period).mean()
         return self
 
+    @traced("indicators.obv")
     def add_obv(self):
         """On-Balance Volume (OBV)"""
         obv = (np.sign(self._df['close'].diff()) * self._df['volume']).fillna(0).cumsum()
         self._df['obv'] = obv
         return self
 
+    @traced("indicators.volume_ma")
     def add_volume_ma(self, period: int = 20):
         """Volume Moving Average"""
         self._df['volume_ma'] = self._df['volume'].rolling(window=period).mean()
         return self
 
+    @traced("indicators.vwap")
     def add_vwap(self):
         """Volume Weighted Average Price (VWAP)"""
         tp = (self._df['high'] + self._df['low'] + self._df['close']) / 3
@@ -11,10 +11,13 @@ from data.openbb_client import get_client
 from ui.components.metrics import price_header
 from ui.components.tables import financial_statement_table
 from ui.components.charts import render_target_price_chart, render_recommendation_gauge
+from ui.components.sidebar import render_provider_status
 from utils.formatters import fmt_large
+from utils.tracing import page_trace, span
 
 # --- CONFIG ---
 st.set_page_config(page_title="Terminal", page_icon="💻", layout="wide")
+page_trace("Terminal")
 
 st.markdown("""
 <style>
@@ -111,7 +114,7 @@ def search_ticker_api(searchterm: str):
     if not searchterm: 
         return []
     
-    # Suche via Client (Yahoo/FMP)
+    # Lokaler Symbol-Index (Yahoo-Suche nur zur Anreicherung im Hintergrund)
     results = client.search_ticker(searchterm)
     
     # Formatierung für das Dropdown: "NVDA | NVIDIA Corp (NASDAQ)" -> "NVDA"
@@ -137,6 +140,8 @@ with st.container():
         st.rerun()
 
 # --- SMART CONFIG ---
+# Tages-basierte Ranges teilen sich eine Kerzen-Datei im OHLCV-Store: kürzere Zeiträume
+# werden daraus geschnitten, 1wk/1mo lokal aus Tageskerzen gebaut
 SMART_RANGES = {
     "1D": {"label": "1D", "api_interval": "1m", "api_period": "5d", "bar_spacing": 2.5, "desc": "Intraday"},
     "1W": {"label": "1W", "api_interval": "15m", "api_period": "1mo", "bar_spacing": 5.5, "desc": "Week"},
@@ -205,13 +210,14 @@ with main_col:
         date_col = next((c for c in df_chart.columns if 'date' in c or 'time' in c), None)
         
         if date_col:
-            if current_cfg["api_interval"] in ["1m", "5m", "15m", "30m", "1h", "90m"]:
-                df_chart['time'] = pd.to_datetime(df_chart[date_col]).astype('int64') // 10**9
-            else:
-                df_chart['time'] = pd.to_datetime(df_chart[date_col]).dt.strftime('%Y-%m-%d')
-            
-            candles_data = df_chart[['time', 'open', 'high', 'low', 'close']].to_dict('records')
-            vol_data = [{'time': r['time'], 'value': r['volume'], 'color': 'rgba(0, 200, 5, 0.5)' if r['close'] >= r['open'] else 'rgba(255, 59, 48, 0.5)'} for _, r in df_chart.iterrows()]
+            with span("chart.payload", bars=len(df_chart)):
+                if current_cfg["api_interval"] in ["1m", "5m", "15m", "30m", "1h", "90m"]:
+                    df_chart['time'] = pd.to_datetime(df_chart[date_col]).astype('int64') // 10**9
+                else:
+                    df_chart['time'] = pd.to_datetime(df_chart[date_col]).dt.strftime('%Y-%m-%d')
+
+                candles_data = df_chart[['time', 'open', 'high', 'low', 'close']].to_dict('records')
+                vol_data = [{'time': r['time'], 'value': r['volume'], 'color': 'rgba(0, 200, 5, 0.5)' if r['close'] >= r['open'] else 'rgba(255, 59, 48, 0.5)'} for _, r in df_chart.iterrows()]
 
             chart_options = {
                 "layout": {"background": {"type": 'solid', "color": '#131722'}, "textColor": '#d1d4dc'},
@@ -222,10 +228,11 @@ with main_col:
                 "height": 600
             }
             
-            renderLightweightCharts([
-                {"chart": chart_options, "series": [{"type": 'Candlestick', "data": candles_data, "options": {"upColor": '#00C805', "downColor": '#FF3B30', "borderVisible": False, "wickUpColor": '#00C805', "wickDownColor": '#FF3B30'}}]},
-                {"chart": {"height": 100, "layout": chart_options["layout"], "timeScale": chart_options["timeScale"]}, "series": [{"type": 'Histogram', "data": vol_data, "options": {"priceFormat": {"type": 'volume'}}}]}
-            ], key=f"tv_{ticker}_{st.session_state.selected_range}")
+            with span("render.chart"):
+                renderLightweightCharts([
+                    {"chart": chart_options, "series": [{"type": 'Candlestick', "data": candles_data, "options": {"upColor": '#00C805', "downColor": '#FF3B30', "borderVisible": False, "wickUpColor": '#00C805', "wickDownColor": '#FF3B30'}}]},
+                    {"chart": {"height": 100, "layout": chart_options["layout"], "timeScale": chart_options["timeScale"]}, "series": [{"type": 'Histogram', "data": vol_data, "options": {"priceFormat": {"type": 'volume'}}}]}
+                ], key=f"tv_{ticker}_{st.session_state.selected_range}")
     else:
         st.info("Chart Daten werden geladen oder sind nicht verfügbar...")
 
@@ -300,4 +307,6 @@ with side_col:
             """, unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
     else:
-        st.caption("No news found.")
\ No newline at end of file
+        st.caption("No news found.")
+
+render_provider_status()
@@ -6,6 +6,7 @@ import streamlit as st
 import pandas as pd
 from services.screener_service import get_screener_service, UNIVERSES
 from ui.components.tables import screener_result_table
+from utils.tracing import page_trace
 
 # Beispiel für den Anfang deiner pages/1_charts.py Datei:
 
@@ -21,6 +22,7 @@ if ticker != current_ticker:
     st.session_state["current_ticker"] = ticker
 
 st.set_page_config(page_title="Screener", page_icon="🔍", layout="wide")
+page_trace("Screener")
 
 st.sidebar.title("🔍 Stock Screener")
 st.sidebar.caption("Filtere Aktien nach deinen Kriterien")
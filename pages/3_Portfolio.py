@@ -25,6 +25,7 @@ from datetime import datetime
 from data.openbb_client import get_client
 from services.portfolio_service import get_portfolio_service
 from utils.formatters import fmt_price, fmt_pct, fmt_large, color_pct, trend_arrow
+from utils.tracing import page_trace, span
 
 # Beispiel für den Anfang deiner pages/1_charts.py Datei:
 
@@ -40,6 +41,7 @@ if ticker != current_ticker:
     st.session_state["current_ticker"] = ticker
 
 st.set_page_config(page_title="Portfolio", page_icon="💼", layout="wide")
+page_trace("Portfolio")
 
 # ─────────────────────────────────────────────
 def get_positions(): return st.session_state.get("portfolio_positions", [])
@@ -97,8 +99,9 @@ client = get_client()
 
 with st.spinner("Lade aktuelle Kurse..."):
     enriched = []
+    quotes = client.get_quotes([pos["ticker"] for pos in positions], lite=True)
     for pos in positions:
-        quote     = client.get_quote(pos["ticker"])
+        quote     = quotes[pos["ticker"]]
         cur_price = quote.get("price", pos["buy_price"])
         cost      = pos["qty"] * pos["buy_price"]
         mv        = pos["qty"] * cur_price
@@ -234,7 +237,8 @@ with tab2:
                 xaxis=dict(gridcolor="#1e2329"),
                 legend=dict(x=0.01, y=0.99),
             )
-            st.plotly_chart(fig_perf, use_container_width=True)
+            with span("render.performance"):
+                st.plotly_chart(fig_perf, use_container_width=True)
 
         # Benchmark-Vergleich Metriken
         if bench_inf:
@@ -21,7 +21,9 @@ import plotly.express as px
 from datetime import datetime
 
 from data.openbb_client import get_client
+from data.bars import trim_to_period
 from utils.formatters import fmt_price, fmt_pct, color_pct, trend_arrow
+from utils.tracing import page_trace
 
 # Beispiel für den Anfang deiner pages/1_charts.py Datei:
 
@@ -37,6 +39,7 @@ if ticker != current_ticker:
     st.session_state["current_ticker"] = ticker
 
 st.set_page_config(page_title="Makro", page_icon="🌍", layout="wide")
+page_trace("Makro")
 
 # ─────────────────────────────────────────────
 client = get_client()
@@ -71,9 +74,10 @@ with tab1:
     yields_prev    = {}
 
     with st.spinner("Lade Treasury-Daten..."):
+        treasury_quotes = client.get_quotes(list(TREASURIES.values()), lite=True)
         for label, symbol in TREASURIES.items():
             try:
-                q = client.get_quote(symbol)
+                q = treasury_quotes[symbol]
                 yields_current[label] = q.get("price", 0)
                 yields_prev[label]    = q.get("price", 0) - q.get("change", 0)
             except Exception:
@@ -188,9 +192,14 @@ with tab2:
 
     sector_perf = {}
     with st.spinner("Lade Sektor-Daten..."):
+        # Einmal 1 Jahr laden, kürzere Zeiträume lokal schneiden (ein Download pro Ticker)
+        panel = client.get_price_histories(list(SECTOR_ETFS.values()), "1y", "1d")
+        loaded = set(panel.columns.get_level_values(0)) if not panel.empty else set()
         for sector, etf in SECTOR_ETFS.items():
+            if etf not in loaded:
+                continue
             try:
-                df_s = client.get_price_history(etf, period, "1d")
+                df_s = trim_to_period(panel[etf].dropna(), period)
                 if not df_s.empty and len(df_s) >= 2:
                     change = (df_s["close"].iloc[-1] / df_s["close"].iloc[0] - 1)
                     sector_perf[sector] = float(change)
@@ -252,9 +261,10 @@ with tab3:
             "USD/CNY": "USDCNY=X",
         }
 
+        forex_quotes = client.get_quotes(list(FOREX.values()), lite=True)
         for pair, symbol in FOREX.items():
             try:
-                q = client.get_quote(symbol)
+                q = forex_quotes[symbol]
                 price  = q.get("price", 0)
                 change = q.get("change_pct", 0)
                 color  = color_pct(change)
@@ -283,9 +293,10 @@ with tab3:
             "Kupfer":      ("HG=F",  "🔶"),
         }
 
+        commodity_quotes = client.get_quotes([symbol for symbol, _ in COMMODITIES.values()], lite=True)
         for name, (symbol, icon) in COMMODITIES.items():
             try:
-                q = client.get_quote(symbol)
+                q = commodity_quotes[symbol]
                 price  = q.get("price", 0)
                 change = q.get("change_pct", 0)
                 color  = color_pct(change)
@@ -0,0 +1,222 @@
+"""
+pages/7_diagnostics.py - Cache- und Provider-Diagnose
+
+Zeigt:
+- Trefferquote pro gecachter Client-Methode (L1 Memory, L2 Disk, Stale, Miss)
+- p50/p95 der Fetch-Latenz pro Methode und pro Provider (Router)
+- Belegung und Evictions des Memory-Caches, Treffer im Disk-Cache
+- die größten Einträge im Memory-Cache
+- Rate Limits und Circuit Breaker
+- Fortschritt des Cache-Warm-ups beim Prozessstart
+- die heißesten Keys und den Hintergrund-Refresh, der sie frisch hält
+- die letzten Traces (Spans pro Rerun) mit Export als JSON / Chrome Trace
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+import streamlit as st
+import pandas as pd
+
+from data.openbb_client import get_client, memory_cache_snapshot, largest_entries, cache_expiry
+from data.cache_manager import get_cache
+from data.cache_stats import cache_stats, key_label, reset_cache_stats
+from data.rate_limiter import limiter_stats
+from data.circuit_breaker import breaker_stats
+from data.ohlcv_store import get_ohlcv_store
+from data.cache_warmer import get_warmer, start_warmup
+from data.refresh_scheduler import get_tracker, get_scheduler
+from utils.tracing import recent_traces, export, clear_trace
+
+st.set_page_config(page_title="Diagnose", page_icon="🩺", layout="wide")
+clear_trace()   # die Diagnose selbst nicht in den Trace der letzten Seite schreiben
+
+client = get_client()
+
+st.markdown("## 🩺 Cache & Provider Diagnose")
+st.caption("Live-Zähler seit Prozessstart – Grundlage für TTLs und Speicherbudgets")
+
+c_refresh, c_reset, _ = st.columns([1, 1, 6])
+if c_refresh.button("🔄 Aktualisieren"):
+    st.rerun()
+if c_reset.button("🧹 Zähler zurücksetzen"):
+    reset_cache_stats()
+    st.rerun()
+
+# ─────────────────────────────────────────────
+# KENNZAHLEN
+# ─────────────────────────────────────────────
+rows = cache_stats()
+mem = memory_cache_snapshot()
+largest = largest_entries(15)
+disk = get_cache().stats()
+
+lookups = sum(r["l1_hits"] + r["l2_hits"] + r["stale"] + r["misses"] for r in rows)
+hits = sum(r["l1_hits"] + r["l2_hits"] + r["stale"] for r in rows)
+
+k1, k2, k3, k4 = st.columns(4)
+k1.metric("Trefferquote gesamt", f"{hits / lookups:.1%}" if lookups else "–", f"{lookups} Aufrufe", delta_color="off")
+k2.metric("Memory-Cache", f"{mem['size_mb']} MB", f"{mem['entries']} Einträge / {mem['max_bytes'] // 1024 // 1024} MB Budget",
+          delta_color="off")
+k3.metric("Disk-Cache", f"{disk.get('size_mb', 0)} MB", f"{disk.get('entries', 0)} Einträge", delta_color="off")
+k4.metric("Disk-Trefferquote", f"{disk['hit_ratio']:.1%}" if disk.get("hit_ratio") is not None else "–",
+          f"{disk.get('hits', 0)} Treffer / {disk.get('misses', 0)} Misses", delta_color="off")
+
+# ─────────────────────────────────────────────
+# WARM-UP
+# ─────────────────────────────────────────────
+warmup = get_warmer().status()
+w_head, w_button = st.columns([6, 1])
+w_head.markdown(f"### 🔥 Cache Warm-up · `{warmup['state']}`"
+                + (f" · {warmup['seconds']} s" if warmup["seconds"] is not None else ""))
+if w_button.button("Neu aufwärmen", disabled=warmup["state"] == "running"):
+    start_warmup(client, force=True)
+    st.rerun()
+if warmup["stages"]:
+    w_cols = st.columns(len(warmup["stages"]))
+    for col, stage in zip(w_cols, warmup["stages"]):
+        finished = stage["done"] + stage["failed"]
+        col.progress(finished / stage["total"] if stage["total"] else 1.0,
+                     text=f"{stage['stage']}: {stage['done']}/{stage['total']}"
+                          + (f" ({stage['failed']} fehlgeschlagen)" if stage["failed"] else "")
+                          + (f" · {stage['seconds']} s" if stage["seconds"] is not None else ""))
+else:
+    st.caption("Warm-up nicht gestartet (OPENBB_WARMUP=0).")
+
+# ─────────────────────────────────────────────
+# PRO METHODE
+# ─────────────────────────────────────────────
+st.markdown("### 📊 Client-Methoden")
+if rows:
+    df = pd.DataFrame(rows).set_index("namespace")
+    ns_mem = mem["namespaces"]
+    df["mem_entries"] = [ns_mem.get(ns, {}).get("entries", 0) for ns in df.index]
+    df["mem_mb"] = [round(ns_mem.get(ns, {}).get("bytes", 0) / 1024 / 1024, 2) for ns in df.index]
+    df = df.sort_values("p95_ms", ascending=False, na_position="last")
+    st.dataframe(
+        df,
+        use_container_width=True,
+        column_config={
+            "hit_ratio": st.column_config.ProgressColumn("Trefferquote", min_value=0, max_value=1, format="%.2f"),
+            "p50_ms": st.column_config.NumberColumn("p50 Fetch (ms)"),
+            "p95_ms": st.column_config.NumberColumn("p95 Fetch (ms)"),
+        },
+    )
+else:
+    st.info("Noch keine Cache-Zugriffe in diesem Prozess.")
+
+col_ev, col_disk = st.columns(2)
+with col_ev:
+    st.markdown("**Evictions Memory-Cache**")
+    if mem["evictions"]:
+        st.dataframe(pd.Series(mem["evictions"], name="Anzahl"), use_container_width=True)
+    else:
+        st.caption("Keine Evictions.")
+with col_disk:
+    st.markdown("**Disk-Cache pro Namespace**")
+    if disk.get("namespaces"):
+        st.dataframe(pd.DataFrame(disk["namespaces"]).T, use_container_width=True)
+    else:
+        st.caption("Noch keine Zugriffe.")
+
+# ─────────────────────────────────────────────
+# GRÖSSTE EINTRÄGE
+# ─────────────────────────────────────────────
+st.markdown("### 🐘 Größte Einträge im Memory-Cache")
+if largest:
+    now = time.time()
+    st.dataframe(pd.DataFrame([{
+        "Aufruf": key_label(e["key"]),
+        "Namespace": e["namespace"],
+        "KB": round(e["bytes"] / 1024, 1),
+        "läuft ab in (s)": round(e["expires"] - now) if e["expires"] else None,
+    } for e in largest]), use_container_width=True, hide_index=True)
+else:
+    st.caption("Memory-Cache ist leer.")
+
+# ─────────────────────────────────────────────
+# HOT KEYS
+# ─────────────────────────────────────────────
+st.markdown("### 🔥 Hot Keys (Hintergrund-Refresh)")
+scheduler = get_scheduler()
+if scheduler:
+    s_stats = scheduler.stats()
+    h1, h2, h3, h4 = st.columns(4)
+    h1.metric("Keys beobachtet", s_stats["tracked_keys"])
+    h2.metric("Refreshes", s_stats["refreshed"])
+    h3.metric("Runden", s_stats["ticks"])
+    h4.metric("Ausgesetzt (Rate Limit)", s_stats["skipped_ticks"])
+else:
+    st.caption("Hintergrund-Refresh ist abgeschaltet (OPENBB_HOT_REFRESH=0) – Popularität wird trotzdem gezählt.")
+hot = get_tracker().hottest(20)
+if hot:
+    now = time.time()
+    hot_rows = []
+    for key, score, namespace, _, _ in hot:
+        expires = cache_expiry(key, namespace)
+        hot_rows.append({
+            "Aufruf": key_label(key),
+            "Score": round(score, 1),
+            "läuft ab in (s)": round(expires - now) if expires else None,
+        })
+    st.dataframe(pd.DataFrame(hot_rows), use_container_width=True, hide_index=True)
+else:
+    st.caption("Noch keine Zugriffe auf Quotes oder Historien.")
+
+# ─────────────────────────────────────────────
+# PROVIDER
+# ─────────────────────────────────────────────
+st.markdown("### 🌐 Provider")
+p1, p2 = st.columns(2)
+with p1:
+    st.markdown("**Router (Quote / Financials)**")
+    router_rows = client.router.stats()
+    if router_rows:
+        st.dataframe(pd.DataFrame(router_rows).set_index("provider"), use_container_width=True)
+    else:
+        st.caption("Noch keine Router-Aufrufe.")
+    st.markdown("**Circuit Breaker**")
+    breakers = breaker_stats()
+    if breakers:
+        st.dataframe(pd.DataFrame(breakers).set_index("name"), use_container_width=True)
+    else:
+        st.caption("Alle Provider ohne Fehler.")
+with p2:
+    st.markdown("**Rate Limits**")
+    limits = limiter_stats()
+    if limits:
+        st.dataframe(pd.DataFrame(limits).set_index("name"), use_container_width=True)
+    else:
+        st.caption("Noch keine Requests.")
+    st.markdown("**OHLCV-Store**")
+    st.json(get_ohlcv_store().stats(), expanded=False)
+
+# ─────────────────────────────────────────────
+# TRACES
+# ─────────────────────────────────────────────
+st.markdown("### ⏱️ Traces der letzten Reruns")
+traces = recent_traces()
+if traces:
+    choice = st.selectbox(
+        "Trace", range(len(traces)),
+        format_func=lambda i: f"{traces[i].name} – {time.strftime('%H:%M:%S', time.localtime(traces[i].started_at))}"
+                              f" ({traces[i].duration * 1000:.0f} ms)",
+    )
+    selected = traces[choice]
+    trace_df = pd.DataFrame(selected.rows())
+    trace_df["span"] = ["\u2003" * d + name for d, name in zip(trace_df.pop("depth"), trace_df["span"])]
+    st.dataframe(
+        trace_df, use_container_width=True, hide_index=True,
+        column_config={"share": st.column_config.ProgressColumn("Anteil", min_value=0, max_value=1, format="%.2f")},
+    )
+    if selected.dropped:
+        st.caption(f"{selected.dropped} Spans verworfen (TRACE_MAX_SPANS)")
+    d1, d2, _ = st.columns([1, 1, 4])
+    d1.download_button("📥 JSON", export([selected]), file_name="trace.json", mime="application/json")
+    d2.download_button("📥 Chrome Trace", export(traces, fmt="chrome"), file_name="trace_chrome.json",
+                       mime="application/json", help="Alle Traces – öffnen in chrome://tracing oder ui.perfetto.dev")
+else:
+    st.caption("Noch keine Traces – eine andere Seite öffnen.")
@@ -3,9 +3,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import streamlit as st
 import pandas as pd
-import requests
 import json
 from services.technical_analysis_service import get_technical_analysis_service
+from data.http_session import http_post
+from utils.tracing import page_trace, span
 
 # --- CONFIG ---
 st.set_page_config(
@@ -13,6 +14,7 @@ st.set_page_config(
     page_icon="📊",
     layout="wide"
 )
+page_trace("Technische Analyse")
 
 st.markdown("""
 <style>
@@ -169,7 +171,8 @@ with col2:
         margin=dict(l=20, r=20, t=50, b=20)
     )
 
-    st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+    with span("render.gauge"):
+        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
 
 with col3:
     st.markdown("### 📈 Preis")
@@ -222,8 +225,8 @@ if api_key:
             "contents": [{"parts": [{"text": prompt}]}]
         }
 
-        with st.spinner("Generiere KI-Analyse..."):
-            response = requests.post(
+        with st.spinner("Generiere KI-Analyse..."), span("gemini.generate"):
+            response = http_post(
                 f"{url}?key={api_key}",
                 headers=headers,
                 json=payload,
@@ -3,10 +3,13 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import streamlit as st
 import pandas as pd
-import requests
 from services.technical_analysis_service import get_technical_analysis_service
 from services.market_service import get_market_service
 from data.openbb_client import get_client
+from data.async_client import get_async_client, run_sync
+from ui.components.sidebar import render_provider_status
+from data.http_session import http_post
+from utils.tracing import page_trace
 
 # --- CONFIG ---
 st.set_page_config(
@@ -14,6 +17,7 @@ st.set_page_config(
     page_icon="🤖",
     layout="wide"
 )
+page_trace("AI Analyst")
 
 # CSS
 st.markdown("""
@@ -86,24 +90,20 @@ client = get_client()
 market_svc = get_market_service()
 tech_svc = get_technical_analysis_service()
 
-# Fetch all data in parallel
+# Fetch all data in parallel (ein Event-Loop-Durchlauf)
 with st.spinner(f"Lade Daten für {ticker}..."):
-    # Quote data
-    quote = client.get_quote(ticker)
+    aclient = get_async_client()
+    quote, df, analyst, news, stats = run_sync(
+        aclient.get_quote(ticker),
+        aclient.run(tech_svc.get_price_data, ticker, period="3mo"),
+        aclient.run(market_svc.get_analyst_info, ticker),
+        aclient.get_news(ticker, limit=5),
+        aclient.run(client.get_key_stats, ticker),
+    )
 
     # Technical analysis
-    df = tech_svc.get_price_data(ticker, period="3mo")
     tech_analysis = tech_svc.analyze_indicators(df) if not df.empty else {}
 
-    # Analyst data
-    analyst = market_svc.get_analyst_info(ticker)
-
-    # News
-    news = client.get_news(ticker, limit=5)
-
-    # Key stats
-    stats = client.get_key_stats(ticker)
-
 if not quote:
     st.error(f"Keine Daten für {ticker} gefunden.")
     st.stop()
@@ -177,7 +177,7 @@ Antworte im JSON Format:
         payload = {"contents": [{"parts": [{"text": prompt}]}]}
 
         with st.spinner("🤖 KI analysiert..."):
-            response = requests.post(f"{url}?key={api_key}", headers=headers, json=payload, timeout=30)
+            response = http_post(f"{url}?key={api_key}", headers=headers, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
@@ -333,3 +333,5 @@ with st.expander("📋 Alle Key Statistics"):
             cols = st.columns(4)
             for i, (k, v) in enumerate(items.items()):
                 cols[i % 4].metric(k, str(v))
+
+render_provider_status()
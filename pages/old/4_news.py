@@ -65,24 +65,15 @@ with tab2:
     watchlist = st.session_state.get("watchlist", ["AAPL","MSFT","NVDA","GOOGL"])
     st.caption(f"Aggregierte News für: {', '.join(watchlist)}")
     if st.button("🔄 Watchlist News laden", type="primary"):
-        all_news = []
-        prog = st.progress(0)
-        for i, wl_ticker in enumerate(watchlist):
-            prog.progress((i+1)/len(watchlist), text=f"Lade {wl_ticker}...")
-            items = client.get_news(wl_ticker, limit=3)
-            for item in items:
-                item["_ticker"] = wl_ticker
-                all_news.append(item)
-        prog.empty()
-        all_news.sort(key=lambda x: x.get("published",0) or 0, reverse=True)
-        st.session_state["watchlist_news"] = all_news
+        with st.spinner("Lade Watchlist News..."):
+            st.session_state["watchlist_news"] = client.get_news_many(watchlist, limit=3)
 
     wl_news = st.session_state.get("watchlist_news",[])
     if wl_news:
         for item in wl_news[:30]:
             c1, c2 = st.columns([5,1])
             with c1: st.markdown(f"**[{item.get('title','')}]({item.get('url','#')})**")
-            with c2: st.markdown(f"`{item.get('_ticker','')}` · {item.get('source','')}")
+            with c2: st.markdown(f"`{', '.join(item.get('tickers') or [])}` · {item.get('source','')}")
             st.divider()
     else:
         st.info("Klicke auf 'Watchlist News laden' um News für alle Watchlist-Aktien zu sehen.")
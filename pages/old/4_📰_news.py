@@ -79,36 +79,24 @@ with tab2:
     st.caption(f"Aggregierte News für: {', '.join(watchlist)}")
 
     if st.button("🔄 Watchlist News laden", type="primary"):
-        all_news = []
-        progress = st.progress(0)
-
-        for i, wl_ticker in enumerate(watchlist):
-            progress.progress((i + 1) / len(watchlist), text=f"Lade {wl_ticker}...")
-            items = client.get_news(wl_ticker, limit=3)
-            for item in items:
-                item["_ticker"] = wl_ticker
-                all_news.append(item)
-
-        progress.empty()
-
-        # Nach Datum sortieren
-        all_news.sort(key=lambda x: x.get("published", 0) or 0, reverse=True)
-        st.session_state["watchlist_news"] = all_news
+        # Ein Aufruf für die ganze Watchlist: Feeds parallel, Dubletten zusammengeführt
+        with st.spinner("Lade Watchlist News..."):
+            st.session_state["watchlist_news"] = client.get_news_many(watchlist, limit=3)
 
     wl_news = st.session_state.get("watchlist_news", [])
     if wl_news:
         for item in wl_news[:30]:
-            wl_ticker = item.get("_ticker", "")
-            title     = item.get("title", "")
-            url       = item.get("url", "#")
-            source    = item.get("source", "")
-            published = item.get("published")
+            wl_tickers = ", ".join(item.get("tickers") or [])
+            title      = item.get("title", "")
+            url        = item.get("url", "#")
+            source     = item.get("source", "")
+            published  = item.get("published")
 
             col1, col2 = st.columns([5, 1])
             with col1:
                 st.markdown(f"**[{title}]({url})**")
             with col2:
-                st.markdown(f"`{wl_ticker}` · {source}")
+                st.markdown(f"`{wl_tickers}` · {source}")
             st.divider()
     else:
         st.info("Klicke auf 'Watchlist News laden' um News für alle Watchlist-Aktien zu sehen.")
@@ -22,6 +22,9 @@ from loguru import logger
 
 from data.openbb_client import get_client
 from config import RISK_FREE_RATE, TRADING_DAYS_PER_YEAR
+from utils.tracing import traced
+
+BENCHMARK_SYMBOL = "^GSPC"
 
 
 class PortfolioService:
@@ -39,6 +42,7 @@ class PortfolioService:
     # HAUPT-METHODE
     # ─────────────────────────────────────────
 
+    @traced("portfolio.analytics")
     def get_full_analytics(self, positions: list[dict]) -> dict:
         """
         Berechnet alle Portfolio-Metriken auf einmal.
@@ -52,7 +56,7 @@ class PortfolioService:
         tickers = [p["ticker"] for p in positions]
 
         # 1. Historische Preise laden
-        price_data = self._load_price_history(tickers)
+        price_data = self._load_price_history(tickers, prefetch=[BENCHMARK_SYMBOL])
         if price_data.empty:
             return {}
 
@@ -92,17 +96,27 @@ class PortfolioService:
     # DATEN LADEN
     # ─────────────────────────────────────────
 
-    def _load_price_history(self, tickers: list[str], period: str = "1y") -> pd.DataFrame:
-        """Lädt Close-Preise für alle Ticker als DataFrame (Spalten = Ticker)."""
-        dfs = {}
-        for ticker in tickers:
-            try:
-                df = self.client.get_price_history(ticker, period, "1d")
-                if not df.empty:
-                    dfs[ticker] = df["close"]
-            except Exception as e:
-                logger.warning(f"Preisverlauf für {ticker} fehlgeschlagen: {e}")
+    @traced("portfolio.load_prices")
+    def _load_price_history(
+        self, tickers: list[str], period: str = "1y", prefetch: Optional[list[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Lädt Close-Preise für alle Ticker als DataFrame (Spalten = Ticker).
+
+        Alle Ticker (plus `prefetch`, z.B. der Benchmark) werden in einem Batch geladen;
+        die prefetch-Ticker landen nur im Cache und nicht im Ergebnis.
+        """
+        try:
+            panel = self.client.get_price_histories(tickers + (prefetch or []), period, "1d")
+        except Exception as e:
+            logger.warning(f"Preisverlauf für {tickers} fehlgeschlagen: {e}")
+            return pd.DataFrame()
 
+        if panel.empty:
+            return pd.DataFrame()
+
+        loaded = set(panel.columns.get_level_values(0))
+        dfs = {t: panel[t]["close"] for t in tickers if t in loaded}
         if not dfs:
             return pd.DataFrame()
 
@@ -110,7 +124,8 @@ class PortfolioService:
         combined.index = pd.to_datetime(combined.index)
         return combined.dropna(how="all")
 
-    def _benchmark_returns(self, symbol: str = "^GSPC") -> pd.Series:
+    @traced("portfolio.benchmark_returns")
+    def _benchmark_returns(self, symbol: str = BENCHMARK_SYMBOL) -> pd.Series:
         """S&P 500 als Benchmark laden."""
         try:
             df = self.client.get_price_history(symbol, "1y", "1d")
@@ -165,6 +180,7 @@ class PortfolioService:
             return pd.Series(dtype=float)
         return (1 + returns).cumprod() - 1
 
+    @traced("portfolio.metrics")
     def _calculate_metrics(self, returns: pd.Series) -> dict:
         """
         Berechnet alle wichtigen Risiko-/Rendite-Kennzahlen.
@@ -226,6 +242,7 @@ class PortfolioService:
             "trading_days":      n,
         }
 
+    @traced("portfolio.compare_benchmark")
     def _compare_benchmark(
         self, port_returns: pd.Series, bench_returns: pd.Series
     ) -> dict:
@@ -263,6 +280,7 @@ class PortfolioService:
             "outperformed":  port_total > bench_total,
         }
 
+    @traced("portfolio.correlation")
     def _correlation_matrix(self, price_data: pd.DataFrame) -> Optional[pd.DataFrame]:
         """Korrelations-Matrix der täglichen Returns."""
         if price_data.empty or len(price_data.columns) < 2:
@@ -273,19 +291,18 @@ class PortfolioService:
         except Exception:
             return None
 
+    @traced("portfolio.sector_allocation")
     def _sector_allocation(
         self, positions: list[dict], price_data: pd.DataFrame
     ) -> list[dict]:
         """Berechnet Sektor-Allokation basierend auf aktuellem Marktwert."""
-        import yfinance as yf
-
         sector_data = {}
         total_value = 0.0
 
         for pos in positions:
             ticker = pos["ticker"]
             try:
-                info   = yf.Ticker(ticker).info
+                info   = self.client.get_ticker_info(ticker) or {}
                 sector = info.get("sector", "Unbekannt")
                 if ticker in price_data.columns:
                     last_price = price_data[ticker].iloc[-1]
@@ -18,8 +18,9 @@ class ScreenerService:
     def run_screen(self, universe: list, filters: dict = None) -> pd.DataFrame:
         """Führt den Screener für eine Liste von Tickern durch und berechnet den Score."""
         results = []
+        quotes = self.client.get_quotes(universe)
         for ticker in universe:
-            quote = self.client.get_quote(ticker)
+            quote = quotes[ticker]
             
             # Basis Composite Score (0-100) berechnen
             score = 50 
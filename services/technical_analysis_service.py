@@ -6,12 +6,14 @@ import numpy as np
 from typing import Dict, Any, Optional
 from data.openbb_client import get_client
 from indicators.technical import TechnicalIndicators
+from utils.tracing import traced
 
 
 class TechnicalAnalysisService:
     def __init__(self):
         self.client = get_client()
 
+    @traced("technical.price_data")
     def get_price_data(self, ticker: str, period: str = "3mo", interval: str = "1d") -> pd.DataFrame:
         """Holt Kursdaten und berechnet Indikatoren."""
         df = self.client.get_price_history(ticker, period=period, interval=interval)
@@ -31,6 +33,7 @@ class TechnicalAnalysisService:
 
         return ti.df.dropna()
 
+    @traced("technical.score")
     def analyze_indicators(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analysiert alle Indikatoren und erstellt ein Signal."""
         if df.empty:
@@ -0,0 +1,90 @@
+"""
+test/conftest.py - Gemeinsame Fixtures
+
+Jeder Test bekommt einen leeren Memory-Cache und einen eigenen Disk-Cache im
+tmp-Verzeichnis (ebenso den OHLCV-Store und den Symbol-Index), damit keine Einträge aus .cache/ oder anderen Tests durchsickern.
+
+HTTP-Attrappen für Tests ohne Netzwerk:
+    def test_x(fake_http, fake_response):
+        fake_http.queue(fake_response(429, headers={"Retry-After": "0"}), fake_response(200))
+        hs.http_get(url)            # -> 429, dann 200; fake_http.calls: [(url, kwargs), ...]
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.cache_manager as cm
+import data.http_session as hs
+import data.ohlcv_store as ohlcv
+import data.rate_limiter as rl
+import data.circuit_breaker as cb
+import data.openbb_client as oc
+import data.symbol_index as si
+import data.cache_stats as cs
+import data.cache_warmer as cw
+import data.refresh_scheduler as rs
+
+
+class FakeResponse:
+    """Minimale requests.Response-Attrappe."""
+
+    def __init__(self, status_code: int = 200, content: bytes = b"", headers: dict = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeSession:
+    """Ersatz für get() der gemeinsamen Session: Antworten der Reihe nach, die letzte bleibt."""
+
+    def __init__(self):
+        self.responses: list = []
+        self.calls: list = []
+
+    def queue(self, *responses):
+        """FakeResponse oder Exception (wird beim Aufruf geworfen)."""
+        self.responses.extend(responses)
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        resp = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if isinstance(resp, Exception):
+            raise resp
+        return resp
+
+
+@pytest.fixture
+def fake_response():
+    return FakeResponse
+
+
+@pytest.fixture
+def fake_http(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(hs.get_session(), "get", session.get)
+    return session
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cm, "_cache_instance", cm.CacheManager(str(tmp_path / "cache")))
+    monkeypatch.setattr(ohlcv, "_store_instance", ohlcv.OhlcvStore(str(tmp_path / "ohlcv")))
+    index = si.SymbolIndex(tmp_path / "symbols.json")
+    index.seed_defaults()
+    monkeypatch.setattr(si, "_index_instance", index)
+    monkeypatch.setattr(cw, "WARMUP_ENABLED", False)       # kein Netzwerk-Warm-up über get_client()
+    monkeypatch.setattr(rs, "HOT_REFRESH_ENABLED", False)
+    monkeypatch.setattr(rs, "_tracker_instance", rs.PopularityTracker())
+    oc._cache_store.clear()
+    rl.reset_limiters()
+    cb.reset_breakers()
+    cs.reset_cache_stats()
+    yield
+    oc._cache_store.clear()
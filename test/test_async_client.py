@@ -0,0 +1,103 @@
+"""
+test/test_async_client.py - Offline-Tests für AsyncOpenBBClient und async_cached
+
+Führe aus mit: pytest test/test_async_client.py -v
+"""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.http_session as hs
+import data.openbb_client as oc
+import data.async_client as ac
+
+RSS = b"""<rss><channel>
+<item><title>A</title><link>https://x/a</link><pubDate>Mon, 01 Jan 2024 10:00:00 GMT</pubDate></item>
+<item><title>B</title><link>https://x/b</link><pubDate>Mon, 01 Jan 2024 09:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class TestAsyncCached:
+    def test_concurrent_callers_share_one_fetch(self):
+        calls = []
+
+        @oc.async_cached(ttl_seconds=60)
+        async def slow_fetch(ticker):
+            calls.append(ticker)
+            await asyncio.sleep(0.05)
+            return {"ticker": ticker}
+
+        async def main():
+            return await asyncio.gather(*(slow_fetch("AAPL") for _ in range(50)))
+
+        assert asyncio.run(main()) == [{"ticker": "AAPL"}] * 50
+        assert calls == ["AAPL"]
+
+    def test_shares_cache_with_sync_client(self, monkeypatch):
+        client = oc.OpenBBClient()
+        client.get_quote.prime({"price": 1.0}, client, "AAPL")
+        monkeypatch.setattr(oc.yf, "Ticker", lambda t: pytest.fail("kein Fetch erwartet"))
+        assert asyncio.run(ac.AsyncOpenBBClient(client).get_quote("AAPL")) == {"price": 1.0}
+
+
+class TestAsyncClient:
+    def test_news_via_async_http(self, monkeypatch, fake_response):
+        async def fake_get(url, **kwargs):
+            return fake_response(200, RSS)
+
+        monkeypatch.setattr(ac, "async_http_get", fake_get)
+        news = asyncio.run(ac.AsyncOpenBBClient(oc.OpenBBClient()).get_news("AAPL", limit=1))
+        assert [n["title"] for n in news] == ["A"]
+
+    def test_run_sync_gathers(self):
+        async def double(x):
+            await asyncio.sleep(0.01)
+            return 2 * x
+
+        assert ac.run_sync(double(1)) == 2
+        assert ac.run_sync(double(1), double(2), double(3)) == [2, 4, 6]
+
+    def test_run_sync_times_out(self):
+        with pytest.raises(TimeoutError):
+            ac.run_sync(asyncio.sleep(5), timeout=0.05)
+
+    def test_search_task_kept_and_deduped(self, monkeypatch, fake_response):
+        calls = []
+
+        async def fake_get(url, **kwargs):
+            calls.append(kwargs["params"]["q"])
+            await asyncio.sleep(0.05)
+            return fake_response(200, b'{"quotes": []}')
+
+        monkeypatch.setattr(ac, "async_http_get", fake_get)
+        client = ac.AsyncOpenBBClient(oc.OpenBBClient())
+
+        async def main():
+            await client.search_ticker("AAPL")          # lokale Treffer -> Suche im Hintergrund
+            assert len(ac._search_tasks) == 1
+            await asyncio.gather(*ac._search_tasks)
+            await client.search_ticker("aapl ")         # gleiche Query, schon gecacht
+            return len(ac._search_tasks)
+
+        assert asyncio.run(main()) == 0
+        assert calls == ["aapl"]
+
+    def test_close_async_session(self):
+        if not hs.ASYNC_HTTP_AVAILABLE:
+            pytest.skip("curl_cffi fehlt")
+
+        async def main():
+            session = hs.get_async_session()
+            await hs.close_async_session()
+            return session, hs.get_async_session()
+
+        closed, fresh = asyncio.run(main())
+        assert closed._closed and fresh is not closed
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,182 @@
+"""
+test/test_bars.py - Tests für OHLCV-Hilfen und inkrementelle History-Updates
+
+Führe aus mit: pytest test/test_bars.py -v
+"""
+
+import pytest
+import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.openbb_client as oc
+from data.bars import merge_tail, trim_to_period, is_intraday, resample_ohlcv, period_days
+
+
+def _bars(start: str, closes: list, freq: str = "B") -> pd.DataFrame:
+    idx = pd.date_range(start, periods=len(closes), freq=freq)
+    return pd.DataFrame({
+        "open": closes, "high": closes, "low": closes, "close": closes, "volume": [100] * len(closes),
+    }, index=idx)
+
+
+class TestMergeTail:
+    def test_appends_and_dedupes(self):
+        cached = _bars("2024-01-01", [1, 2, 3])
+        tail = _bars("2024-01-02", [2, 3.5, 4])   # letzte Kerze war noch offen
+        merged = merge_tail(cached, tail)
+        assert list(merged["close"]) == [1, 2, 3.5, 4]
+        assert merged.index.is_unique
+
+    def test_detects_adjustment(self):
+        cached = _bars("2024-01-01", [10, 20, 30])
+        tail = _bars("2024-01-02", [10, 15, 16])   # abgeschlossene Kerze verschoben
+        assert merge_tail(cached, tail) is None
+
+    def test_empty_tail(self):
+        cached = _bars("2024-01-01", [1, 2])
+        assert merge_tail(cached, pd.DataFrame()) is cached
+
+
+class TestTrimToPeriod:
+    def test_months(self):
+        df = _bars("2023-01-02", list(range(300)))
+        trimmed = trim_to_period(df, "6mo")
+        assert trimmed.index[0] >= df.index[-1] - pd.DateOffset(months=6)
+
+    def test_trading_days(self):
+        df = _bars("2024-01-01", list(range(20)))
+        assert len(trim_to_period(df, "5d")) == 5
+
+    def test_max_untouched(self):
+        df = _bars("2024-01-01", [1, 2, 3])
+        assert trim_to_period(df, "max") is df
+
+    def test_intraday_detection(self):
+        assert is_intraday("15m") and is_intraday("1h")
+        assert not is_intraday("1d") and not is_intraday("1mo") and not is_intraday("1wk")
+
+    def test_ytd_depends_on_date(self):
+        feb = pd.Timestamp("2024-02-15")
+        assert period_days("ytd", feb) == 46
+        assert period_days("ytd", feb) < period_days("6mo") < period_days("ytd", pd.Timestamp("2024-12-20"))
+        assert period_days("ytd", pd.Timestamp("2023-12-29")) < period_days("1y")
+
+
+class TestResample:
+    def test_weekly_from_daily(self):
+        df = _bars("2024-01-03", [1, 2, 3, 4, 5, 6, 7])   # Mi .. Do der Folgewoche
+        weekly = resample_ohlcv(df, "1wk")
+        assert list(weekly.index.strftime("%Y-%m-%d")) == ["2024-01-01", "2024-01-08"]
+        assert list(weekly["open"]) == [1, 4] and list(weekly["close"]) == [3, 7]
+        assert list(weekly["volume"]) == [300, 400]
+
+    def test_four_hours_anchored_to_session(self):
+        idx = pd.date_range("2024-01-02 09:30", periods=7, freq="h", tz="America/New_York")
+        df = pd.DataFrame({"open": 1.0, "high": range(7), "low": 0.0, "close": 1.0, "volume": 10}, index=idx)
+        four = resample_ohlcv(df, "4h")
+        assert [t.strftime("%H:%M") for t in four.index] == ["09:30", "13:30"]
+        assert list(four["high"]) == [3, 6]
+
+
+class TestStoreCoverage:
+    def test_ytd_store_does_not_serve_longer_period(self, monkeypatch):
+        calls = []
+
+        def fake_download(ticker, **kwargs):
+            calls.append(kwargs)
+            return _bars("2024-01-01", list(range(1, 30))).rename(columns=str.title)
+
+        monkeypatch.setattr(oc.yf, "download", fake_download)
+        client = oc.OpenBBClient()
+        client._load_bars("AAPL", "ytd", "1d")
+        assert client._bars_from_store("AAPL", "ytd", "1d") is not None
+        assert client._bars_from_store("AAPL", "6mo", "1d") is None
+        assert client._bars_from_store("AAPL", "1y", "1d") is None
+
+    @pytest.mark.parametrize("reset", ["invalidate", "clear_cache"])
+    def test_cache_reset_forces_fresh_bars(self, monkeypatch, reset):
+        calls = []
+
+        def fake_download(ticker, **kwargs):
+            calls.append(kwargs)
+            return _bars("2024-01-01", [1, 2, 3]).rename(columns=str.title)
+
+        monkeypatch.setattr(oc.yf, "download", fake_download)
+        monkeypatch.setattr(oc.st.cache_data, "clear", lambda: None)
+        client = oc.OpenBBClient()
+        client.get_price_history("AAPL", "1y", "1d")
+        oc.get_cache().set(oc._feed_key("https://feed.example"), {"etag": "x"})
+
+        if reset == "invalidate":
+            oc.invalidate("get_price_history")
+        else:
+            client.clear_cache()
+        client.get_price_history("AAPL", "1y", "1d")
+
+        assert len(calls) == 2 and "start" in calls[1]            # Tail nachgeladen, nicht aus dem Store
+        assert oc.get_ohlcv_store().coverage("AAPL", "1d") is not None
+        feed = oc.get_cache().get(oc._feed_key("https://feed.example"))
+        assert (feed is None) == (reset == "clear_cache")
+
+
+class TestIncrementalHistory:
+    @pytest.fixture(autouse=True)
+    def stale_store(self, monkeypatch):
+        # Store gilt sofort als veraltet -> jeder Aufruf lädt den Tail nach
+        monkeypatch.setitem(oc.TTL, "price_history", -1)
+
+    def test_second_refresh_loads_only_tail(self, monkeypatch):
+        calls = []
+
+        def fake_download(ticker, **kwargs):
+            calls.append(kwargs)
+            if "period" in kwargs:
+                return _bars("2024-01-01", [1, 2, 3]).rename(columns=str.title)
+            return _bars("2024-01-02", [2, 3, 4]).rename(columns=str.title)
+
+        monkeypatch.setattr(oc.yf, "download", fake_download)
+        client = oc.OpenBBClient()
+        assert len(client._load_bars("AAPL", "1y", "1d")) == 3
+        df = client._load_bars("AAPL", "1y", "1d")
+
+        assert list(df["close"]) == [1, 2, 3, 4]
+        assert calls[0]["period"] == "1y"
+        assert calls[1]["start"] == "2024-01-02" and "period" not in calls[1]
+
+    def test_adjustment_triggers_full_reload(self, monkeypatch):
+        calls = []
+
+        def fake_download(ticker, **kwargs):
+            calls.append(kwargs)
+            if "period" in kwargs:
+                return _bars("2024-01-01", [10, 20, 30]).rename(columns=str.title)
+            return _bars("2024-01-02", [10, 11, 12]).rename(columns=str.title)
+
+        monkeypatch.setattr(oc.yf, "download", fake_download)
+        client = oc.OpenBBClient()
+        client._load_bars("AAPL", "1y", "1d")
+        client._load_bars("AAPL", "1y", "1d")
+        assert ["period" in c for c in calls] == [True, False, True]
+
+    def test_merged_index_keeps_name(self, monkeypatch):
+        # yfinance nennt den Index "Date" – nach dem Merge muss er trotzdem "date" heißen,
+        # sonst liefert reset_index() im Chart eine Spalte "index"
+        def fake_download(ticker, **kwargs):
+            start = "2024-01-01" if "period" in kwargs else "2024-01-02"
+            return _bars(start, [1, 2, 3]).rename(columns=str.title).rename_axis("Date")
+
+        monkeypatch.setattr(oc.yf, "download", fake_download)
+        client = oc.OpenBBClient()
+        client._load_bars("AAPL", "1y", "1d")
+        df = client._load_bars("AAPL", "1y", "1d")
+
+        assert df.index.name == "date"
+        assert "date" in df.reset_index().columns
+        assert client.get_price_history("AAPL", "1y", "1wk").index.name == "date"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,116 @@
+"""
+test/test_batch_fetch.py - Offline-Tests für Batch-Abfragen des OpenBB Clients
+
+yfinance wird per monkeypatch ersetzt, es wird kein Netzwerk benötigt.
+Führe aus mit: pytest test/test_batch_fetch.py -v
+"""
+
+import time
+import pytest
+import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.openbb_client as oc
+from data.openbb_client import OpenBBClient
+
+
+def _fake_ohlcv(start: float, days: int = 5) -> pd.DataFrame:
+    idx = pd.date_range("2024-01-01", periods=days, freq="D")
+    close = [start + i for i in range(days)]
+    return pd.DataFrame({
+        "Open": close, "High": [c + 1 for c in close], "Low": [c - 1 for c in close],
+        "Close": close, "Volume": [1000] * days,
+    }, index=idx)
+
+
+@pytest.fixture
+def client():
+    oc._cache_store.clear()
+    return OpenBBClient()
+
+
+class TestPriceHistories:
+    def test_single_download_for_all_tickers(self, client, monkeypatch):
+        calls = []
+
+        def fake_download(tickers, **kwargs):
+            calls.append(list(tickers))
+            return pd.concat({t: _fake_ohlcv(100 * (i + 1)) for i, t in enumerate(tickers)}, axis=1)
+
+        monkeypatch.setattr(oc.yf, "download", fake_download)
+        panel = client.get_price_histories(["AAPL", "MSFT"], "1mo", "1d")
+
+        assert calls == [["AAPL", "MSFT"]]
+        assert set(panel.columns.get_level_values(0)) == {"AAPL", "MSFT"}
+        assert list(panel["AAPL"].columns) == ["open", "high", "low", "close", "volume"]
+
+    def test_primes_per_ticker_cache(self, client, monkeypatch):
+        monkeypatch.setattr(
+            oc.yf, "download",
+            lambda tickers, **kw: pd.concat({t: _fake_ohlcv(10) for t in tickers}, axis=1),
+        )
+        client.get_price_histories(["AAPL"], "1mo", "1d")
+
+        def fail(*a, **kw):
+            raise AssertionError("Cache-Hit erwartet")
+
+        monkeypatch.setattr(oc.yf, "download", fail)
+        df = client.get_price_history("AAPL", "1mo", "1d")
+        assert df["close"].iloc[-1] == 14
+        # Zweiter Batch-Aufruf kommt komplett aus dem Cache
+        assert not client.get_price_histories(["AAPL"], "1mo", "1d").empty
+
+    def test_missing_ticker_is_skipped(self, client, monkeypatch):
+        monkeypatch.setattr(
+            oc.yf, "download",
+            lambda tickers, **kw: pd.concat({"AAPL": _fake_ohlcv(10)}, axis=1),
+        )
+        panel = client.get_price_histories(["AAPL", "INVALID_XYZ"], "1mo", "1d")
+        assert set(panel.columns.get_level_values(0)) == {"AAPL"}
+
+    def test_weekly_built_from_daily(self, client, monkeypatch):
+        intervals = []
+
+        def fake_download(tickers, **kwargs):
+            intervals.append(kwargs["interval"])
+            return pd.concat({t: _fake_ohlcv(10, days=14) for t in tickers}, axis=1)
+
+        monkeypatch.setattr(oc.yf, "download", fake_download)
+        panel = client.get_price_histories(["AAPL"], "1mo", "1wk")
+
+        assert intervals == ["1d"]
+        assert oc.get_ohlcv_store().coverage("AAPL", "1wk") is None      # gespeichert wird nur 1d
+        assert oc.get_ohlcv_store().coverage("AAPL", "1d") is not None
+        pd.testing.assert_frame_equal(panel["AAPL"], client.get_price_history("AAPL", "1mo", "1wk"))
+        assert len(panel["AAPL"]) < 14
+
+
+class TestQuotes:
+    def test_runs_concurrently(self, client, monkeypatch):
+        def slow_quote(ticker):
+            time.sleep(0.2)
+            return {"price": 1.0}
+
+        monkeypatch.setattr(client, "get_quote", slow_quote)
+        start = time.time()
+        quotes = client.get_quotes(["AAPL", "MSFT", "NVDA", "AMD"])
+        assert time.time() - start < 0.6
+        assert list(quotes) == ["AAPL", "MSFT", "NVDA", "AMD"]
+
+    def test_deadline_returns_empty(self, client, monkeypatch):
+        def quote(ticker):
+            if ticker == "SLOW":
+                time.sleep(0.5)
+            return {"price": 1.0}
+
+        monkeypatch.setattr(client, "get_quote", quote)
+        quotes = client.get_quotes(["AAPL", "SLOW"], deadline=0.1)
+        assert quotes["AAPL"] == {"price": 1.0}
+        assert quotes["SLOW"] == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,75 @@
+"""
+test/test_cache_keys.py - Tests für kanonische Cache-Keys und Invalidierung pro Dataset
+
+Führe aus mit: pytest test/test_cache_keys.py -v
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.openbb_client as oc
+from data.cache_keys import KeyBuilder, normalize_period, normalize_interval
+
+
+class Service:
+    def __init__(self):
+        self.calls = []
+
+    @oc.cached(ttl_seconds=60)
+    def history(self, ticker: str, period: str = "1y", interval: str = "1d"):
+        self.calls.append((ticker, period, interval))
+        return {"ticker": ticker}
+
+    @oc.cached(ttl_seconds=60)
+    def quote(self, ticker: str):
+        self.calls.append(ticker)
+        return {"ticker": ticker}
+
+
+class TestNormalization:
+    @pytest.mark.parametrize("raw, canonical", [("12mo", "1y"), ("24MO", "2y"), (" 6mo ", "6mo"), ("1Y", "1y")])
+    def test_period(self, raw, canonical):
+        assert normalize_period(raw) == canonical
+
+    @pytest.mark.parametrize("raw, canonical", [("60m", "1h"), ("1D", "1d"), ("1w", "1wk"), ("1M", "1mo"), ("1m", "1m")])
+    def test_interval(self, raw, canonical):
+        assert normalize_interval(raw) == canonical
+
+    def test_key_has_namespace(self):
+        key, _, _ = KeyBuilder(Service.quote.__wrapped__, "quote").bind((Service(), "AAPL"), {})
+        assert key.startswith("quote:")
+
+
+class TestCanonicalCalls:
+    def test_equivalent_calls_share_entry(self):
+        svc = Service()
+        svc.history("AAPL")
+        svc.history("aapl ", "12mo")
+        svc.history(ticker="AAPL", interval="1D", period="1y")
+        Service().history("AAPL", period="1y")         # andere Instanz, gleicher Key
+        assert svc.calls == [("AAPL", "1y", "1d")]
+
+    def test_invalidate_per_dataset(self):
+        svc = Service()
+        svc.history("AAPL")
+        svc.quote("AAPL")
+        assert oc.invalidate("quote") >= 1
+        svc.history("AAPL")
+        svc.quote("AAPL")
+        assert svc.calls == [("AAPL", "1y", "1d"), "AAPL", "AAPL"]
+
+    def test_invalidate_single_call(self):
+        svc = Service()
+        svc.quote("AAPL")
+        svc.quote("MSFT")
+        svc.quote.invalidate(svc, "aapl")
+        svc.quote("AAPL")
+        svc.quote("MSFT")
+        assert svc.calls == ["AAPL", "MSFT", "AAPL"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,62 @@
+"""
+test/test_cache_manager.py - Tests für data/cache_manager.py
+
+Führe aus mit: pytest test/test_cache_manager.py -v
+"""
+
+import time
+import pytest
+import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.cache_manager import BoundedLRUCache, estimate_size
+
+
+class TestEstimateSize:
+    def test_dataframe_uses_deep_memory(self):
+        df = pd.DataFrame({"close": range(1000), "name": ["x" * 50] * 1000})
+        assert estimate_size(df) == int(df.memory_usage(deep=True).sum())
+
+    def test_nested_containers(self):
+        df = pd.DataFrame({"a": range(1000)})
+        assert estimate_size({"income": df}) > estimate_size(df)
+
+
+class TestBoundedLRU:
+    def test_evicts_least_recently_used(self):
+        cache = BoundedLRUCache(max_bytes=300)
+        cache.set("a", 1, size=100)
+        cache.set("b", 2, size=100)
+        cache.set("c", 3, size=100)
+        cache.get("a")                 # a wird "frisch"
+        cache.set("d", 4, size=100)    # b fliegt raus
+        assert "b" not in cache and "a" in cache
+        assert cache.stats()["evictions"] == {"lru": 1}
+
+    def test_namespace_limit(self):
+        cache = BoundedLRUCache(max_bytes=10_000, namespace_limits={"history": 200})
+        cache.set("q", 1, namespace="quote", size=100)
+        cache.set("h1", 1, namespace="history", size=150)
+        cache.set("h2", 1, namespace="history", size=150)
+        assert "h1" not in cache and "h2" in cache and "q" in cache
+        assert cache.stats()["namespaces"]["history"] == {"entries": 1, "bytes": 150}
+        assert cache.stats()["evictions"] == {"namespace": 1}
+
+    def test_oversize_not_stored(self):
+        cache = BoundedLRUCache(max_bytes=100)
+        assert cache.set("big", 1, size=500) is False
+        assert len(cache) == 0
+
+    def test_sweep_expired(self):
+        cache = BoundedLRUCache(max_bytes=1000)
+        cache.set("old", 1, size=10, expires=time.time() - 1)
+        cache.set("new", 1, size=10, expires=time.time() + 60)
+        assert cache.sweep_expired() == 1
+        assert "old" not in cache and cache.stats()["bytes"] == 10
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
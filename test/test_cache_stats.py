@@ -0,0 +1,60 @@
+"""
+test/test_cache_stats.py - Tests für die Cache-Zähler (Treffer, Misses, Latenz, größte Einträge)
+
+Führe aus mit: pytest test/test_cache_stats.py -v
+"""
+
+import time
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.openbb_client as oc
+from data.cache_stats import cache_stats, key_label
+
+
+@oc.cached(ttl_seconds=60)
+def slow_quote(ticker):
+    time.sleep(0.02)
+    return {"ticker": ticker, "blob": "x" * 10_000}
+
+
+def row(namespace):
+    return next(r for r in cache_stats() if r["namespace"] == namespace)
+
+
+class TestClientCounters:
+    def test_hits_misses_and_latency(self):
+        slow_quote("AAPL")
+        slow_quote("aapl")                     # L1-Treffer (kanonischer Key)
+        oc._cache_store.clear()
+        slow_quote("AAPL")                     # L2-Treffer
+        r = row("slow_quote")
+        assert (r["misses"], r["l1_hits"], r["l2_hits"], r["fetches"]) == (1, 1, 1, 1)
+        assert r["hit_ratio"] == pytest.approx(2 / 3, abs=0.001)
+        assert r["p50_ms"] >= 20
+
+    def test_largest_entries_labeled(self):
+        slow_quote("MSFT")
+        biggest = oc.largest_entries(1)[0]
+        assert key_label(biggest["key"]) == "slow_quote('MSFT')"
+        assert oc.memory_cache_snapshot()["namespaces"]["slow_quote"]["entries"] == 1
+        assert oc.cache_expiry(biggest["key"], "slow_quote") == pytest.approx(time.time() + 60, abs=10)
+        assert oc.cache_expiry("slow_quote:unbekannt", "slow_quote") is None
+
+
+class TestDiskCounters:
+    def test_per_namespace(self):
+        cache = oc.get_cache()
+        cache.set("client:get_quote:abc", 1)
+        cache.get("client:get_quote:abc")
+        cache.get("client:get_quote:missing")
+        stats = cache.stats()
+        assert stats["namespaces"]["get_quote"] == {"hits": 1, "misses": 1, "sets": 1, "errors": 0}
+        assert stats["hit_ratio"] == 0.5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
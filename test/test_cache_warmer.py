@@ -0,0 +1,76 @@
+"""
+test/test_cache_warmer.py - Tests für den Cache-Warm-up beim Prozessstart
+
+Führe aus mit: pytest test/test_cache_warmer.py -v
+"""
+
+import time
+import pytest
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.cache_warmer as cw
+from data.cache_warmer import CacheWarmer, warmup_symbols
+from config import DASHBOARD_CARDS, SECTOR_ETFS
+
+
+class FakeClient:
+    def __init__(self):
+        self.snapshots, self.quotes, self.batches = [], [], []
+
+    def get_price_snapshot(self, ticker):
+        self.snapshots.append(ticker)
+        return {} if ticker == "^VIX" else {"price": 1.0}
+
+    def get_quote(self, ticker):
+        self.quotes.append(ticker)
+        return {"price": 1.0}
+
+    def get_price_histories(self, tickers, period, interval):
+        self.batches.append((tuple(tickers), period, interval))
+        return pd.concat({t: pd.DataFrame({"close": [1.0]}) for t in tickers[:3]}, axis=1)
+
+
+def wait_done(warmer, timeout=5):
+    end = time.time() + timeout
+    while warmer.status()["state"] == "running" and time.time() < end:
+        time.sleep(0.01)
+    return warmer.status()
+
+
+class TestWarmer:
+    def test_symbols_deduped_dashboard_first(self):
+        symbols = warmup_symbols()
+        assert symbols[:len(DASHBOARD_CARDS)] == list(DASHBOARD_CARDS)
+        assert len(symbols) == len(set(symbols)) and set(SECTOR_ETFS.values()) <= set(symbols)
+
+    def test_progress_and_once_per_process(self):
+        client, warmer = FakeClient(), CacheWarmer(max_workers=2)
+        assert warmer.start(client)
+        status = wait_done(warmer)
+        assert status["state"] == "done"
+
+        snaps, quotes, hist = status["stages"]
+        assert (snaps["done"], snaps["failed"]) == (len(warmup_symbols()) - 1, 1)     # ^VIX leer
+        assert quotes["failed"] == 0 and quotes["done"] == len(client.quotes)
+        assert (hist["done"], hist["failed"]) == (3, len(warmup_symbols()) - 3)
+        assert client.batches == [(tuple(warmup_symbols()), "1y", "1d")]
+
+        assert not warmer.start(client)                 # kein zweiter Lauf ohne force
+        assert warmer.start(client, force=True)
+        wait_done(warmer)
+        assert len(client.batches) == 2
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(cw, "WARMUP_ENABLED", False)
+        monkeypatch.setattr(cw, "_warmer_instance", CacheWarmer())
+        assert not cw.start_warmup(FakeClient())
+        assert cw.get_warmer().status()["state"] == "idle"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
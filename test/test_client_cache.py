@@ -0,0 +1,161 @@
+"""
+test/test_client_cache.py - Offline-Tests für den Cache des OpenBB Clients
+
+Führe aus mit: pytest test/test_client_cache.py -v
+"""
+
+import threading
+import time
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.openbb_client as oc
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    oc._cache_store.clear()
+    yield
+    oc._cache_store.clear()
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_fetch(self):
+        calls = []
+
+        @oc.cached(ttl_seconds=60)
+        def slow_fetch(ticker):
+            calls.append(ticker)
+            time.sleep(0.2)
+            return {"ticker": ticker}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(slow_fetch("AAPL"))) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert calls == ["AAPL"]
+        assert results == [{"ticker": "AAPL"}] * 5
+
+    def test_error_is_shared_and_not_cached(self):
+        calls = []
+
+        @oc.cached(ttl_seconds=60)
+        def broken(ticker):
+            calls.append(ticker)
+            raise RuntimeError("provider down")
+
+        assert broken("AAPL") is None
+        assert broken("AAPL") is None
+        assert len(calls) == 2
+        assert not oc._inflight
+
+    def test_follower_gives_up_on_hung_leader(self, monkeypatch):
+        monkeypatch.setattr(oc, "FETCH_DEADLINE", 0.05)
+        release = threading.Event()
+
+        @oc.cached(ttl_seconds=60)
+        def hung(ticker):
+            release.wait(2)
+            return {"ticker": ticker}
+
+        leader = threading.Thread(target=hung, args=("AAPL",))
+        leader.start()
+        time.sleep(0.02)
+        start = time.time()
+        assert hung("AAPL") is None             # kein Stale-Wert vorhanden
+        assert time.time() - start < 1
+        release.set()
+        leader.join()
+
+    def test_leader_rechecks_cache(self):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return "fetched"
+
+        # Anderer Leader ist zwischen Cache-Miss des Aufrufers und Registrierung fertig geworden
+        oc._cache_put("test:k", "cached", 60, "test")
+        assert oc._fetch("test:k", "test", fetch, (), {}, 60, 0) == "cached"
+        assert calls == []
+
+        # Early Expiry: den vom Aufrufer verworfenen Eintrag trotzdem neu laden
+        seen = oc.cache_expiry("test:k", "test")
+        assert oc._fetch("test:k", "test", fetch, (), {}, 60, 0, seen=seen) == "fetched"
+        assert calls == [1]
+
+
+class TestTwoTier:
+    def test_disk_hit_after_memory_loss(self):
+        calls = []
+
+        @oc.cached(ttl_seconds=60)
+        def fetch(ticker):
+            calls.append(ticker)
+            return {"ticker": ticker}
+
+        fetch("AAPL")
+        oc._cache_store.clear()          # simuliert Neustart: L1 leer, L2 auf Disk
+        assert fetch("AAPL") == {"ticker": "AAPL"}
+        assert calls == ["AAPL"]
+        assert len(oc._cache_store) == 1  # Treffer wurde nach L1 befördert
+
+    def test_key_independent_of_instance(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(oc.OpenBBClient, "get_ticker_info",
+                            oc.cached(ttl_seconds=60)(lambda self, t: calls.append(t) or {"t": t}))
+        oc.OpenBBClient().get_ticker_info("AAPL")
+        oc.OpenBBClient().get_ticker_info("AAPL")
+        assert calls == ["AAPL"]
+
+
+class TestStaleWhileRevalidate:
+    def _expire(self):
+        # Alle Einträge auf "abgelaufen, aber im Stale-Fenster" setzen
+        for key in list(oc._cache_store._data):
+            entry = oc._cache_store.get(key)
+            oc._cache_store.set(key, entry._replace(expires=time.time() - 1))
+
+    def test_stale_value_served_and_refreshed_once(self):
+        calls = []
+
+        @oc.cached(ttl_seconds=60, stale_ttl=300)
+        def fetch(ticker):
+            calls.append(ticker)
+            time.sleep(0.1)
+            return len(calls)
+
+        assert fetch("AAPL") == 1
+        self._expire()
+        start = time.time()
+        assert fetch("AAPL") == 1      # sofort der alte Wert
+        assert fetch("AAPL") == 1      # kein zweiter Refresh geplant
+        assert time.time() - start < 0.1
+        time.sleep(0.3)
+        assert fetch("AAPL") == 2      # Hintergrund-Refresh ist angekommen
+        assert len(calls) == 2
+
+    def test_without_stale_ttl_blocks(self):
+        @oc.cached(ttl_seconds=60)
+        def fetch(ticker):
+            return time.time()
+
+        first = fetch("AAPL")
+        self._expire()
+        assert fetch("AAPL") > first
+
+    def test_early_expiry_probability(self, monkeypatch):
+        entry = oc._Entry("v", expires=100.0, delta=1.0, stale_until=200.0)
+        monkeypatch.setattr(oc.random, "random", lambda: 0.5)   # -ln(0.5) ≈ 0.69
+        assert not oc._expires_early(entry, now=99.0)
+        assert oc._expires_early(entry, now=99.5)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
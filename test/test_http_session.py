@@ -0,0 +1,42 @@
+"""
+test/test_http_session.py - Tests für die gemeinsame HTTP-Session
+
+Führe aus mit: pytest test/test_http_session.py -v
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.http_session as hs
+from config import HTTP_POOL_SIZES, HTTP_TIMEOUT
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    hs.reset_session()
+    yield
+    hs.reset_session()
+
+
+class TestHttpSession:
+    def test_session_is_shared(self):
+        assert hs.get_session() is hs.get_session()
+
+    def test_per_host_pool_size(self):
+        session = hs.get_session()
+        for host, size in HTTP_POOL_SIZES.items():
+            adapter = session.get_adapter(f"https://{host}/some/path")
+            assert adapter._pool_maxsize == size
+
+    def test_default_timeout_and_headers(self, fake_http, fake_response):
+        fake_http.queue(fake_response(200, b"ok"))
+        assert hs.http_get("https://example.com").content == b"ok"
+        assert fake_http.calls[0][1]["timeout"] == HTTP_TIMEOUT
+        assert "Mozilla" in hs.get_session().headers["User-Agent"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,104 @@
+"""
+test/test_news.py - Tests für RSS-News (Conditional GET, inkrementelles Parsen)
+
+Führe aus mit: pytest test/test_news.py -v
+"""
+
+import time
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.openbb_client as oc
+from data.openbb_client import OpenBBClient, _news_url_key
+from data.rate_limiter import note_degraded
+
+
+def rss(*titles, broken_tail=False) -> bytes:
+    items = "".join(
+        f"<item><title>{t}</title><link>https://news.example/{t}</link>"
+        f"<pubDate>Mon, 0{i + 1} Jan 2024 10:00:00 GMT</pubDate></item>"
+        for i, t in enumerate(titles)
+    )
+    tail = "<item><title>kaputt" if broken_tail else "</channel></rss>"
+    return f"<rss><channel><title>Feed</title>{items}{tail}".encode()
+
+
+class TestParseRss:
+    def test_stops_after_limit(self):
+        # Der Rest des Dokuments ist kaputt – wird aber gar nicht mehr gelesen
+        items = OpenBBClient._parse_rss(rss("a", "b", "c", broken_tail=True), limit=2)
+        assert [i["title"] for i in items] == ["a", "b"]
+        assert items[0]["url"] == "https://news.example/a"
+
+
+class TestConditionalGet:
+    def test_304_reuses_stored_feed(self, fake_http, fake_response):
+        fake_http.queue(
+            fake_response(200, rss("a", "b"), {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 10:00:00 GMT"}),
+            fake_response(304),
+        )
+        client = OpenBBClient()
+        assert len(client.get_news("AAPL", limit=5)) == 2
+        oc._cache_store.clear()
+        oc.get_cache().clear_prefix("client:")                 # News-Cache leer, Feed-Validatoren bleiben
+
+        assert [i["title"] for i in client.get_news("AAPL", limit=1)] == ["a"]
+        sent = [kwargs["headers"] for _, kwargs in fake_http.calls]
+        assert sent[0] == {}
+        assert sent[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 10:00:00 GMT"}
+
+
+class TestNewsMany:
+    def test_merged_deduped_and_tagged(self, monkeypatch):
+        feeds = {
+            "AAPL": [{"title": "Apple und Microsoft legen zu", "url": "https://finance.yahoo.com/a?.tsrc=rss",
+                      "published": "Mon, 01 Jan 2024 10:00:00 GMT"},
+                     {"title": "Apple-Zahlen", "url": "https://finance.yahoo.com/b",
+                      "published": "Tue, 02 Jan 2024 10:00:00 GMT"}],
+            "MSFT": [{"title": "Apple und Microsoft legen zu", "url": "https://finance.yahoo.com/a",
+                      "published": "Mon, 01 Jan 2024 10:00:00 GMT"},
+                     {"title": "APPLE-ZAHLEN!", "url": "https://other.example/b2",
+                      "published": "Tue, 02 Jan 2024 10:00:00 GMT"}],
+        }
+        monkeypatch.setattr(OpenBBClient, "get_news", lambda self, t, limit=10: feeds[t])
+
+        news = OpenBBClient().get_news_many(["AAPL", "MSFT"], limit=3)
+        assert [n["title"] for n in news] == ["Apple-Zahlen", "Apple und Microsoft legen zu"]
+        assert all(n["tickers"] == ["AAPL", "MSFT"] for n in news)
+        assert "tickers" not in feeds["AAPL"][0]                # Feeds selbst unverändert
+
+    def test_url_key_keeps_content_params(self):
+        assert _news_url_key("https://www.site.example/a/?utm_source=x&guccounter=1") == "site.example/a"
+        assert _news_url_key("https://site.example/story?id=2&.tsrc=rss") == "site.example/story?id=2"
+        assert _news_url_key("https://site.example/story?id=1") != _news_url_key("https://site.example/story?id=2")
+
+    def test_throttled_feed_not_cached(self, monkeypatch):
+        def get_news(self, ticker, limit=10):
+            if ticker == "MSFT":
+                note_degraded()                                 # z.B. RSS gedrosselt
+                return []
+            return [{"title": "Apple-Zahlen", "url": "https://news.example/a"}]
+
+        monkeypatch.setattr(OpenBBClient, "get_news", get_news)
+        client = OpenBBClient()
+        assert len(client.get_news_many(["AAPL", "MSFT"])) == 1
+        assert client.get_news_many.peek(client, ["AAPL", "MSFT"]) is None
+
+    def test_deadline_not_cached(self, monkeypatch):
+        def get_news(self, ticker, limit=10):
+            if ticker == "MSFT":
+                time.sleep(0.3)                                 # Feed hängt über die Deadline
+            return [{"title": ticker}]
+
+        monkeypatch.setattr(oc, "FETCH_DEADLINE", 0.05)
+        monkeypatch.setattr(OpenBBClient, "get_news", get_news)
+        client = OpenBBClient()
+        assert [n["title"] for n in client.get_news_many(["AAPL", "MSFT"])] == ["AAPL"]
+        assert client.get_news_many.peek(client, ["AAPL", "MSFT"]) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,98 @@
+"""
+test/test_ohlcv_store.py - Tests für den lokalen OHLCV-Store
+
+Führe aus mit: pytest test/test_ohlcv_store.py -v
+"""
+
+import pytest
+import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.openbb_client as oc
+from data.ohlcv_store import OhlcvStore, get_ohlcv_store
+
+
+def _bars(start: str, closes: list, freq: str = "B") -> pd.DataFrame:
+    idx = pd.date_range(start, periods=len(closes), freq=freq)
+    return pd.DataFrame({
+        "open": closes, "high": closes, "low": closes, "close": closes, "volume": [100] * len(closes),
+    }, index=idx)
+
+
+class TestStore:
+    def test_roundtrip_and_coverage(self, tmp_path):
+        store = OhlcvStore(str(tmp_path))
+        df = _bars("2024-01-01", [1.0, 2.0, 3.0, 4.0])
+        assert store.write("^GSPC", "1d", df, period="1y")
+
+        meta = store.coverage("^GSPC", "1d")
+        assert meta["period"] == "1y" and meta["rows"] == 4
+        assert list(store.read("^GSPC", "1d")["close"]) == [1.0, 2.0, 3.0, 4.0]
+        assert list(store.read("^GSPC", "1d", start="2024-01-03")["close"]) == [3.0, 4.0]
+
+    def test_intraday_tz_filter(self, tmp_path):
+        store = OhlcvStore(str(tmp_path))
+        df = _bars("2024-01-02 15:30", [1.0, 2.0, 3.0], freq="h").tz_localize("America/New_York")
+        store.write("AAPL", "1h", df, period="5d")
+        assert len(store.read("AAPL", "1h", start="2024-01-02 16:30")) == 2
+
+    def test_missing_ticker(self, tmp_path):
+        store = OhlcvStore(str(tmp_path))
+        assert store.read("AAPL", "1d").empty
+        assert store.coverage("AAPL", "1d") is None
+
+
+class TestClientUsesStore:
+    def test_ranges_share_one_download(self, monkeypatch):
+        calls = []
+
+        def fake_download(ticker, **kwargs):
+            calls.append(kwargs)
+            return _bars("2020-01-01", list(range(1, 1301))).rename(columns=str.title)
+
+        monkeypatch.setattr(oc.yf, "download", fake_download)
+        client = oc.OpenBBClient()
+        client.get_price_history("AAPL", "5y", "1d")
+        short = client.get_price_history("AAPL", "3mo", "1d")
+        weekly = client.get_price_history("AAPL", "2y", "1wk")
+
+        assert len(calls) == 1 and calls[0]["interval"] == "1d"
+        assert short.index[0] >= short.index[-1] - pd.DateOffset(months=3)
+        assert (weekly.index.dayofweek == 0).all() and 100 < len(weekly) <= 106
+
+    def test_longer_period_loads_only_head(self, monkeypatch):
+        calls = []
+
+        def fake_download(ticker, **kwargs):
+            calls.append(kwargs)
+            if kwargs.get("period") == "6mo":
+                return _bars("2024-07-01", [10.0] * 130).rename(columns=str.title)
+            if kwargs.get("end"):
+                return _bars("2023-12-20", [5.0] * 140).rename(columns=str.title)
+            return pd.DataFrame()
+
+        monkeypatch.setattr(oc.yf, "download", fake_download)
+        client = oc.OpenBBClient()
+        client._load_bars("AAPL", "6mo", "1d")
+        df = client._load_bars("AAPL", "1y", "1d")
+
+        assert calls[1]["end"] == "2024-07-01"
+        assert df.index.is_unique and len(df) > 130
+        assert get_ohlcv_store().coverage("AAPL", "1d")["period"] == "1y"
+
+    def test_offline_serves_store(self, monkeypatch):
+        get_ohlcv_store().write("AAPL", "1d", _bars("2024-01-01", [1.0, 2.0, 3.0]), period="1y")
+
+        def offline(ticker, **kwargs):
+            raise ConnectionError("offline")
+
+        monkeypatch.setattr(oc.yf, "download", offline)
+        df = oc.OpenBBClient().get_price_history("AAPL", "1y", "1d")
+        assert list(df["close"]) == [1.0, 2.0, 3.0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
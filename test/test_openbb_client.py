@@ -1,9 +1,13 @@
 """
-tests/test_openbb_client.py - Tests für OpenBB Client & Indikatoren
+test/test_openbb_client.py - Tests für OpenBB Client & Indikatoren
 
-Führe aus mit: pytest tests/test_openbb_client.py -v
+Läuft ohne Netzwerk gegen ein Replay-Archiv (data/replay.py) mit synthetischen
+Kursen für AAPL und MSFT.
+
+Führe aus mit: pytest test/test_openbb_client.py -v
 """
 
+import numpy as np
 import pytest
 import pandas as pd
 import sys
@@ -12,12 +16,41 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from data.openbb_client import OpenBBClient
+from data.replay import ReplayArchive, activate, deactivate
 from indicators.technical import TechnicalIndicators
 
 
+def synthetic_bars(seed: int, days: int = 400) -> pd.DataFrame:
+    """Roher yf.download-Frame: Random Walk über Börsentage bis heute."""
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=days, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, days)))
+    open_ = close * (1 + rng.normal(0, 0.005, days))
+    return pd.DataFrame({
+        "Open": open_,
+        "High": np.maximum(open_, close) * 1.01,
+        "Low": np.minimum(open_, close) * 0.99,
+        "Close": close,
+        "Volume": rng.integers(1_000_000, 5_000_000, days),
+    }, index=idx)
+
+
 @pytest.fixture
-def client():
-    return OpenBBClient(pat="")
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr("data.providers.FMPProvider.available", lambda self: False)
+    monkeypatch.setattr("data.providers.AlphaVantageProvider.available", lambda self: False)
+    archive = ReplayArchive(tmp_path / "replay", mode="replay", latency=0)
+    for seed, ticker in enumerate(["AAPL", "MSFT"]):
+        bars = synthetic_bars(seed)
+        archive.put_bars(ticker, "1d", bars)
+        last, prev = bars["Close"].iloc[-1], bars["Close"].iloc[-2]
+        archive.put_ticker(ticker,
+                           fast_info={"last_price": last, "previous_close": prev, "currency": "USD"},
+                           info={"shortName": ticker, "volume": int(bars["Volume"].iloc[-1]),
+                                 "currency": "USD"})
+    activate(archive)
+    yield OpenBBClient()
+    deactivate()
 
 
 class TestPriceHistory:
@@ -0,0 +1,135 @@
+"""
+test/test_providers.py - Tests für ProviderRouter (Priorität, Fallback, Hedged Requests)
+
+Führe aus mit: pytest test/test_providers.py -v
+"""
+
+import time
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.providers as pv
+from data.providers import Provider, ProviderRouter, FMPProvider, AlphaVantageProvider, QUOTE_FIELDS
+from data.rate_limiter import note_degraded, throttle_scope
+
+
+class FakeProvider(Provider):
+    datasets = ("quote", "financials")
+
+    def __init__(self, name, result=None, delay=0.0, error=None, available=True):
+        self.name = name
+        self.result = result
+        self.delay = delay
+        self.error = error
+        self._available = available
+        self.calls = 0
+
+    def available(self):
+        return self._available
+
+    def quote(self, ticker):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result
+
+    financials = quote
+
+
+class TestRouter:
+    def test_priority_order(self):
+        yf_, fmp = FakeProvider("yfinance", {"price": 1}), FakeProvider("fmp", {"price": 2})
+        router = ProviderRouter([fmp, yf_])
+        assert router.call("quote", "AAPL") == {"price": 1}
+        assert fmp.calls == 0
+
+    def test_dataset_override(self):
+        yf_, fmp = FakeProvider("yfinance", {"a": 1}), FakeProvider("fmp", {"a": 2})
+        assert ProviderRouter([yf_, fmp]).call("financials", "AAPL") == {"a": 2}
+
+    def test_fallback_on_error_and_empty(self):
+        providers = [
+            FakeProvider("yfinance", error=RuntimeError("down")),
+            FakeProvider("fmp", result={}),
+            FakeProvider("alpha_vantage", {"price": 3}),
+        ]
+        assert ProviderRouter(providers).call("quote", "AAPL") == {"price": 3}
+
+    def test_unavailable_skipped(self):
+        router = ProviderRouter([FakeProvider("yfinance", {"p": 1}), FakeProvider("fmp", {"p": 2}, available=False)])
+        assert [p.name for p in router.candidates("quote")] == ["yfinance"]
+
+    def test_hedge_after_delay(self, monkeypatch):
+        monkeypatch.setattr(pv, "HEDGE_DEFAULT_DELAY", 0.05)
+        slow = FakeProvider("yfinance", {"price": 1}, delay=0.5)
+        fast = FakeProvider("fmp", {"price": 2})
+        router = ProviderRouter([slow, fast])
+
+        start = time.time()
+        assert router.call("quote", "AAPL") == {"price": 2}
+        assert time.time() - start < 0.3
+        stats = {row["provider"]: row for row in router.stats()}
+        assert stats["yfinance"]["hedges"] == 1 and stats["fmp"]["wins"] == 1
+
+    def test_hedge_delay_uses_percentile(self, monkeypatch):
+        monkeypatch.setattr(pv, "HEDGE_MIN_SAMPLES", 10)
+        router = ProviderRouter([FakeProvider("yfinance", {"p": 1})])
+        provider = router.providers["yfinance"]
+        router._latency[("yfinance", "quote")] = [0.3] * 95 + [5.0] * 5
+        assert router.hedge_delay(provider, "quote") == 0.3
+
+
+class TestQuoteSchema:
+    def test_fallback_quotes_share_schema(self, monkeypatch, fake_response):
+        bodies = {
+            FMPProvider.BASE_URL: b'[{"price": 10.0, "change": 1.0, "changesPercentage": 11.1, "name": "Acme"}]',
+            AlphaVantageProvider.BASE_URL: b'{"Global Quote": {"05. price": "10.0", "09. change": "1.0", '
+                                           b'"10. change percent": "11.1%", "06. volume": "5"}}',
+        }
+        monkeypatch.setattr(pv, "http_get", lambda url, params=None: fake_response(
+            200, next(b for base, b in bodies.items() if url.startswith(base))))
+
+        fmp = FMPProvider("key").quote("ACME")
+        av = AlphaVantageProvider("key").quote("ACME")
+        assert tuple(fmp) == tuple(av) == QUOTE_FIELDS
+        assert fmp["currency"] is None and av["currency"] is None      # keine USD-Annahme
+        assert fmp["sector"] is None and av["name"] is None
+        assert fmp["change_pct"] == av["change_pct"] == pytest.approx(0.111)
+
+
+class ThrottledProvider(FakeProvider):
+    """Wie ein gedrosselter yfinance-Aufruf: meldet die Drosselung und liefert nichts."""
+
+    def quote(self, ticker):
+        self.calls += 1
+        note_degraded()
+        return None
+
+
+class TestThrottleScopes:
+    def test_fallback_result_counts_as_clean(self):
+        router = ProviderRouter([ThrottledProvider("yfinance"), FakeProvider("fmp", {"price": 2})])
+        with throttle_scope() as scope:
+            assert router.call("quote", "AAPL") == {"price": 2}
+        assert scope.hits == 0
+
+    def test_no_result_after_throttle_is_degraded(self):
+        router = ProviderRouter([ThrottledProvider("yfinance"), FakeProvider("fmp", {})])
+        with throttle_scope() as scope:
+            assert router.call("quote", "AAPL") is None
+        assert scope.hits == 1
+
+    def test_client_caches_fallback_quote(self):
+        import data.openbb_client as oc
+        client = oc.OpenBBClient()
+        client.router = ProviderRouter([ThrottledProvider("yfinance"), FakeProvider("fmp", {"price": 2})])
+        assert client.get_quote("AAPL")["price"] == 2
+        assert client.get_quote.peek(client, "AAPL") == {"ticker": "AAPL", "price": 2}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
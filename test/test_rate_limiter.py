@@ -0,0 +1,92 @@
+"""
+test/test_rate_limiter.py - Tests für Token Bucket, 429-Backoff und Cache-Verhalten bei Drosselung
+
+Führe aus mit: pytest test/test_rate_limiter.py -v
+"""
+
+import time
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.http_session as hs
+import data.openbb_client as oc
+from data.rate_limiter import TokenBucket, ProviderThrottled, rate_limited, throttle_scope
+
+
+class TestTokenBucket:
+    def test_burst_then_smoothed(self):
+        bucket = TokenBucket("test", rate=20, burst=2)
+        start = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        assert 0.08 < time.monotonic() - start < 0.5     # 2 sofort, 2 im 50ms-Takt
+        assert bucket.stats()["acquired"] == 4
+
+    def test_penalize_and_recover(self):
+        bucket = TokenBucket("test", rate=4, burst=4)
+        bucket.penalize(retry_after=0)
+        assert bucket.rate == 2 and bucket.stats()["throttled"] == 1
+        for _ in range(30):
+            bucket.reward()
+        assert bucket.rate == 4
+
+    def test_gives_up_after_max_wait(self):
+        bucket = TokenBucket("test", rate=1, burst=1, max_wait=0.5)
+        bucket.acquire()
+        with throttle_scope() as scope:
+            with pytest.raises(ProviderThrottled):
+                bucket.acquire()
+        assert scope.hits == 1 and bucket.stats()["given_up"] >= 1
+
+
+class TestHttp429:
+    @pytest.fixture(autouse=True)
+    def fast_buckets(self):
+        # Hohe Basis-Rate, damit der Backoff im Test nur Millisekunden kostet
+        for url in ("https://query2.finance.yahoo.com/", "https://feeds.finance.yahoo.com/"):
+            bucket = hs.limiter_for_url(url)
+            bucket.base_rate = bucket.rate = 1000.0
+
+    def test_backs_off_and_retries(self, fake_http, fake_response):
+        fake_http.queue(fake_response(429, headers={"Retry-After": "0"}), fake_response(200))
+
+        resp = hs.http_get("https://query2.finance.yahoo.com/v1/finance/search")
+        assert resp.status_code == 200
+        assert hs.limiter_for_url("https://query2.finance.yahoo.com/x").stats()["throttled"] == 1
+
+    def test_persistent_429_raises(self, fake_http, fake_response):
+        fake_http.queue(fake_response(429, headers={"Retry-After": "0"}))
+        with pytest.raises(ProviderThrottled):
+            hs.http_get("https://feeds.finance.yahoo.com/rss/2.0/headline?s=AAPL")
+
+
+class TestThrottledNotCached:
+    def test_swallowed_throttle_not_cached(self):
+        state = {"throttled": False, "calls": 0}
+
+        @oc.cached(ttl_seconds=60, stale_ttl=300)
+        def fetch(ticker):
+            state["calls"] += 1
+            try:
+                with rate_limited("yfinance"):
+                    if state["throttled"]:
+                        raise Exception("Too Many Requests. Rate limited. Try after a while.")
+                return {"price": 1.0}
+            except Exception:
+                return {}                                # wie die Client-Methoden
+
+        assert fetch("AAPL") == {"price": 1.0}
+        state["throttled"] = True
+        oc._cache_store.clear()
+        oc.get_cache().clear()                           # kein gültiger Eintrag mehr
+        assert fetch("AAPL") == {}
+        state["throttled"] = False
+        assert fetch("AAPL") == {"price": 1.0}           # leeres Ergebnis wurde nicht gecacht
+        assert state["calls"] == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""
+test/test_refresh_scheduler.py - Tests für Popularität und Hot-Key-Refresh
+
+Führe aus mit: pytest test/test_refresh_scheduler.py -v
+"""
+
+import time
+import pytest
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.openbb_client as oc
+import data.rate_limiter as rl
+from data.refresh_scheduler import PopularityTracker, RefreshScheduler, get_tracker
+
+
+class TestPopularity:
+    def test_decay_ranks_recent_access_higher(self):
+        tracker = PopularityTracker(half_life=60)
+        for _ in range(4):
+            tracker.record("old", "get_quote", 60, (), now=1000)
+        tracker.record("new", "get_quote", 60, (), now=1120)
+        tracker.record("new", "get_quote", 60, (), now=1120)
+        # "old": 4 * 0.25 = 1.0, "new": 2.0
+        assert [row[0] for row in tracker.hottest(5, now=1120)] == ["new", "old"]
+        assert [row[0] for row in tracker.hottest(5, min_score=1.5, now=1120)] == ["new"]
+
+    def test_prune_keeps_popular(self):
+        tracker = PopularityTracker(max_keys=4)
+        for i in range(4):
+            for _ in range(i + 1):
+                tracker.record(f"k{i}", "get_quote", 60, ())
+        tracker.record("k_new", "get_quote", 60, ())
+        assert len(tracker) <= 4 and "k3" in [row[0] for row in tracker.hottest(10)]
+
+
+class Entry:
+    def __init__(self, expires):
+        self.expires = expires
+
+
+class TestScheduler:
+    def make(self, entries, **kwargs):
+        tracker = PopularityTracker()
+        for key, hits in (("hot", 5), ("cold", 1), ("fresh", 5)):
+            for _ in range(hits):
+                tracker.record(key, "get_quote", 100, ("get_quote", key))
+        calls = []
+        scheduler = RefreshScheduler(lambda key, ns: entries.get(key), lambda key, *a: calls.append((key, a)),
+                                     tracker=tracker, interval=1, min_score=3, **kwargs)
+        return scheduler, calls
+
+    def test_refreshes_hot_keys_near_expiry(self):
+        now = time.time()
+        scheduler, calls = self.make({"hot": Entry(now + 10), "cold": Entry(now + 1), "fresh": Entry(now + 90)})
+        assert scheduler.tick(now) == 1
+        assert calls == [("hot", ("get_quote", "hot"))]        # cold: zu selten, fresh: noch lange gültig
+
+    def test_budget_and_rate_limit_backoff(self):
+        scheduler, calls = self.make({}, max_per_tick=1)
+        assert scheduler.tick() == 1                            # "hot" und "fresh" fehlen, Budget 1
+        rl.get_limiter("yfinance").rate /= 2                    # Provider im Backoff
+        assert scheduler.tick() == 0 and scheduler.skipped_ticks == 1
+
+    def test_client_access_tracked_and_refreshed(self):
+        calls = []
+
+        @oc.cached(ttl_seconds=30)
+        def get_price_snapshot(ticker):                         # Namespace zählt für den Hot-Key-Refresh
+            calls.append(ticker)
+            return {"price": 1.0}
+
+        for _ in range(3):
+            get_price_snapshot("aapl")
+        assert calls == ["AAPL"]
+        [(key, score, namespace, ttl, fetch_args)] = get_tracker().hottest(5)
+        assert score == pytest.approx(3, abs=0.01) and (namespace, ttl) == ("get_price_snapshot", 30)
+
+        oc._refresh_in_background(key, *fetch_args)
+        deadline = time.time() + 2
+        while len(calls) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert calls == ["AAPL", "AAPL"]
+
+    def test_history_refresh_bypasses_fresh_store(self, monkeypatch):
+        calls = []
+
+        def fake_download(ticker, **kwargs):
+            calls.append(kwargs)
+            idx = pd.date_range("2024-01-01", periods=3, freq="B")
+            return pd.DataFrame({"Open": 1.0, "High": 1.0, "Low": 1.0, "Close": 1.0, "Volume": 10}, index=idx)
+
+        monkeypatch.setattr(oc.yf, "download", fake_download)
+        client = oc.OpenBBClient()
+        client.get_price_history("AAPL", "1y", "1d")
+        [(key, _, _, _, fetch_args)] = get_tracker().hottest(5)
+
+        # Store wurde gerade erst geschrieben – der Refresh muss trotzdem den Tail laden
+        oc._refresh(key, *fetch_args)
+        assert len(calls) == 2 and "start" in calls[1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,100 @@
+"""
+test/test_replay.py - Tests für Record/Replay der Provider-Antworten
+
+Führe aus mit: pytest test/test_replay.py -v
+"""
+
+import time
+import pytest
+import pandas as pd
+import yfinance as yf
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.http_session as hs
+from data.replay import ReplayArchive, ReplayMiss, activate, deactivate
+
+SEARCH_URL = "https://query2.finance.yahoo.com/v1/finance/search"
+SEARCH_BODY = b'{"quotes": [{"symbol": "NVDA"}]}'
+
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    yield tmp_path / "replay"
+    deactivate()
+
+
+def bars(days=30):
+    idx = pd.bdate_range("2024-01-01", periods=days, name="Date")
+    return pd.DataFrame({"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5, "Volume": 100}, index=idx)
+
+
+class TestHttp:
+    def test_record_then_replay(self, archive_dir, fake_http, fake_response):
+        fake_http.queue(fake_response(200, SEARCH_BODY, {"Content-Type": "application/json"}))
+        activate(ReplayArchive(archive_dir, mode="record"))
+        hs.http_get(SEARCH_URL, params={"q": "nvda", "apikey": "secret"})
+
+        activate(ReplayArchive(archive_dir, mode="replay", latency=0))
+        resp = hs.http_get(SEARCH_URL, params={"q": "nvda", "apikey": "other"})
+        assert resp.json() == {"quotes": [{"symbol": "NVDA"}]}
+        assert len(fake_http.calls) == 1
+
+    def test_304_keeps_recorded_200(self, archive_dir, fake_response):
+        archive = ReplayArchive(archive_dir, mode="record")
+        archive.http(SEARCH_URL, {"q": "nvda"}, lambda: fake_response(200, SEARCH_BODY))
+        archive.http(SEARCH_URL, {"q": "nvda"}, lambda: fake_response(304))   # Conditional GET, gleicher Key
+
+        replay = ReplayArchive(archive_dir, mode="replay", latency=0)
+        resp = replay.http(SEARCH_URL, {"q": "nvda"}, None)
+        assert resp.status_code == 200 and resp.json() == {"quotes": [{"symbol": "NVDA"}]}
+
+    def test_latency_injection(self, archive_dir):
+        archive = ReplayArchive(archive_dir, mode="replay", latency=0.1)
+        archive.put_http(SEARCH_URL, {"quotes": []}, params={"q": "x"})
+        activate(archive)
+        start = time.time()
+        hs.http_get(SEARCH_URL, params={"q": "x"})
+        assert time.time() - start >= 0.1
+
+    def test_miss_raises(self, archive_dir):
+        activate(ReplayArchive(archive_dir, mode="replay"))
+        with pytest.raises(ReplayMiss):
+            hs.http_get(SEARCH_URL, params={"q": "unbekannt"})
+
+
+class TestYFinance:
+    def test_download_sliced_by_range(self, archive_dir):
+        archive = ReplayArchive(archive_dir, mode="replay", latency=0)
+        archive.put_bars("AAPL", "1d", bars())
+        activate(archive)
+
+        df = yf.download("AAPL", interval="1d", start="2024-01-15", multi_level_index=False)
+        assert df.index[0] == pd.Timestamp("2024-01-15") and len(df) == 20
+        panel = yf.download(["AAPL", "MSFT"], period="1mo", interval="1d", group_by="ticker")
+        assert list(panel.columns.get_level_values(0).unique()) == ["AAPL"]
+
+    def test_record_download_keeps_widest(self, archive_dir):
+        archive = ReplayArchive(archive_dir, mode="record")
+        real = lambda tickers, **kw: bars().iloc[-10:] if kw.get("start") else bars()
+        archive.download(real, "AAPL", interval="1d", period="1mo")
+        archive.download(real, "AAPL", interval="1d", start="2024-02-01")
+        stored, _ = archive.get("bars", ("AAPL", "1d"))
+        assert len(stored) == 30
+
+    def test_ticker_attributes(self, archive_dir):
+        archive = ReplayArchive(archive_dir, mode="replay", latency=0)
+        archive.put_ticker("AAPL", info={"shortName": "Apple"}, fast_info={"last_price": 190.0})
+        activate(archive)
+
+        t = yf.Ticker("AAPL")
+        assert t.info["shortName"] == "Apple"
+        assert t.fast_info.last_price == 190.0 and t.fast_info.previous_close is None
+        with pytest.raises(ReplayMiss):
+            t.news
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
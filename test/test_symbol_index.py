@@ -0,0 +1,71 @@
+"""
+test/test_symbol_index.py - Tests für den lokalen Symbol-Index und die Ticker-Suche
+
+Führe aus mit: pytest test/test_symbol_index.py -v
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.openbb_client as oc
+import data.symbol_index as si
+from data.symbol_index import SymbolIndex
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    index = SymbolIndex(tmp_path / "symbols.json")
+    index.seed_defaults()
+    monkeypatch.setattr(si, "_index_instance", index)
+    return index
+
+
+class TestSearch:
+    def test_seeded_from_universes_and_config(self, index):
+        assert "SAP.DE" in index and "NVDA" in index and "^GDAXI" in index
+
+    def test_ticker_before_name(self, index):
+        index.add([{"ticker": "AMD", "name": "Advanced Micro Devices"},
+                   {"ticker": "AMDL", "name": "GraniteShares AMD Long"}])
+        assert [r["ticker"] for r in index.search("amd")][:2] == ["AMD", "AMDL"]
+
+    def test_name_words_and_fuzzy(self, index):
+        index.add([{"ticker": "NVDA", "name": "NVIDIA Corporation", "exchange": "NASDAQ"}])
+        assert index.search("corporation")[0]["ticker"] == "NVDA"
+        assert index.search("nvidai")[0]["ticker"] == "NVDA"        # Tippfehler
+        assert index.search("NVIDIA")[0]["exchange"] == "NASDAQ"
+
+    def test_learned_symbols_persisted(self, index, tmp_path):
+        index.add([{"ticker": "PLTR", "name": "Palantir Technologies"}])
+        reloaded = SymbolIndex(tmp_path / "symbols.json")
+        assert reloaded.search("palantir")[0]["ticker"] == "PLTR"
+        assert "AAPL" not in reloaded                               # Seeds werden nicht gespeichert
+
+
+class TestClientSearch:
+    def test_local_hit_skips_remote(self, index, monkeypatch):
+        monkeypatch.setattr(oc, "SYMBOL_SEARCH_MIN_HITS", 1)
+        monkeypatch.setattr(oc, "http_get", lambda *a, **kw: pytest.fail("kein Request erwartet"))
+        assert oc.OpenBBClient().search_ticker("aap")[0]["ticker"] == "AAPL"
+
+    def test_remote_enriches_index(self, index, monkeypatch):
+        monkeypatch.setattr(oc, "SYMBOL_SEARCH_MIN_HITS", 1)
+        class Resp:
+            def json(self):
+                return {"quotes": [{"symbol": "RHM.DE", "shortname": "Rheinmetall AG",
+                                    "exchDisp": "XETRA", "quoteType": "EQUITY"}]}
+        calls = []
+        monkeypatch.setattr(oc, "http_get", lambda *a, **kw: calls.append(kw) or Resp())
+        client = oc.OpenBBClient()
+
+        assert client.search_ticker("rheinmetall")[0]["ticker"] == "RHM.DE"
+        assert client.search_ticker("rheinm")[0]["ticker"] == "RHM.DE"
+        assert client.search_ticker("Rheinmetall")[0]["ticker"] == "RHM.DE"
+        assert len(calls) == 1              # danach lokal beantwortet
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
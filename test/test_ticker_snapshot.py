@@ -0,0 +1,81 @@
+"""
+test/test_ticker_snapshot.py - Offline-Tests für den geteilten Profil-Snapshot
+
+Führe aus mit: pytest test/test_ticker_snapshot.py -v
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.openbb_client as oc
+from data.openbb_client import OpenBBClient
+
+
+class FakeTicker:
+    info_calls = 0
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+        self.fast_info = SimpleNamespace(last_price=110.0, previous_close=100.0, last_volume=5000,
+                                         currency="USD")
+
+    @property
+    def info(self):
+        FakeTicker.info_calls += 1
+        return {
+            "shortName": "Apple Inc.", "currentPrice": 110.0, "targetMeanPrice": 121.0,
+            "recommendationKey": "strong_buy", "marketCap": 3e12, "trailingPE": 31.234,
+            "profitMargins": 0.2531, "volume": 5000,
+        }
+
+
+@pytest.fixture
+def client(monkeypatch):
+    oc._cache_store.clear()
+    FakeTicker.info_calls = 0
+    monkeypatch.setattr(oc.yf, "Ticker", FakeTicker)
+    return OpenBBClient()
+
+
+class TestTickerSnapshot:
+    def test_info_fetched_once(self, client):
+        client.get_quote("AAPL")
+        client.get_analyst_info("AAPL")
+        client.get_key_stats("AAPL")
+        assert FakeTicker.info_calls == 1
+
+    def test_quote_fields(self, client):
+        q = client.get_quote("AAPL")
+        assert q["price"] == 110.0
+        assert q["change_pct"] == pytest.approx(0.1)
+        assert q["name"] == "Apple Inc."
+
+    def test_raw_and_formatted_stats(self, client):
+        raw = client.get_key_stats_raw("AAPL")
+        fmt = client.get_key_stats("AAPL")
+        assert raw["Valuation"]["Trailing P/E"] == 31.234
+        assert fmt["Valuation"]["Trailing P/E"] == "31.23"
+        assert fmt["Valuation"]["Market Cap"] == 3e12
+        assert fmt["Profitability"]["Profit Margin"] == "25.31%"
+        assert fmt["Balance Sheet"]["Current Ratio"] == "-"
+
+
+class TestPriceSnapshot:
+    def test_skips_info(self, client):
+        snap = client.get_price_snapshot("AAPL")
+        assert snap["price"] == 110.0
+        assert snap["volume"] == 5000
+        assert FakeTicker.info_calls == 0
+
+    def test_lite_quotes(self, client):
+        quotes = client.get_quotes(["AAPL", "MSFT"], lite=True)
+        assert quotes["MSFT"]["change"] == pytest.approx(10.0)
+        assert FakeTicker.info_calls == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
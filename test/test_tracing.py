@@ -0,0 +1,92 @@
+"""
+test/test_tracing.py - Tests für Spans, Thread-Propagation und Trace-Export
+
+Führe aus mit: pytest test/test_tracing.py -v
+"""
+
+import json
+import time
+import pytest
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import data.openbb_client as oc
+from indicators.technical import TechnicalIndicators
+from utils.tracing import trace, span, page_trace, clear_trace, current_trace, export, recent_traces
+
+
+@oc.cached(ttl_seconds=60)
+def traced_quote(ticker):
+    time.sleep(0.01)
+    return {"ticker": ticker}
+
+
+def names(t):
+    return [s.name for s in t.spans]
+
+
+class TestSpans:
+    def test_nesting_and_client_cache(self):
+        with trace("rerun") as t:
+            traced_quote("aapl")
+            traced_quote("AAPL")
+        rows = t.rows()
+        assert [r["span"] for r in rows] == ["rerun", "client.traced_quote", "fetch.traced_quote",
+                                             "client.traced_quote"]
+        assert [r.get("cache") for r in rows[1:]] == ["miss", None, "l1"]
+        assert rows[1]["call"] == "traced_quote('AAPL')"
+        assert rows[2]["ms"] >= 10 and rows[0]["share"] == 1.0
+
+    def test_noop_without_trace(self):
+        with span("x") as s:
+            s.set(a=1)
+        assert not s.active and current_trace() is None
+
+    def test_fan_out_workers_join_trace(self):
+        client = oc.OpenBBClient()
+        with trace("fan-out") as t:
+            client._fan_out(traced_quote, ["AAPL", "MSFT"], deadline=5, default_factory=dict)
+        workers = [s for s in t.spans if s.name == "client.traced_quote"]
+        assert len(workers) == 2 and all(s.parent == t.root.id for s in workers)
+
+    def test_indicators(self):
+        df = pd.DataFrame({"close": range(1, 40)}, dtype=float)
+        with trace("ta") as t:
+            TechnicalIndicators(df).add_sma([5]).add_rsi(14)
+        assert names(t) == ["ta", "indicators.sma", "indicators.rsi"]
+
+
+class TestPageTrace:
+    def test_open_trace_ends_with_last_span(self):
+        t = page_trace("Seite")
+        try:
+            with span("render.chart"):
+                time.sleep(0.01)
+            time.sleep(0.03)
+            assert 0.01 <= t.duration < 0.03
+            assert recent_traces()[0] is t
+        finally:
+            clear_trace()
+
+
+class TestExport:
+    def test_json_and_chrome(self):
+        with trace("export") as t:
+            with span("step", rows=3):
+                pass
+        nested = json.loads(export([t]))[0]
+        assert nested["children"][0]["name"] == "step" and nested["children"][0]["attrs"] == {"rows": 3}
+
+        events = json.loads(export([t], fmt="chrome"))["traceEvents"]
+        spans = [e for e in events if e["ph"] == "X"]
+        assert [e["name"] for e in spans] == ["export", "step"]
+        assert spans[1]["ts"] >= spans[0]["ts"] and spans[0]["dur"] >= spans[1]["dur"]
+        assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in events)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
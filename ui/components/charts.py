@@ -6,6 +6,8 @@ from plotly.subplots import make_subplots
 import pandas as pd
 from typing import Dict
 
+from utils.tracing import traced, span
+
 def render_candlestick_chart(df: pd.DataFrame, title: str = "Price Action", height: int = 500):
     """
     Zeigt einen Candlestick Chart (OHLC)
@@ -44,7 +46,8 @@ def render_candlestick_chart(df: pd.DataFrame, title: str = "Price Action", heig
         xaxis=dict(gridcolor="#333")
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    with span("render.candlestick"):
+        st.plotly_chart(fig, use_container_width=True)
 
 def render_bar_chart(df: pd.DataFrame, x_col: str, y_col: str, title: str, color: str = "#00C805"):
     """
@@ -66,6 +69,7 @@ def render_bar_chart(df: pd.DataFrame, x_col: str, y_col: str, title: str, color
     )
     return fig
 
+@traced("chart.main")
 def create_main_chart(df: pd.DataFrame, ticker: str, show_indicators: dict) -> go.Figure:
     # Subplots Setup
     has_rsi = show_indicators.get("rsi", False) and 'rsi' in df.columns
@@ -191,6 +195,7 @@ def create_main_chart(df: pd.DataFrame, ticker: str, show_indicators: dict) -> g
 
     return fig
 
+@traced("chart.target_price")
 def render_target_price_chart(current_price, target_low, target_mean, target_high, currency="USD"):
     """
     Erstellt einen Chart, der den aktuellen Preis im Verhältnis zu den Analysten-Zielen zeigt.
@@ -245,6 +250,7 @@ def render_target_price_chart(current_price, target_low, target_mean, target_hig
     
     return fig
 
+@traced("chart.recommendation_gauge")
 def render_recommendation_gauge(score):
     """
     Zeigt einen simplen Gauge Chart für die Kaufempfehlung (1=Sell, 5=Buy)
@@ -2,6 +2,13 @@
 ui/components/sidebar.py - Navigation & Suche
 """
 import streamlit as st
+from data.circuit_breaker import breaker_stats
+from data.rate_limiter import limiter_stats
+
+BREAKER_LABELS = {
+    "open":      ("🔴", "ausgefallen – wird übersprungen"),
+    "half_open": ("🟡", "Probe-Anfrage läuft"),
+}
 
 def render_search_sidebar(client):
     """
@@ -67,4 +74,22 @@ def render_search_sidebar(client):
     )
     
     # Keine Rückgabewerte mehr nötig
-    return
\ No newline at end of file
+    return
+
+def render_provider_status():
+    """
+    Zeigt gesperrte (Circuit Breaker) und gedrosselte (Rate Limit) Provider in
+    der Sidebar. Läuft alles normal, wird nichts angezeigt.
+    """
+    breakers = [b for b in breaker_stats() if b["state"] != "closed"]
+    throttled = [l for l in limiter_stats() if l["waiting"] or l["rate"] < l["base_rate"]]
+    if not breakers and not throttled:
+        return
+
+    with st.sidebar.expander("⚠️ Provider-Status", expanded=True):
+        for b in breakers:
+            icon, label = BREAKER_LABELS[b["state"]]
+            retry = f" (nächster Versuch in {b['retry_in']}s)" if b["retry_in"] else ""
+            st.markdown(f"{icon} **{b['name']}** {label}{retry}")
+        for l in throttled:
+            st.markdown(f"🐢 **{l['name']}** gedrosselt: {l['rate']}/s, {l['waiting']} wartend")
@@ -0,0 +1,305 @@
+"""
+utils/tracing.py - Leichtgewichtiges Tracing eines Reruns (Spans über contextvars)
+
+Ein Trace sammelt verschachtelte Spans (Name, Start, Dauer, Thread, Attribute)
+und beantwortet die Frage, wohin die Zeit einer langsamen Seite geht:
+Netzwerk (fetch.*), Cache (client.*), Pandas (Indikatoren, Analytics) oder
+Plotly/Streamlit (chart.*, render.*).
+
+Ohne aktiven Trace kostet span() nur einen ContextVar-Lookup. Worker-Threads
+hängen sich per propagate(func) an den Trace des Aufrufers.
+
+Export: trace.to_dict() (verschachteltes JSON) oder to_chrome([...]) im
+Chrome Trace Event Format (chrome://tracing, ui.perfetto.dev).
+
+Verwendung:
+    page_trace("Technische Analyse")        # oben im Seiten-Skript, gilt für den Rerun
+
+    with span("render.gauge"):
+        st.plotly_chart(fig)
+
+    @traced("indicators.rsi")
+    def add_rsi(...): ...
+
+    with trace("bench") as t:               # außerhalb von Streamlit
+        client.get_quote("AAPL")
+    export([t], fmt="chrome")
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Optional
+
+from config import TRACE_ENABLED, TRACE_KEEP, TRACE_MAX_SPANS
+
+_ids = itertools.count(1)
+
+# (Trace, aktueller Span) des laufenden Kontexts
+_current: ContextVar = ContextVar("trace_span", default=None)
+
+_traces: deque = deque(maxlen=TRACE_KEEP)
+_traces_lock = threading.Lock()
+
+
+class Span:
+    __slots__ = ("id", "parent", "name", "start", "end", "thread_id", "thread_name", "attrs")
+
+    active = True
+
+    def __init__(self, name: str, parent: Optional[int], attrs: dict):
+        self.id = next(_ids)
+        self.parent = parent
+        self.name = name
+        self.attrs = dict(attrs)
+        thread = threading.current_thread()
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+        self.end: Optional[float] = None
+        self.start = time.perf_counter()
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    @property
+    def duration(self) -> float:
+        return (self.end or time.perf_counter()) - self.start
+
+
+class _NoopSpan:
+    """Platzhalter ohne aktiven Trace – set() verwirft alles."""
+
+    active = False
+
+    def set(self, **attrs):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Trace:
+    def __init__(self, name: str, attrs: Optional[dict] = None):
+        self.name = name
+        self.started_at = time.time()
+        self.root = Span(name, None, attrs or {})
+        self.spans = [self.root]
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def _add(self, span: Span) -> bool:
+        with self._lock:
+            if len(self.spans) >= TRACE_MAX_SPANS:
+                self.dropped += 1
+                return False
+            self.spans.append(span)
+            return True
+
+    @property
+    def duration(self) -> float:
+        """Gesamtdauer; ein offener Seiten-Trace endet mit seinem letzten Span."""
+        if self.root.end is not None:
+            return self.root.end - self.root.start
+        with self._lock:
+            ends = [s.end for s in self.spans[1:] if s.end is not None]
+        return (max(ends) if ends else time.perf_counter()) - self.root.start
+
+    def rows(self) -> list:
+        """Flache Liste in Aufruf-Reihenfolge mit Tiefe, Dauer (ms) und Anteil am Trace."""
+        total = self.duration or 1e-9
+        children = self._children()
+        rows = []
+
+        def walk(span, depth):
+            dur = self.duration if span is self.root else span.duration
+            rows.append({
+                "span": span.name, "depth": depth,
+                "start_ms": round((span.start - self.root.start) * 1000, 1),
+                "ms": round(dur * 1000, 1), "share": round(dur / total, 3),
+                "thread": span.thread_name, **span.attrs,
+            })
+            for child in children.get(span.id, ()):
+                walk(child, depth + 1)
+
+        walk(self.root, 0)
+        return rows
+
+    def to_dict(self) -> dict:
+        """Verschachteltes JSON: {"name", "ms", "attrs", "children": [...]}."""
+        children = self._children()
+
+        def node(span):
+            return {
+                "name": span.name,
+                "start_ms": round((span.start - self.root.start) * 1000, 3),
+                "ms": round((self.duration if span is self.root else span.duration) * 1000, 3),
+                "thread": span.thread_name,
+                "attrs": span.attrs,
+                "children": [node(c) for c in children.get(span.id, ())],
+            }
+
+        return {"trace": self.name, "started_at": self.started_at, "dropped": self.dropped, **node(self.root)}
+
+    def _children(self) -> dict:
+        with self._lock:
+            spans = list(self.spans[1:])
+        children: dict = {}
+        for s in sorted(spans, key=lambda s: s.start):
+            children.setdefault(s.parent, []).append(s)
+        return children
+
+
+# ─────────────────────────────────────────────
+# TRACES STARTEN
+# ─────────────────────────────────────────────
+
+def _start(name: str, attrs: dict) -> Trace:
+    t = Trace(name, attrs)
+    with _traces_lock:
+        _traces.append(t)
+    return t
+
+@contextmanager
+def trace(name: str, **attrs):
+    """Neuer Trace für den Block (innerhalb eines laufenden Traces: normaler Span)."""
+    if not TRACE_ENABLED:
+        yield None
+        return
+    current = _current.get()
+    if current is not None:
+        with span(name, **attrs):
+            yield current[0]
+        return
+    t = _start(name, attrs)
+    token = _current.set((t, t.root))
+    try:
+        yield t
+    finally:
+        t.root.end = time.perf_counter()
+        _current.reset(token)
+
+def page_trace(name: str, **attrs) -> Optional[Trace]:
+    """
+    Trace für den aktuellen Streamlit-Rerun. Ein Seiten-Skript hat keinen
+    Endpunkt (st.stop, Exceptions), deshalb bleibt der Trace offen und gilt,
+    bis der nächste Rerun im selben Thread einen neuen startet.
+    """
+    if not TRACE_ENABLED:
+        return None
+    t = _start(name, attrs)
+    _current.set((t, t.root))
+    return t
+
+def clear_trace():
+    """Aktuellen Kontext vom Trace lösen (z.B. auf der Diagnose-Seite selbst)."""
+    _current.set(None)
+
+def current_trace() -> Optional[Trace]:
+    current = _current.get()
+    return current[0] if current else None
+
+
+# ─────────────────────────────────────────────
+# SPANS
+# ─────────────────────────────────────────────
+
+@contextmanager
+def span(name: str, **attrs):
+    """Zeitmessung für den Block; ohne aktiven Trace ein No-op."""
+    current = _current.get()
+    if current is None:
+        yield _NOOP
+        return
+    t, parent = current
+    s = Span(name, parent.id, attrs)
+    if not t._add(s):
+        yield _NOOP
+        return
+    token = _current.set((t, s))
+    try:
+        yield s
+    except Exception as e:
+        s.attrs["error"] = type(e).__name__
+        raise
+    finally:
+        s.end = time.perf_counter()
+        _current.reset(token)
+
+def traced(name: Optional[str] = None):
+    """Decorator: jeder Aufruf wird ein Span (Default-Name: Klasse.methode)."""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return func(*args, **kwargs)
+            with span(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def propagate(func):
+    """Bindet func an den aktuellen Trace, z.B. vor executor.submit()."""
+    current = _current.get()
+    if current is None:
+        return func
+
+    @wraps(func)
+    def run(*args, **kwargs):
+        token = _current.set(current)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current.reset(token)
+    return run
+
+
+# ─────────────────────────────────────────────
+# EXPORT
+# ─────────────────────────────────────────────
+
+def recent_traces() -> list:
+    """Die letzten TRACE_KEEP Traces, neueste zuerst."""
+    with _traces_lock:
+        return list(reversed(_traces))
+
+def reset_traces():
+    with _traces_lock:
+        _traces.clear()
+
+def to_chrome(traces: list) -> dict:
+    """Chrome Trace Event Format: ein "X"-Event pro Span, Threads als eigene Spuren."""
+    pid = os.getpid()
+    events, threads = [], {}
+    for t in traces:
+        with t._lock:
+            spans = list(t.spans)
+        for s in spans:
+            dur = t.duration if s is t.root else s.duration
+            events.append({
+                "name": s.name, "cat": t.name, "ph": "X", "pid": pid, "tid": s.thread_id,
+                "ts": round((t.started_at + s.start - t.root.start) * 1e6, 1),
+                "dur": round(dur * 1e6, 1),
+                "args": s.attrs,
+            })
+            threads[s.thread_id] = s.thread_name
+    events += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+               for tid, name in threads.items()]
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+def export(traces: list, fmt: str = "json") -> str:
+    """fmt="json" (verschachtelt) oder "chrome"."""
+    if fmt == "chrome":
+        data = to_chrome(traces)
+    elif fmt == "json":
+        data = [t.to_dict() for t in traces]
+    else:
+        raise ValueError(f"Unbekanntes Trace-Format: {fmt}")
+    return json.dumps(data, default=str)